@@ -0,0 +1,73 @@
+"""
+Throughput of BatchGameState.step compared with calling GameState.step for every game.
+
+Generates a set of adventure sized levels, copies them into batches of different size and plays random actions,
+printing time of a single step of the whole batch and number of game steps per second. Finished games are started
+again on a new level. Run from any directory:
+
+    python benchmarks/batch_steps.py [number of steps]
+"""
+import copy
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "maze_game"))
+
+from gameplay.batch_game_state import BatchGameState  # noqa: E402
+from gameplay.game_state import GameState, ACTIONS  # noqa: E402
+from gameplay.modules import LevelMap, Player  # noqa: E402
+from maze_generating_function.maze_generating_function import MazeGenerator  # noqa: E402
+
+BATCH_SIZES = (1_000, 10_000, 50_000)
+DISTINCT_LEVELS = 200
+
+
+def generate_levels(number_of_levels):
+    levels = []
+    for _ in range(number_of_levels):
+        maze = MazeGenerator(height=15, width=17)
+        maze.add_objects_batch({"interactive_block": 20, "coin": 9})
+        levels.append(LevelMap.from_generator(maze))
+    return levels
+
+
+def run_batch(levels, number_of_games, steps):
+    """
+    Returns seconds per batch step
+    """
+    batch = BatchGameState([levels[game % len(levels)] for game in range(number_of_games)])
+    actions = np.random.default_rng(0).integers(len(ACTIONS), size=(steps, number_of_games))
+    start = time.perf_counter()
+    for step_actions in actions:
+        batch.step(step_actions)
+        for game in np.flatnonzero(batch.finished).tolist():
+            batch.load_level(game, levels[game % len(levels)])
+    return (time.perf_counter() - start) / steps
+
+
+def run_loop(levels, number_of_games, steps):
+    """
+    Returns seconds per step of all games done with GameState in a python loop
+    """
+    states = [GameState(copy.deepcopy(levels[game % len(levels)]), Player("bot", 0, 0))
+              for game in range(number_of_games)]
+    actions = np.random.default_rng(0).integers(len(ACTIONS), size=(steps, number_of_games))
+    start = time.perf_counter()
+    for step_actions in actions:
+        for state, action in zip(states, step_actions.tolist()):
+            state.step(ACTIONS[action])
+    return (time.perf_counter() - start) / steps
+
+
+if __name__ == "__main__":
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    levels = generate_levels(DISTINCT_LEVELS)
+    print(f"{'games':>8}{'batch step [ms]':>18}{'game steps/s':>16}{'loop step [ms]':>17}{'game steps/s':>16}")
+    for number_of_games in BATCH_SIZES:
+        batch_time = run_batch(levels, number_of_games, steps)
+        loop_time = run_loop(levels, number_of_games, max(1, steps // 10))
+        print(f"{number_of_games:>8}{batch_time * 1000:>18.2f}{number_of_games / batch_time:>16,.0f}"
+              f"{loop_time * 1000:>17.2f}{number_of_games / loop_time:>16,.0f}")
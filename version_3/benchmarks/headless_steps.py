@@ -0,0 +1,54 @@
+"""
+Throughput of GameState.step run without display or audio device.
+
+Plays random actions on a generated adventure sized level and on a big generated level and prints the number of steps
+per second. A new level is loaded whenever the player goes through the exit. Run from any directory:
+
+    python benchmarks/headless_steps.py [number of steps]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "maze_game"))
+
+from gameplay.game_state import GameState, ACTIONS, EXIT  # noqa: E402
+from gameplay.modules import LevelMap, Player  # noqa: E402
+from maze_generating_function.maze_generating_function import MazeGenerator  # noqa: E402
+
+# (width, height, destructible blocks, coins) of benchmarked levels
+LEVELS = ((17, 15, 20, 9),
+          (201, 201, 2000, 400))
+
+
+def generate_level(width, height, destructible_blocks, coins):
+    maze = MazeGenerator(height=height, width=width)
+    maze.add_objects_batch({"interactive_block": destructible_blocks, "coin": coins})
+    return LevelMap.from_generator(maze)
+
+
+def run(steps, width, height, destructible_blocks, coins):
+    """
+    Returns steps per second and number of finished levels of random play
+    """
+    state = GameState(generate_level(width, height, destructible_blocks, coins), Player("bot", 0, 0))
+    actions = random.Random(0).choices(ACTIONS, k=steps)
+    finished = 0
+    step = state.step
+    start = time.perf_counter()
+    for action in actions:
+        events = step(action)
+        if events and events[-1][0] == EXIT:
+            finished = finished + 1
+            state.load_level(generate_level(width, height, destructible_blocks, coins))
+    elapsed = time.perf_counter() - start
+    return steps / elapsed, finished
+
+
+if __name__ == "__main__":
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{'level':<12}{'steps/s':>14}{'finished':>10}")
+    for level in LEVELS:
+        steps_per_second, finished = run(steps, *level)
+        print(f"{f'{level[0]}x{level[1]}':<12}{steps_per_second:>14,.0f}{finished:>10}")
@@ -0,0 +1,55 @@
+"""
+Import time report of the modules loaded before the main menu is shown.
+
+Imports GUI.GUI in a fresh interpreter started with python -X importtime and prints total import time together with
+the slowest top level packages. Heavy dependencies that should only be loaded on first use are listed separately, so
+it can be seen whether any of them is imported at startup. Run from any directory:
+
+    python benchmarks/import_time.py [number of runs]
+"""
+import os
+import subprocess
+import sys
+
+MAZE_GAME_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "maze_game")
+
+# modules of the game and its dependencies that aren't needed to show the main menu, numpy isn't listed as some
+# pygame versions import it on their own
+LAZY_MODULES = ("gameplay", "maze_generating_function")
+
+
+def import_times(module: str = "GUI.GUI"):
+    """
+    Imports module in a new interpreter and returns total import time and the cumulative import time of every
+    imported package, both in microseconds
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=MAZE_GAME_DIRECTORY,
+                            capture_output=True,
+                            text=True,
+                            check=True)
+    total = 0
+    packages = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # nested imports are indented, only outermost ones count towards total
+        if not name[1:].startswith(" "):
+            total = total + int(cumulative)
+        package = name.strip().split(".")[0]
+        if package != module.split(".")[0]:
+            packages[package] = max(packages.get(package, 0), int(cumulative))
+    return total, packages
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    # the fastest of several runs is reported, first run also warms up the disk cache
+    total, packages = min((import_times() for _ in range(runs)), key=lambda times: times[0])
+    print(f"import GUI.GUI: {total / 1000:.1f} ms (best of {runs})")
+    print("slowest packages:")
+    for name, cumulative in sorted(packages.items(), key=lambda item: -item[1])[:10]:
+        print(f"    {name:<40}{cumulative / 1000:>8.1f} ms")
+    loaded = [name for name in LAZY_MODULES if name in packages]
+    print("lazy dependencies imported at startup:", ", ".join(loaded) if loaded else "none")
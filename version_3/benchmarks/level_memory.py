@@ -0,0 +1,71 @@
+"""
+Memory benchmark of a 201x201 level loaded with LevelMap.load_from_file.
+
+Compares the current LevelMap, which stores blocks in uint8 grids, with LevelMap it replaced, which stored one
+BuildingBlock object per block. The previous LevelMap is loaded from version_2 of the game, which has the same level
+loader as the game had before blocks were stored in grids. Run from any directory:
+
+    python benchmarks/level_memory.py
+"""
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+sys.path.insert(0, os.path.join(ROOT, "version_3", "maze_game"))
+
+from gameplay.modules import LevelMap  # noqa: E402
+from maze_generating_function.maze_generating_function import MazeGenerator  # noqa: E402
+
+LEVEL_SIZE = 201
+
+
+def load_module(name, path):
+    """
+    Loads module from given file under given name, so it doesn't replace the module of the current game
+    """
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_level_map(level_map_class, path):
+    level = level_map_class()
+    level.load_from_file(path)
+    return level
+
+
+def measure(function, *args):
+    """
+    Returns memory in bytes kept alive by result of the function and time of the call in seconds
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return memory, elapsed
+
+
+if __name__ == "__main__":
+    per_block = load_module("per_block_modules", os.path.join(ROOT, "version_2", "maze_game", "gameplay", "modules.py"))
+    maze = MazeGenerator(height=LEVEL_SIZE, width=LEVEL_SIZE)
+    maze.add_objects_batch({"interactive_block": 500, "coin": 100})
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "level.txt")
+        with open(path, "w") as level_file:
+            level_file.write(f"{LEVEL_SIZE},{LEVEL_SIZE}\n")
+            level_file.writelines("".join(row) + "\n" for row in maze.level_map)
+
+        print(f"{LEVEL_SIZE}x{LEVEL_SIZE} level")
+        print(f"{'LevelMap':<28}{'memory [MB]':>12}{'load [ms]':>12}")
+        for name, level_map_class in (("BuildingBlock per block", per_block.LevelMap),
+                                      ("uint8 grids", LevelMap)):
+            memory, elapsed = measure(load_level_map, level_map_class, path)
+            print(f"{name:<28}{memory / 2 ** 20:>12.2f}{elapsed * 1000:>12.1f}")
@@ -0,0 +1,36 @@
+"""
+Time of carving mazes of growing size with every algorithm of maze_generating_function.maze_carving module.
+
+For every size prints the best time out of REPEATS carvings of a maze with given number of blocks on a side, maze has
+half as many maze cells on a side. Run from any directory:
+
+    python benchmarks/maze_carving.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "maze_game"))
+
+from maze_generating_function.maze_carving import ALGORITHMS  # noqa: E402
+
+# number of blocks on a side of benchmarked mazes
+SIZES = (51, 201, 1001)
+REPEATS = 3
+
+
+if __name__ == "__main__":
+    print(f"{'algorithm':<24}" + "".join(f"{f'{size}x{size} [s]':>16}" for size in SIZES))
+    for name, algorithm in ALGORITHMS.items():
+        times = []
+        for size in SIZES:
+            best = float("inf")
+            for seed in range(REPEATS):
+                rng = np.random.default_rng(seed)
+                start = time.perf_counter()
+                algorithm(size // 2, size // 2, rng)
+                best = min(best, time.perf_counter() - start)
+            times.append(best)
+        print(f"{name:<24}" + "".join(f"{seconds:>16.3f}" for seconds in times))
@@ -0,0 +1,45 @@
+"""
+Time of solving generated levels of growing size with the gameplay.solver module.
+
+For every size prints time of a distance field from the player starting position, of A* path to the exit and of
+coins-then-exit route, all with digging allowed so that every coin can be reached. Run from any directory:
+
+    python benchmarks/solver.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "maze_game"))
+
+from gameplay.modules import LevelMap  # noqa: E402
+from gameplay.solver import distance_field, shortest_path, plan_route  # noqa: E402
+from maze_generating_function.maze_generating_function import MazeGenerator  # noqa: E402
+
+# (size, destructible blocks, coins) of benchmarked levels
+LEVELS = ((17, 20, 9),
+          (51, 99, 9),
+          (201, 500, 10),
+          (1001, 2000, 10))
+DIG_COST = 2
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'level':<12}{'field [ms]':>12}{'A* [ms]':>12}{'route [ms]':>12}{'route moves':>13}")
+    for size, destructible_blocks, coins in LEVELS:
+        maze = MazeGenerator(height=size, width=size)
+        maze.add_objects_batch({"interactive_block": destructible_blocks, "coin": coins})
+        level = LevelMap.from_generator(maze)
+        start = (level.player_starting_coordinate_x, level.player_starting_coordinate_y)
+
+        _, field_time = timed(distance_field, level, dig_cost=DIG_COST)
+        _, path_time = timed(shortest_path, level, start, level.exit_coordinate, dig_cost=DIG_COST)
+        (_, moves), route_time = timed(plan_route, level, dig_cost=DIG_COST)
+        print(f"{f'{level.x_size}x{level.y_size}':<12}{field_time * 1000:>12.1f}{path_time * 1000:>12.1f}"
+              f"{route_time * 1000:>12.1f}{moves:>13}")
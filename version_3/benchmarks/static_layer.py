@@ -0,0 +1,46 @@
+"""
+Number of canvas items and time of rendering static layer of generated levels that fit in the screen.
+
+For every level prints number of canvas items needed to draw every block separately, number of items drawn on top of
+static layer, i.e. coins, destructible blocks and exit, and time of rendering static layer with
+gameplay.modules.render_static_layer. Run from any directory:
+
+    python benchmarks/static_layer.py
+"""
+import os
+import sys
+import time
+
+MAZE_GAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "maze_game")
+sys.path.insert(0, MAZE_GAME)
+# sprites are read relative to working directory, like in the game
+os.chdir(MAZE_GAME)
+
+from gameplay.modules import LevelMap, STATIC_LOOKUP, render_static_layer  # noqa: E402
+from maze_generating_function.maze_generating_function import MazeGenerator  # noqa: E402
+
+# (width, height, destructible blocks, coins) of benchmarked levels
+LEVELS = ((17, 15, 20, 9),
+          (25, 21, 40, 9),
+          (51, 27, 99, 9))
+SCREEN = (1280, 640)
+REPEATS = 20
+
+
+if __name__ == "__main__":
+    print(f"{'level':<12}{'block':>7}{'all items':>11}{'dynamic':>9}{'render [ms]':>13}")
+    for width, height, destructible_blocks, coins in LEVELS:
+        maze = MazeGenerator(height=height, width=width, seed=0)
+        maze.add_objects_batch({"interactive_block": destructible_blocks, "coin": coins})
+        level = LevelMap.from_generator(maze)
+        block_size = min(SCREEN[0] // level.x_size, SCREEN[1] // level.y_size)
+
+        render_static_layer(level, block_size)
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            render_static_layer(level, block_size)
+        render_time = (time.perf_counter() - start) / REPEATS
+
+        dynamic = int((~STATIC_LOOKUP[level.cells]).sum())
+        print(f"{f'{level.x_size}x{level.y_size}':<12}{block_size:>7}{level.x_size * level.y_size:>11}{dynamic:>9}"
+              f"{render_time * 1000:>13.2f}")
@@ -1,15 +1,14 @@
 import tkinter as tk
 import time
-from gameplay.modules import Player, LevelMap
 import os
 from os import listdir
-from os.path import isfile, join
+from os.path import join
 from PIL import Image, ImageTk
-from maze_generating_function.maze_generating_function import MazeGenerator
-import shutil
-import pandas as pd
-from datetime import datetime
 import pygame
+from leaderboard.leaderboard_store import LeaderboardStore
+
+# gameplay, maze generation and datetime are imported on first use inside methods that need them, so they aren't
+# loaded before the main menu is shown
 
 # Constant variables
 # latin alphabet is a set of possible characters in players name that have image in graphics directory
@@ -29,6 +28,39 @@ DESTRUCTIBLE_BLOCKS = 20
 # Level width and height for adventure mode
 LEVEL_WIDTH = 17
 LEVEL_HEIGHT = 15
+# Actions of the game state triggered by keys
+KEY_ACTIONS = {"a": "left",
+               "d": "right",
+               "w": "up",
+               "s": "down",
+               "e": "dig"}
+# Algorithm used to carve generated mazes, one of ALGORITHMS from maze_carving module
+MAZE_ALGORITHM = "recursive_backtracker"
+# Bounds of par of generated levels, which is the number of actions of the shortest route through all coins to the
+# exit, the upper bound lets a player making PAR_STEPS_PER_SECOND actions per second finish a level in TIME_LIMIT
+PAR_STEPS_PER_SECOND = 2
+MIN_PAR_STEPS = 0
+MAX_PAR_STEPS = TIME_LIMIT * PAR_STEPS_PER_SECOND
+# Number of mazes generated before a level with par out of bounds is accepted
+GENERATION_ATTEMPTS = 5
+# If True, levels generated in adventure mode are stored in LevelCache in resources/levels/cache, up to
+# LEVEL_CACHE_BYTES, so levels played again from their seeds are read from disk. Otherwise levels are saved to disk only
+# from level generator and replayed levels are generated again from their seeds
+CACHE_GENERATED_LEVELS = False
+# Storage of finished runs, "csv" keeps only best scores in leaderboard.csv, "sqlite" additionally records every run
+# in runs.sqlite3 and shows leaderboard from it
+LEADERBOARD_BACKEND = "csv"
+
+# Levels which would be drawn with blocks smaller than MIN_BLOCK_SIZE to fit in the screen are played with a camera
+# following the player, blocks have CAMERA_BLOCK_SIZE and only blocks in the screen and CAMERA_MARGIN blocks around it
+# are drawn
+MIN_BLOCK_SIZE = 24
+CAMERA_BLOCK_SIZE = 48
+CAMERA_MARGIN = 2
+# Height in pixels added to the player name window in solo mode for the searchable list of levels
+LEVEL_LIST_HEIGHT = 150
+# Choice of the leaderboard showing runs of all levels when it is shown from the run history
+ALL_LEVELS = "All levels"
 
 # Level Generation settings
 GEN_LEVEL_INITIAL_VALUES = {"width": 13,
@@ -54,6 +86,74 @@ def validate(P):
         return False
 
 
+class ImageRetainer(dict):
+    """
+    This class stores images displayed on a canvas. Tkinter doesn't keep references to images used by canvas items,
+    so images have to be stored to prevent them from being deleted by garbage collector. Images of canvas items are
+    stored under canvas item id, so only images of items that are still on canvas are kept.
+
+    # Methods
+    ___________
+    release(*items)
+        removes images of canvas items that were deleted from canvas
+    """
+    def release(self,
+                *items):
+        """
+        Removes images of given canvas items. Should be called every time canvas items are deleted.
+
+        # Parameters
+        ____________
+        :param items: int
+            ids of canvas items that were deleted from canvas
+        """
+        for item in items:
+            self.pop(item, None)
+
+
+class SoundBank:
+    """
+    This class loads all sound effects from resources/sounds directory once, so they are not read from disk and decoded
+    every time they are played.
+
+    # Attributes
+    ___________
+    sounds: dict
+        Dictionary of pygame sounds by file name without extension
+
+    # Methods
+    ___________
+    play(name: str, channel: int)
+        plays sound effect on given mixer channel
+    """
+    def __init__(self,
+                 path: str = None):
+        """
+        # Parameters
+        ____________
+        :param path: str, default = None
+            Path to directory with .wav sound effects, resources/sounds directory if not given
+        """
+        path = path or f"{os.getcwd()}/../resources/sounds"
+        self.sounds = {f[:-len(".wav")]: pygame.mixer.Sound(join(path, f))
+                       for f in listdir(path) if f.endswith(".wav")}
+
+    def play(self,
+             name: str,
+             channel: int = 0):
+        """
+        Plays preloaded sound effect on given mixer channel.
+
+        # Parameters
+        ____________
+        :param name: str
+            Name of sound effect file without extension e.g. "button"
+        :param channel: int, default = 0
+            Number of pygame mixer channel the sound is played on
+        """
+        pygame.mixer.Channel(channel).play(self.sounds[name])
+
+
 class App(tk.Tk):
     """
     This abstract class runs the application. It is a tkinter object and therefore inherits from tk.Tk.
@@ -66,6 +166,12 @@ class App(tk.Tk):
         Height of the tkinter application
     container: tk.Frame
         A tkinter frame
+    sounds: SoundBank
+        Sound effects used by the game
+    leaderboard: LeaderboardStore
+        Best scores of players
+    run_history: RunHistory
+        History of all finished runs, None unless LEADERBOARD_BACKEND is "sqlite"
 
     # Methods
     ___________
@@ -76,6 +182,12 @@ class App(tk.Tk):
         super().__init__()
 
         pygame.mixer.init()
+        self.sounds = SoundBank()
+        self.leaderboard = LeaderboardStore()
+        self.run_history = None
+        if LEADERBOARD_BACKEND == "sqlite":
+            from leaderboard.run_history import RunHistory
+            self.run_history = RunHistory()
 
         # Setting window configs
         self.width = 1280
@@ -104,7 +216,9 @@ class App(tk.Tk):
     def show_frame(self,
                    new_page,
                    level_name=None,
-                   player_name=None):
+                   player_name=None,
+                   endless=False,
+                   seeds=None):
         """
         Method to display specific tkinter frame
 
@@ -116,16 +230,21 @@ class App(tk.Tk):
             When displaying GameScreen, carries the name of the level file to be loaded if playing solo mode
         :param player_name: string
             When displaying GameScreen, carries the player name for the leaderboard
+        :param endless: bool
+            When displaying GameScreen, tells if endless maze is played instead of adventure mode
+        :param seeds: list
+            When displaying GameScreen, carries seeds of generated levels if a run is played again
         """
         if new_page.__name__ == "GameScreen":
             # Initializing game with given level and player name
-            tab = new_page(parent=self.container, controller=self, level_name=level_name, player_name=player_name)
+            tab = new_page(parent=self.container, controller=self, level_name=level_name, player_name=player_name,
+                           endless=endless, seeds=seeds)
         else:
             tab = new_page(parent=self.container, controller=self)
 
-        # Removing currently shown tab
+        # Removing currently shown tab, it is destroyed so its canvas items and images are freed
         if self.current_tab:
-            self.current_tab.grid_remove()
+            self.current_tab.destroy()
 
         # Displaying desired tab
         self.current_tab = tab
@@ -197,9 +316,7 @@ class GameMenu(tk.Canvas):
                                image_path=f"{os.getcwd()}/../resources/graphics/buttons/{button_name}.png",
                                command=lambda: [(quit() if function == "quit" else
                                                  self.controller.show_frame(function)),
-                                                pygame.mixer.Channel(0).play(
-                                                    pygame.mixer.Sound(
-                                                        f"{os.getcwd()}/../resources/sounds/button.wav"))])
+                                                self.controller.sounds.play("button")])
         self.create_window(x, y, window=button1)
 
 
@@ -213,7 +330,7 @@ class GameScreen(tk.Canvas):
         Refers back to the app class for control and interactions between tkinter widgets
     buffer: Buffer class
         Buffer that stores information about currently played level
-    images: dict
+    images: ImageRetainer
         Dictionary of images displayed during some specific events
 
     # Methods
@@ -226,12 +343,16 @@ class GameScreen(tk.Canvas):
         manages player keyboard inputs
     end_of_game()
         displays the end of the game
+    destroy()
+        stops the timer and destroys the game screen
     """
     def __init__(self,
                  parent,
                  controller,
                  level_name=None,
-                 player_name=None):
+                 player_name=None,
+                 endless=False,
+                 seeds=None):
         """
         # Parameters
         ____________
@@ -243,16 +364,22 @@ class GameScreen(tk.Canvas):
             Carries the name of the level file to be loaded if playing solo mode
         :param player_name: string
             Carries the player name for the leaderboard
+        :param endless: bool
+            Tells if endless maze is played instead of adventure mode
+        :param seeds: list
+            Carries seeds of generated levels if a run is played again
         """
         self.controller = controller
-        self.images = {}
+        self.images = ImageRetainer()
 
         tk.Canvas.__init__(self, parent, width=controller.width, height=controller.height, bg='black')
 
         player_name = "unknw" if player_name == "" else player_name
         self.buffer = Buffer(self,
                              level_name,
-                             player_name)
+                             player_name,
+                             seeds=seeds,
+                             endless=endless)
 
         exit_button = CustomButton(master=self,
                                    image_path=f"{os.getcwd()}/../resources/graphics/buttons/go_back_button.png",
@@ -261,8 +388,7 @@ class GameScreen(tk.Canvas):
                                                         f"{os.getcwd()}/../resources/sounds/menu_ost.wav"),
                                                     pygame.mixer.music.set_volume(1),
                                                     pygame.mixer.music.play(loops=-1),
-                                                    pygame.mixer.Channel(0).play(pygame.mixer.Sound(
-                                                        f"{os.getcwd()}/../resources/sounds/button.wav"))])
+                                                    controller.sounds.play("button")])
 
         self.create_window(PADDING_X, INFO_PANEL_SIZE / 2, window=exit_button)
 
@@ -321,20 +447,21 @@ class GameScreen(tk.Canvas):
                 self.end_of_game()
 
                 timer.configure(text="Remaining time: 0")
-                pygame.mixer.Channel(0).play(pygame.mixer.Sound(f"{os.getcwd()}/../resources/sounds/victory.wav"))
+                self.controller.sounds.play("victory")
                 return 0
 
             timer.configure(text="Remaining time: "+str(TIME_LIMIT - int(elapsed_time)))
-            self.after(ms=1000, func=self.update_timer)
+            self.timer_job = self.after(ms=1000, func=self.update_timer)
         else:
             start_time = time.time() - elapsed_time
-            self.after(ms=1000, func=self.update_timer)
+            self.timer_job = self.after(ms=1000, func=self.update_timer)
 
     def action(self,
                event=None):
         """
         This method manages player input and related actions, mainly player movements, block destruction
-        and pause button. It also checks whether the exit has been reached after each movement input.
+        and pause button. Movements and block destruction are applied by game state of the buffer, which lets the
+        buffer know if the exit has been reached.
         # Parameters
         :param event:
             player keyboard input
@@ -344,24 +471,21 @@ class GameScreen(tk.Canvas):
             if event.char == "p":
                 self.pause()
         else:
-            if event.char == "a":
-                self.buffer.player.move(move_x=-1, move_y=0, buffer=self.buffer)
-            elif event.char == "d":
-                self.buffer.player.move(move_x=1, move_y=0, buffer=self.buffer)
-            elif event.char == "w":
-                self.buffer.player.move(move_x=0, move_y=-1, buffer=self.buffer)
-            elif event.char == "s":
-                self.buffer.player.move(move_x=0, move_y=1, buffer=self.buffer)
-            elif event.char == "e":
-                self.buffer.player.destroy_block(buffer=self.buffer)
+            if event.char in KEY_ACTIONS:
+                self.buffer.state.step(KEY_ACTIONS[event.char])
             elif event.char == "p":
                 self.pause()
 
         self.buffer.apply_changes()
 
-        # Check if after movement player found an exit
-        if event.char in ["a", "d", "w", "s"]:
-            self.buffer.check_if_next_level()
+    def destroy(self):
+        """
+        This method stops the timer and background level generation before game screen is destroyed, so they don't
+        work for a screen that no longer exists.
+        """
+        self.after_cancel(self.timer_job)
+        self.buffer.close()
+        tk.Canvas.destroy(self)
 
     def end_of_game(self):
         """
@@ -381,8 +505,7 @@ class GameScreen(tk.Canvas):
                                                         pygame.mixer.music.load(f"{os.getcwd()}/../resources/sounds/menu_ost.wav"),
                                                         pygame.mixer.music.set_volume(1),
                                                         pygame.mixer.music.play(loops=-1),
-                                                        pygame.mixer.Channel(0).play(
-                                                            pygame.mixer.Sound(f"{os.getcwd()}/../resources/sounds/button.wav"))])
+                                                        self.controller.sounds.play("button")])
 
         self.create_window(640, 540, window=go_back_to_menu)
         # Losing focus on Game Screen so player can't move
@@ -407,7 +530,7 @@ class ModeChooser(tk.Canvas):
     ___________
     controller: App class
         Refers back to the app class for control and interactions between tkinter widgets
-    images: dict
+    images: ImageRetainer
         Dictionary of images displayed during some specific events
 
     # Methods
@@ -427,7 +550,7 @@ class ModeChooser(tk.Canvas):
             Refers back to the app class for control and interactions between tkinter widgets
         """
         self.controller = controller
-        self.images = {}
+        self.images = ImageRetainer()
         tk.Canvas.__init__(self, parent, width=controller.width, height=controller.height)
 
         # Creating button for adventure mode
@@ -484,30 +607,67 @@ class ModeChooser(tk.Canvas):
         ent = tk.Entry(tmp_canvas, validate="key", validatecommand=vcmd, textvariable=player_name)
         tmp_canvas.create_window(100, 52, anchor="n", window=ent)
 
-        # If solo mode is clicked, adding option to choose level
+        # If solo mode is clicked, adding option to choose level, window is higher to fit the list of levels
+        offset = 0
         if mode:
+            offset = LEVEL_LIST_HEIGHT
+            new_window.geometry(f"200x{300 + offset}")
+            tmp_canvas.configure(height=300 + offset)
             choose_level_img = tk.PhotoImage(file=f"{os.getcwd()}/../resources/graphics/texts/choose_level.png")
             # to prevent the image from being deleted by garbage collector we save it in dict.
             self.images["choose_level_img"] = choose_level_img
             tmp_canvas.create_image(100, 72, image=self.images["choose_level_img"], anchor="n")
 
-            my_path = f"{os.getcwd()}/../resources/levels/"
-            files_name = [f.replace('.txt', '') for f in listdir(my_path) if isfile(join(my_path, f))]
-
-            # Setting default option of level
-            lvl = tk.StringVar(new_window)
-            lvl.set(files_name[0])
-            lvl_menu = tk.OptionMenu(tmp_canvas, lvl, *files_name)
-            tmp_canvas.create_window(100, 124, anchor="n", window=lvl_menu)
+            # levels are listed from level files and level packs, only levels matching searched text are shown
+            from gameplay.level_pack import LevelCatalogue
+            catalogue = LevelCatalogue()
+            search_text = tk.StringVar()
+            search_entry = tk.Entry(tmp_canvas, textvariable=search_text)
+            tmp_canvas.create_window(100, 124, anchor="n", window=search_entry)
+            level_list = tk.Listbox(tmp_canvas, height=7, width=22, exportselection=False)
+            tmp_canvas.create_window(100, 148, anchor="n", window=level_list)
+
+            def show_levels(*args):
+                level_list.delete(0, tk.END)
+                level_list.insert(tk.END, *catalogue.search(search_text.get()))
+                level_list.selection_set(0)
+
+            search_text.trace_add("write", show_levels)
+            show_levels()
+        else:
+            # adventure mode can be played in one endless maze instead of consecutive levels
+            endless = tk.BooleanVar(new_window)
+            endless_button = tk.Checkbutton(tmp_canvas, text="Endless maze", variable=endless, fg="white",
+                                            bg="black", selectcolor="black", activebackground="black")
+            tmp_canvas.create_window(100, 110, anchor="n", window=endless_button)
+
+            # seeds of generated levels are kept in run history, so the last run of a player can be played again
+            replay = tk.BooleanVar(new_window)
+            if self.controller.run_history is not None:
+                replay_button = tk.Checkbutton(tmp_canvas, text="Replay last run", variable=replay, fg="white",
+                                               bg="black", selectcolor="black", activebackground="black")
+                tmp_canvas.create_window(100, 138, anchor="n", window=replay_button)
+
+        def start_chosen_game():
+            selection = level_list.curselection() if mode else ()
+            if mode and not level_list.size():
+                return
+            seeds = None
+            if not mode and replay.get():
+                seeds = self.controller.run_history.last_seeds(player_name.get() or "unknw",
+                                                               "endless" if endless.get() else "adventure")
+            self.controller.show_frame(GameScreen,
+                                       level_name=level_list.get(selection[0] if selection else 0) if mode else None,
+                                       player_name=player_name.get(),
+                                       endless=not mode and endless.get(),
+                                       seeds=seeds)
+            new_window.destroy()
 
         # Creating Start Game Button
         start_game = CustomButton(master=tmp_canvas,
                                   image_path=f"{os.getcwd()}/../resources/graphics/buttons/start_game_button.png",
-                                  command=lambda: [self.controller.show_frame(GameScreen,
-                                                                              level_name=lvl.get() if mode else None,
-                                                                              player_name=player_name.get()),
-                                                   new_window.destroy()])
-        tmp_canvas.create_window(100, 174,
+                                  command=start_chosen_game)
+        tmp_canvas.create_window(100, 174 + offset,
                                  anchor="n",
                                  window=start_game)
 
@@ -515,9 +675,8 @@ class ModeChooser(tk.Canvas):
         close_button = CustomButton(master=tmp_canvas,
                                     image_path=f"{os.getcwd()}/../resources/graphics/buttons/exit_button.png",
                                     command=lambda: [new_window.destroy(),
-                                                     pygame.mixer.Channel(0).play(pygame.mixer.Sound(
-                                                       f"{os.getcwd()}/../resources/sounds/button.wav"))])
-        tmp_canvas.create_window(100, 224,
+                                                     self.controller.sounds.play("button")])
+        tmp_canvas.create_window(100, 224 + offset,
                                  anchor="n",
                                  window=close_button)
 
@@ -531,7 +690,7 @@ class LevelGenerator(tk.Canvas):
     ___________
     controller: App class
         Refers back to the app class for control and interactions between tkinter widgets
-    images: dict
+    images: ImageRetainer
         Dictionary of images displayed during some specific events
     canvas_origin: tuple
         Coordinates of the origin of the canvas
@@ -543,6 +702,8 @@ class LevelGenerator(tk.Canvas):
         Dictionary containing increment steps for when clicking on the arrows to modify a setting value
     limit_values: dict
         Dictionary containing limit values on the setting values
+    number_items: dict
+        Dictionary containing ids of canvas items displaying setting values
 
     # Methods
     ___________
@@ -568,7 +729,8 @@ class LevelGenerator(tk.Canvas):
         """
         tk.Canvas.__init__(self, parent, width=controller.width, height=controller.height, bg='black')
         self.controller = controller
-        self.images = {}
+        self.images = ImageRetainer()
+        self.number_items = {}
 
         self.current_values = GEN_LEVEL_INITIAL_VALUES
         self.increments = GEN_LEVEL_INCREMENTS
@@ -590,8 +752,8 @@ class LevelGenerator(tk.Canvas):
         # Adding generate level button
         generate_lvl_button = CustomButton(master=self,
                                            image_path=f"{os.getcwd()}/../resources/graphics/buttons/generate_button.png",
-                                           command=lambda: [self.generate_and_display(), pygame.mixer.Channel(0).play(
-                                               pygame.mixer.Sound(f"{os.getcwd()}/../resources/sounds/button.wav"))])
+                                           command=lambda: [self.generate_and_display(),
+                                                            self.controller.sounds.play("button")])
         self.create_window(PADDING_X,
                            75 + (i + 1) * (51 + self.space_between_buttons),
                            anchor="nw",
@@ -600,8 +762,7 @@ class LevelGenerator(tk.Canvas):
         # Adding save level button
         save_button = CustomButton(master=self,
                                    image_path=f"{os.getcwd()}/../resources/graphics/buttons/save_button.png",
-                                   command=lambda: [self.save(), pygame.mixer.Channel(0).play(
-                                       pygame.mixer.Sound(f"{os.getcwd()}/../resources/sounds/button.wav"))])
+                                   command=lambda: [self.save(), self.controller.sounds.play("button")])
         self.create_window(PADDING_X,
                            75 + (i + 2) * (51 + self.space_between_buttons),
                            anchor="nw",
@@ -616,17 +777,15 @@ class LevelGenerator(tk.Canvas):
                              coins=self.current_values["number_of_coins"])
         self.buffer.draw_everything()
 
-    @staticmethod
-    def save():
+    def save(self):
         """
-        Method to save the generated level in a file.
-        A static method is used here because it does not depend on the object.
+        Method to save the currently displayed generated level in a file.
         """
+        from datetime import datetime
+
         now = datetime.now()
-        level_name = "gen_lvl_" + now.strftime("%d_%m_%Y_%H_%M_%S") + ".txt"
-        src = str(os.getcwd()) + r"\..\resources\levels\tmp.txt"
-        dst = str(os.getcwd()) + fr"\..\resources\levels\{level_name}"
-        shutil.copyfile(src, dst)
+        level_name = "gen_lvl_" + now.strftime("%d_%m_%Y_%H_%M_%S")
+        self.buffer.maze.save_to_file(level_name)
 
     def add_option(self,
                    x: int,
@@ -660,8 +819,7 @@ class LevelGenerator(tk.Canvas):
                                                                     by=increment_step,
                                                                     x=x,
                                                                     y=y),
-                                                        pygame.mixer.Channel(0).play(
-                                                pygame.mixer.Sound(f"{os.getcwd()}/../resources/sounds/button.wav"))])
+                                                        self.controller.sounds.play("button")])
         self.create_window(x + 154,
                            y,
                            anchor="nw",
@@ -671,8 +829,7 @@ class LevelGenerator(tk.Canvas):
                                        image_path=f"{os.getcwd()}/../resources/graphics/buttons/decrease_button.png",
                                        command=lambda: [
                                            self.change(button_name=text_name, by=-increment_step, x=x, y=y),
-                                           pygame.mixer.Channel(0).play(
-                                               pygame.mixer.Sound(f"{os.getcwd()}/../resources/sounds/button.wav"))])
+                                           self.controller.sounds.play("button")])
         self.create_window(x + 154,
                            y + 25,
                            anchor="nw",
@@ -707,11 +864,18 @@ class LevelGenerator(tk.Canvas):
         unity = number_str[1]
         n1 = tk.PhotoImage(file=f"{os.getcwd()}/../resources/graphics/numbers/{dec}.png")
         n2 = tk.PhotoImage(file=f"{os.getcwd()}/../resources/graphics/numbers/{unity}.png")
-        # to prevent the image from being deleted by garbage collector we save it in dict..
-        self.images[option_name + "_n1"] = n1
-        self.images[option_name + "_n2"] = n2
-        self.create_image(x + 100, y, image=self.images[option_name + "_n1"], anchor="nw")
-        self.create_image(x + 127, y, image=self.images[option_name + "_n2"], anchor="nw")
+
+        # numbers are drawn once per option, afterwards only their images are swapped
+        if option_name not in self.number_items:
+            self.number_items[option_name] = (self.create_image(x + 100, y, image=n1, anchor="nw"),
+                                              self.create_image(x + 127, y, image=n2, anchor="nw"))
+        else:
+            self.itemconfigure(self.number_items[option_name][0], image=n1)
+            self.itemconfigure(self.number_items[option_name][1], image=n2)
+
+        # to prevent the image from being deleted by garbage collector we save it in dict.
+        self.images[self.number_items[option_name][0]] = n1
+        self.images[self.number_items[option_name][1]] = n2
 
     def change(self,
                button_name: str,
@@ -749,12 +913,7 @@ class LevelGenerator(tk.Canvas):
         Method used to call the maze generating function with current settings and generate level.
         Level is also drawn and displayed on the side of the screen.
         """
-        # Resetting Display
-        self.create_rectangle((LEFT_PANEL_SIZE, 0, self.controller.width, self.controller.height),
-                              fill="black",
-                              width=0)
-
-        # send request to buffer to generate level and draw it
+        # send request to buffer to generate level and draw it, previous level is removed from canvas by buffer
         self.buffer.generate_level(level_width=self.current_values["width"],
                                    level_height=self.current_values["height"],
                                    destructible_blocks=self.current_values["number_of_obstacles"],
@@ -771,11 +930,21 @@ class Leaderboard(tk.Canvas):
     ___________
     controller: App class
         Refers back to the app class for control and interactions between tkinter widgets
-    images: dict
+    images: ImageRetainer
         Dictionary of images displayed during some specific events
+    level: tk.StringVar
+        Level whose runs are shown, ALL_LEVELS for runs of all levels, None unless leaderboard is shown from the run
+        history
+    player_name: tk.StringVar
+        Name of a player whose personal best is shown, None unless leaderboard is shown from the run history
+    personal_best: tk.Label
+        Label with personal best of the player on the chosen level, None unless leaderboard is shown from the run
+        history
 
     # Methods
     ___________
+    show_runs()
+        Draws best scores of the chosen level and personal best of the entered player
     draw_position(position: int, y:int)
         Draws the ranking position of the player in the leaderboard
     draw_name(position: int, name: str, y:int
@@ -799,19 +968,56 @@ class Leaderboard(tk.Canvas):
                                                                                            controller.height),
                                                                                           Image.ANTIALIAS))
         self.create_image(0, 0, anchor="nw", image=bg)
-        self.images = {"bg": bg}
+        self.images = ImageRetainer(bg=bg)
         self.controller = controller
 
         # Creating exit button
         CustomButton.exit_button(self)
 
-        # Loading and displaying leaderboard
-        leaderboard = pd.read_csv(f"{os.getcwd()}/../resources/leaderboard/leaderboard.csv", header=None)
-        for position, row in leaderboard.iterrows():
+        # Leaderboard shown from the run history can be limited to a single level and shows personal best of a player
+        self.level = self.player_name = self.personal_best = None
+        if controller.run_history is not None:
+            self.level = tk.StringVar(self, ALL_LEVELS)
+            level_menu = tk.OptionMenu(self, self.level, ALL_LEVELS, *controller.run_history.levels(),
+                                       command=lambda _: self.show_runs())
+            level_menu.configure(width=14, fg="white", bg="black", activebackground="black", highlightthickness=0)
+            self.create_window(20, 175, anchor="nw", window=level_menu)
+
+            self.player_name = tk.StringVar(self)
+            vcmd = (self.register(validate), '%P')
+            name_entry = tk.Entry(self, validate="key", validatecommand=vcmd, textvariable=self.player_name, width=16)
+            self.create_window(20, 235, anchor="nw", window=name_entry)
+            self.personal_best = tk.Label(self, fg="white", bg="black")
+            self.create_window(20, 265, anchor="nw", window=self.personal_best)
+            self.player_name.trace_add("write", lambda *args: self.show_runs())
+
+        self.show_runs()
+
+    def show_runs(self):
+        """
+        Method to draw the best scores on the Leaderboard canvas, replacing scores drawn before. If leaderboard is
+        shown from the run history, only runs of the chosen level are drawn and personal best of the entered player
+        is shown.
+        """
+        # images of deleted scores are released with their canvas items
+        old_items = self.find_withtag("runs")
+        if old_items:
+            self.delete(*old_items)
+            self.images.release(*old_items)
+        run_history = self.controller.run_history
+        if run_history is not None:
+            level = None if self.level.get() == ALL_LEVELS else self.level.get()
+            best_scores = run_history.top_runs(level=level, limit=self.controller.leaderboard.size)
+            best = run_history.personal_best(self.player_name.get(), level) if self.player_name.get() else None
+            self.personal_best.configure(text=f"Personal best: {'-' if best is None else best}")
+        else:
+            best_scores = self.controller.leaderboard.top()
+
+        for position, (name, score) in enumerate(best_scores):
             y = 7 * 25 + 60 * position
             self.draw_position(position=position + 1, y=y)
-            self.draw_name(position=position + 1, name=row[0], y=y)
-            self.draw_score(position=position + 1, score=row[1], y=y)
+            self.draw_name(position=position + 1, name=name, y=y)
+            self.draw_score(position=position + 1, score=score, y=y)
 
     def draw_position(self,
                       position: int,
@@ -827,9 +1033,9 @@ class Leaderboard(tk.Canvas):
             Y coordinate to position player score on canvas
         """
         image = tk.PhotoImage(file=f"{os.getcwd()}/../resources/graphics/numbers/{str(position)}.png")
-        # to prevent the image from being deleted by garbage collector we save it in dict.
-        self.images[position] = image
-        self.create_image(250, y, image=self.images[position], anchor="nw")
+        item = self.create_image(250, y, image=image, anchor="nw", tags="runs")
+        # to prevent the image from being deleted by garbage collector save it in dict under canvas item id.
+        self.images[item] = image
 
     def draw_name(self,
                   position: int,
@@ -847,14 +1053,14 @@ class Leaderboard(tk.Canvas):
         :param y: int,
             Y coordinate to position player score on canvas
         """
+        from gameplay.modules import SPRITE_CACHE
+
         name = name.lower()
         for i, char in enumerate(name):
-            image = ImageTk.PhotoImage(
-                Image.open(f"{os.getcwd()}/../resources/graphics/characters/{char}.png").resize((51, 51),
-                                                                                                Image.ANTIALIAS))
-            # to prevent the image from being deleted by garbage collector we save it in dict.
-            self.images[char + str(position) + str(i)] = image
-            self.create_image(500 + i * 51, y, image=self.images[char + str(position) + str(i)], anchor="nw")
+            image = SPRITE_CACHE.get(f"characters/{char}", 51)
+            item = self.create_image(500 + i * 51, y, image=image, anchor="nw", tags="runs")
+            # to prevent the image from being deleted by garbage collector save it in dict under canvas item id.
+            self.images[item] = image
 
     def draw_score(self,
                    position: int,
@@ -875,9 +1081,9 @@ class Leaderboard(tk.Canvas):
         score = str(score)
         for i, num in enumerate(score):
             image = ImageTk.PhotoImage(Image.open(f"{os.getcwd()}/../resources/graphics/numbers/{num}.png"))
-            # to prevent the image from being deleted by garbage collector we save it in dict..
-            self.images[num + str(position) + str(i)] = image
-            self.create_image(975 + i * 27, y, image=self.images[num + str(position) + str(i)], anchor="nw")
+            item = self.create_image(975 + i * 27, y, image=image, anchor="nw", tags="runs")
+            # to prevent the image from being deleted by garbage collector save it in dict under canvas item id.
+            self.images[item] = image
 
 
 class Instruction(tk.Canvas):
@@ -890,7 +1096,7 @@ class Instruction(tk.Canvas):
     ___________
     controller: App class
         Refers back to the app class for control and interactions between tkinter widgets
-    images: dict
+    images: ImageRetainer
         Dictionary of images displayed during some specific events
     """
     def __init__(self, parent, controller):
@@ -951,8 +1157,7 @@ class CustomButton(tk.Button):
         exit_button = CustomButton(master=master,
                                    image_path=image_path,
                                    command=lambda: [master.controller.show_frame(GameMenu),
-                                                    pygame.mixer.Channel(0).play(pygame.mixer.Sound(
-                                                        f"{os.getcwd()}/../resources/sounds/button.wav"))])
+                                                    master.controller.sounds.play("button")])
         master.create_window(PADDING_X, 40, window=exit_button)
 
 
@@ -966,28 +1171,72 @@ class Buffer:
     ___________
     canvas: Tkinter canvas
         canvas where level will be drawn
+    sounds: SoundBank class
+        sound effects of the application that the canvas belongs to
     level_name: str
         level name that needs to be loaded
+    endless: bool
+        True if endless maze is played
     not_applied_changes: set
-        set of blocks that were changed but not so far displayed to user
+        set of (x, y) coordinates of blocks that were changed but not so far displayed to user
+    state: GameState class
+        gameplay of current game, buffer subscribes to its events to play sounds and redraw changed blocks
     player: Player class
-        Player class that is associated to current game
+        Player class that is associated to current game, stored in game state
     level: LevelMap class
-        LevelMap class representing currently played level
+        LevelMap class representing currently played level, stored in game state
+    maze: MazeGenerator class
+        maze from which current level was generated, kept so that it can be saved to file on request
+    par_steps: int
+        par of current level if it was generated, None if par is unknown
+    level_queue: LevelQueue class
+        levels generated in background in adventure mode, None in other modes
+    seeds: list
+        seeds of generated levels played so far in adventure mode or seed of endless maze, the run can be played
+        again from them
+    canvas_items: dict
+        canvas item ids of drawn blocks by (x, y) coordinates of blocks
+    player_item: int
+        canvas item id of drawn player, None if player wasn't drawn yet
+    camera: tuple
+        (left, top, right, bottom) bounds of blocks drawn by the camera, right and bottom excluded, None if the whole
+        level fits in the screen
+    panel_item: int
+        canvas item id of background of info panel covering blocks scrolled under it, None if camera isn't used
+    static_item: int
+        canvas item id of image of static layer with walls and empty space of the whole level, drawn under items of
+        other blocks, None if blocks are drawn one by one by the camera
 
     # Methods
     ___________
     generate_level(level_width,level_height,destructible_blocks,coins)
         generates level based on provided parameters using MazeGenerator class
+    show_object_numbers(destructible_blocks, coins)
+        shows numbers of objects limited to the number of places available in the maze in level generator
+    load_generated_level(maze, level, par_steps, seed)
+        starts playing generated level
+    load_level(level)
+        starts playing given level and prepares it to be drawn
+    release_canvas_items(camera: bool)
+        deletes canvas items of previous level and prepares empty grid of canvas items for current level
     apply_changes()
         applies not applied changes so they are visible to user
     draw_everything()
         draws level and player block on canvas
-    check_if_next_level()
-        checks if player has reached the exit of the level and if requirements for switching to the next
-        level are fulfilled
+    draw_static_layer()
+        draws walls and empty space of the whole level as one image
+    move_camera()
+        scrolls level so the player stays in the middle of the screen and draws blocks that came into view
+    camera_bounds(margin)
+        returns bounds of blocks in the screen and margin around it
+    redraw_block(x: int, y: int)
+        marks block as changed, so it is drawn again when changes are applied
+    finish_level(x: int, y: int)
+        switches to the next level or ends the game after player has gone through the exit
+    close()
+        stops generating levels in background
     calculate_block_size()
-        returns block size optimal for an abstract LevelMap to fit in screen
+        returns block size optimal for an abstract LevelMap to fit in screen and whether camera is needed
     calculate_canvas_origin()
         returns canvas origin to center map in given area. Should be called after calculate_block_size()
     end_game_update_on_leaderboard()
@@ -1001,7 +1250,9 @@ class Buffer:
                  level_width=LEVEL_WIDTH,
                  level_height=LEVEL_HEIGHT,
                  destructible_blocks=DESTRUCTIBLE_BLOCKS,
-                 coins=COINS):
+                 coins=COINS,
+                 seeds=None,
+                 endless=False):
         """
         # Parameters
         :param canvas:
@@ -1016,28 +1267,80 @@ class Buffer:
             Number of destructible blocks that will be in generated level
         :param coins:
             Number of coins that will be in generated level
+        :param seeds:
+            seeds of the first levels in adventure mode, e.g. seeds attribute of a buffer of a run played before
+        :param endless:
+            if True, one endless maze is played instead of adventure mode, the first of seeds is its seed
         """
+        from gameplay.modules import Player, LevelMap
+        from gameplay.game_state import GameState, COIN, DIG, DOOR, EXIT
 
         self.canvas = canvas
+        self.sounds = canvas.controller.sounds
+        self.canvas_items = {}
+        self.player_item = None
+        self.camera = None
+        self.panel_item = None
+        self.static_item = None
+        self.level_name = level_name
+        self.endless = endless
+        self.not_applied_changes = set()
+        self.par_steps = None
+        self.level_queue = None
+        self.seeds = []
+
+        # game state starts with an empty level until the first level is loaded
+        self.state = GameState(LevelMap(), Player(player_name, 0, 0))
+        self.state.subscribe(COIN, lambda x, y: self.sounds.play("coin_pick", channel=1))
+        self.state.subscribe(DOOR, lambda x, y: self.sounds.play("door_unlock"))
+        self.state.subscribe(DIG, lambda x, y: self.sounds.play("digging"))
+        for event in (COIN, DOOR, DIG):
+            self.state.subscribe(event, self.redraw_block)
+        self.state.subscribe(EXIT, self.finish_level)
 
         # depending on the mode functions generate level or loads it from file
         if level_name:
-            level = LevelMap()
-            level.load_from_file(f"{os.getcwd()}/../resources/levels/{level_name}.txt")
-            self.level = level
-            self.block_size = self.calculate_block_size()
-            self.canvas_origin = self.calculate_canvas_origin()
-        else:
+            # level is loaded from level file or level pack
+            from gameplay.level_pack import LevelCatalogue
+            level, self.par_steps = LevelCatalogue().load(level_name)
+            self.load_level(level)
+        elif endless:
+            # endless maze is generated in chunks around the player while it is played
+            from maze_generating_function.endless_maze import ChunkedLevel
+            level = ChunkedLevel(seed=seeds[0] if seeds else None, algorithm=MAZE_ALGORITHM)
+            self.seeds.append(level.seed)
+            self.load_level(level)
+        elif type(canvas).__name__ == "LevelGenerator":
             self.generate_level(level_width=level_width,
                                 level_height=level_height,
                                 destructible_blocks=destructible_blocks,
                                 coins=coins)
-
-        self.player = Player(player_name,
-                             self.level.player_starting_coordinate_x,
-                             self.level.player_starting_coordinate_y)
-        self.level_name = level_name
-        self.not_applied_changes = set()
+        else:
+            # in adventure mode next levels are generated in background while current level is played, levels played
+            # before are read from the cache if it is used
+            from maze_generating_function.level_queue import LevelQueue
+            cache = None
+            if CACHE_GENERATED_LEVELS:
+                from maze_generating_function.level_cache import LevelCache
+                cache = LevelCache()
+            self.level_queue = LevelQueue(seeds=seeds,
+                                          cache=cache,
+                                          level_width=level_width,
+                                          level_height=level_height,
+                                          objects={"interactive_block": destructible_blocks, "coin": coins},
+                                          algorithm=MAZE_ALGORITHM,
+                                          min_par_steps=MIN_PAR_STEPS,
+                                          max_par_steps=MAX_PAR_STEPS,
+                                          attempts=GENERATION_ATTEMPTS)
+            self.load_generated_level(*self.level_queue.get())
+
+    @property
+    def level(self):
+        return self.state.level
+
+    @property
+    def player(self):
+        return self.state.player
 
     def generate_level(self,
                        level_width=LEVEL_WIDTH,
@@ -1045,7 +1348,10 @@ class Buffer:
                        destructible_blocks=DESTRUCTIBLE_BLOCKS,
                        coins=COINS):
         """
-        Generates level with given conditions and stores it in level attribute
+        Generates level with given conditions on the calling thread and stores it in level attribute. In game, mazes
+        with par out of MIN_PAR_STEPS and MAX_PAR_STEPS bounds are rejected, unless there were already
+        GENERATION_ATTEMPTS of them. In level generator par isn't limited, so the level always has objects chosen by
+        user
 
         # Parameters
         :param level_width:
@@ -1057,35 +1363,115 @@ class Buffer:
         :param coins:
             Number of coins that will be in generated level
         """
-        level = LevelMap()
-        maze = MazeGenerator(width=level_width,
-                             height=level_height)
-
-        if destructible_blocks + coins > maze.max_additional_objects:
-            destructible_blocks = min(destructible_blocks, maze.max_additional_objects)
-            coins = max(maze.max_additional_objects - destructible_blocks, 0)
-            if type(self.canvas).__name__ == "LevelGenerator":
-                self.canvas.current_values["number_of_obstacles"] = destructible_blocks
-                self.canvas.current_values["number_of_coins"] = coins
-                self.canvas.update_numbers(number_str="{:02d}".format(destructible_blocks),
-                                           x=PADDING_X,
-                                           y=75 + 3 * (51 + self.canvas.space_between_buttons),
-                                           option_name="number_of_obstacles")
-                self.canvas.update_numbers(number_str="{:02d}".format(coins),
-                                           x=PADDING_X,
-                                           y=75 + 2 * (51 + self.canvas.space_between_buttons),
-                                           option_name="number_of_coins")
-
-        maze.add_objects("interactive_block", destructible_blocks)
-        maze.add_objects("coin", coins)
-        maze.save_to_file("tmp")
-        level.load_from_file(f"{os.getcwd()}/../resources/levels/tmp.txt")
-        self.level = level
-        self.block_size = self.calculate_block_size()
+        from gameplay.modules import LevelMap
+        from maze_generating_function.level_queue import generate_maze
+
+        limited = type(self.canvas).__name__ != "LevelGenerator"
+        maze, par_steps, objects = generate_maze(level_width=level_width,
+                                                 level_height=level_height,
+                                                 objects={"interactive_block": destructible_blocks, "coin": coins},
+                                                 algorithm=MAZE_ALGORITHM,
+                                                 min_par_steps=MIN_PAR_STEPS if limited else 0,
+                                                 max_par_steps=MAX_PAR_STEPS if limited else None,
+                                                 attempts=GENERATION_ATTEMPTS if limited else 1)
+        if not limited and (objects["interactive_block"], objects["coin"]) != (destructible_blocks, coins):
+            self.show_object_numbers(objects["interactive_block"], objects["coin"])
+        self.load_generated_level(maze, LevelMap.from_generator(maze), par_steps)
+
+    def show_object_numbers(self,
+                            destructible_blocks,
+                            coins):
+        """
+        Shows numbers of objects in level generator, when they were limited to the number of places available in the
+        maze
+
+        # Parameters
+        :param destructible_blocks:
+            Number of destructible blocks in generated level
+        :param coins:
+            Number of coins in generated level
+        """
+        self.canvas.current_values["number_of_obstacles"] = destructible_blocks
+        self.canvas.current_values["number_of_coins"] = coins
+        self.canvas.update_numbers(number_str="{:02d}".format(destructible_blocks),
+                                   x=PADDING_X,
+                                   y=75 + 3 * (51 + self.canvas.space_between_buttons),
+                                   option_name="number_of_obstacles")
+        self.canvas.update_numbers(number_str="{:02d}".format(coins),
+                                   x=PADDING_X,
+                                   y=75 + 2 * (51 + self.canvas.space_between_buttons),
+                                   option_name="number_of_coins")
+
+    def load_generated_level(self,
+                             maze,
+                             level,
+                             par_steps,
+                             seed=None):
+        """
+        Starts playing generated level
+
+        # Parameters
+        :param maze:
+            MazeGenerator class of generated maze, None if the level was read from the cache
+        :param level:
+            LevelMap class created from the maze
+        :param par_steps:
+            par of the level, None if it is unknown
+        :param seed:
+            seed of the level, None if it wasn't generated from a recorded seed
+        """
+        self.maze = maze
+        self.par_steps = par_steps
+        if seed is not None:
+            self.seeds.append(seed)
+        self.load_level(level)
+
+    def load_level(self,
+                   level):
+        """
+        Starts playing given level from its starting position and prepares it to be drawn on canvas
+
+        # Parameters
+        :param level:
+            LevelMap class of the level
+        """
+        self.state.load_level(level)
+        self.block_size, camera = self.calculate_block_size()
+        self.release_canvas_items(camera)
         self.canvas_origin = self.calculate_canvas_origin()
-        if hasattr(self, "player"):
-            self.player.current_coordinate_y = self.level.player_starting_coordinate_y
-            self.player.current_coordinate_x = self.level.player_starting_coordinate_x
+
+    def release_canvas_items(self,
+                             camera: bool = False):
+        """
+        Deletes canvas items of previously drawn level and player, so they don't stay in canvas display list, and
+        prepares empty grid of canvas items for current level. Should be called every time level is changed.
+
+        # Parameters
+        ____________
+        :param camera: bool, default = False
+            if True, level doesn't fit in the screen and is drawn by camera following the player
+        """
+        old_items = list(self.canvas_items.values())
+        if self.player_item is not None:
+            old_items.append(self.player_item)
+        if self.static_item is not None:
+            old_items.append(self.static_item)
+        if old_items:
+            self.canvas.delete(*old_items)
+            self.canvas.images.release(*old_items)
+
+        self.canvas_items = {}
+        self.player_item = None
+        self.static_item = None
+        self.not_applied_changes.clear()
+
+        # camera starts with no blocks drawn
+        self.camera = None
+        if camera:
+            self.camera = (0, 0, 0, 0)
+        elif self.panel_item is not None:
+            self.canvas.delete(self.panel_item)
+            self.panel_item = None
 
     def apply_changes(self):
         """
@@ -1093,52 +1479,158 @@ class Buffer:
         may want program to perform some actions before it. This method is delaying showing changes. When run all not
         visible changes will be visible.
         """
-        for block in self.not_applied_changes.copy():
-            block.draw(self)
-            self.not_applied_changes.remove(block)
+        if self.camera is not None:
+            self.move_camera()
+        for x, y in self.not_applied_changes:
+            # blocks out of camera bounds are drawn when they come into view
+            if (x, y) in self.canvas_items or self.camera is None:
+                self.level.block(x, y).draw(self)
+        self.not_applied_changes.clear()
         self.player.draw(self)
 
     def draw_everything(self):
         """
         This method draws whole map and player on canvas that a buffer is associated with
         """
-        for row in self.level.level_map:
-            for i in range(len(row)):
-                row[i].draw(self)
+        from gameplay.modules import STATIC_LOOKUP
+
+        if self.camera is not None:
+            self.move_camera()
+        else:
+            # only blocks that can change are drawn as separate items on top of static layer
+            if self.static_item is None:
+                self.draw_static_layer()
+            for y, x in zip(*(~STATIC_LOOKUP[self.level.cells]).nonzero()):
+                self.level.block(int(x), int(y)).draw(self)
         self.player.draw(self)
 
-    def check_if_next_level(self):
+    def draw_static_layer(self):
         """
-        This method checks if player has reached the exit of the level and if requirements for switching
-        to the next level are cleared.
+        Draws walls and empty space of the whole level as one image under all other items, it is rendered once per
+        level, as static blocks never change
         """
-        x = self.player.current_coordinate_x
-        y = self.player.current_coordinate_y
-        level_map = self.level.level_map
-        current_block = level_map[y][x]
+        from gameplay.modules import render_static_layer
 
-        if not current_block.is_exit_block:
-            return 0
+        image = ImageTk.PhotoImage(render_static_layer(self.level, self.block_size))
+        self.static_item = self.canvas.create_image(*self.canvas_origin, image=image, anchor="nw")
+        self.canvas.tag_lower(self.static_item)
+        # to prevent the image from being deleted by garbage collector we save it in dict under canvas item id.
+        self.canvas.images[self.static_item] = image
 
+    def move_camera(self):
+        """
+        Scrolls drawn blocks so the player stays in the middle of the screen, as far as the level reaches. Blocks that
+        left camera bounds are moved to blocks that came into them, so the number of canvas items doesn't depend on
+        the level size
+        """
+        from gameplay.modules import BLOCK_TAG
+
+        origin = self.calculate_canvas_origin()
+        if origin != self.canvas_origin:
+            self.canvas.move(BLOCK_TAG, origin[0] - self.canvas_origin[0], origin[1] - self.canvas_origin[1])
+            self.canvas_origin = origin
+
+        # drawn blocks are changed only when the screen reaches beyond them, so margin is drawn once per few moves
+        left, top, right, bottom = self.camera_bounds(margin=0)
+        if self.camera[0] <= left and self.camera[1] <= top and right <= self.camera[2] and bottom <= self.camera[3]:
+            return
+        bounds = self.camera_bounds()
+        left, top, right, bottom = bounds
+        self.camera = bounds
+        released = [self.canvas_items.pop(block) for block in [(x, y) for x, y in self.canvas_items
+                                                                if not (left <= x < right and top <= y < bottom)]]
+        for y in range(top, bottom):
+            for x in range(left, right):
+                if (x, y) in self.canvas_items:
+                    continue
+                if released:
+                    item = released.pop()
+                    self.canvas.coords(item, x * self.block_size + origin[0], y * self.block_size + origin[1])
+                    self.canvas_items[(x, y)] = item
+                self.level.block(x, y).draw(self)
+        if released:
+            self.canvas.delete(*released)
+            self.canvas.images.release(*released)
+
+        # blocks that came into view are drawn under the player and the info panel
+        if self.player_item is not None:
+            self.canvas.tag_raise(self.player_item)
+        if self.panel_item is None:
+            self.panel_item = self.canvas.create_rectangle(0, 0, self.canvas.controller.width, INFO_PANEL_SIZE,
+                                                           fill="black", outline="")
+        self.canvas.tag_raise(self.panel_item)
+
+    def camera_bounds(self,
+                      margin=CAMERA_MARGIN):
+        """
+        Calculates bounds of blocks which are at least partially in the screen below info panel, extended by given
+        margin and limited to the level
+
+        # Parameters
+        :param margin:
+            number of blocks added on every side of the screen
+        :return:
+            tuple of (left, top, right, bottom) block coordinates, right and bottom excluded
+        """
+        origin_x, origin_y = self.canvas_origin
+        return (max(0, -origin_x // self.block_size - margin),
+                max(0, (INFO_PANEL_SIZE - origin_y) // self.block_size - margin),
+                min(self.level.x_size, -((origin_x - self.canvas.controller.width) // self.block_size) + margin),
+                min(self.level.y_size, -((origin_y - self.canvas.controller.height) // self.block_size) + margin))
+
+    def redraw_block(self,
+                     x: int,
+                     y: int):
+        """
+        Marks block as changed, so it is drawn again next time changes are applied
+
+        # Parameters
+        :param x:
+            x coordinate of block
+        :param y:
+            y coordinate of block
+        """
+        self.not_applied_changes.add((x, y))
+
+    def finish_level(self,
+                     x: int,
+                     y: int):
+        """
+        This method is called by game state when player has gone through the open exit of the level, it switches
+        to the next level or shows end game information depending on the mode.
+
+        # Parameters
+        :param x:
+            x coordinate of exit
+        :param y:
+            y coordinate of exit
+        """
         # play a sound to tell the player he successfully went through the door
-        pygame.mixer.Channel(0).play(pygame.mixer.Sound(f"{os.getcwd()}/../resources/sounds/door_unlock.wav"))
+        self.sounds.play("door_unlock")
 
-        # check which mode is currently on, if adventure mode then generate random level if solo mode, show end game
-        # information
+        # check which mode is currently on, if adventure mode then take the next level generated in background if solo
+        # mode, show end game information
         if self.level_name:
             self.canvas.end_of_game()
         else:
-            self.generate_level()
-            self.player.current_coordinate_y = self.level.player_starting_coordinate_y
-            self.player.current_coordinate_x = self.level.player_starting_coordinate_x
+            self.load_generated_level(*self.level_queue.get())
             self.draw_everything()
 
+    def close(self):
+        """
+        Stops generating levels in background, should be called when the game is left
+        """
+        if self.level_queue is not None:
+            self.level_queue.close()
+
     def calculate_block_size(self):
         """
-        Calculates block size so the displayed map will fit in the screen
+        Calculates block size so the displayed map will fit in the screen, levels that would have too small blocks are
+        played with camera instead, except in level generator
         :return:
-            block size in pixels
+            tuple of block size in pixels and True if the level is drawn by camera because it doesn't fit in the screen
         """
+        camera = False
         if type(self.canvas).__name__ == "LevelGenerator":
             block_size = int(
                 min((self.canvas.controller.width - LEFT_PANEL_SIZE) / self.level.x_size,
@@ -1146,14 +1638,27 @@ class Buffer:
         else:
             block_size = int(min(int(self.canvas.controller.width) / self.level.x_size,
                                  (int(self.canvas.controller.height) - INFO_PANEL_SIZE) / self.level.y_size))
-        return block_size
+            # too small blocks would be hard to see, such levels are played with camera following the player
+            if block_size < MIN_BLOCK_SIZE:
+                block_size = CAMERA_BLOCK_SIZE
+                camera = True
+        return block_size, camera
 
     def calculate_canvas_origin(self):
         """
-        Calculates canvas origin so the displayed map will be centered
+        Calculates canvas origin so the displayed map will be centered, or with camera so the player will be in the
+        middle of the screen without showing space beyond the level
         :return:
             returns tuple of (x,y) coordinates on given canvas
         """
+        if self.camera is not None:
+            width = self.canvas.controller.width
+            height = self.canvas.controller.height
+            x = int(width / 2 - (self.player.current_coordinate_x + 0.5) * self.block_size)
+            y = int((height + INFO_PANEL_SIZE) / 2 - (self.player.current_coordinate_y + 0.5) * self.block_size)
+            return (max(width - self.level.x_size * self.block_size, min(0, x)),
+                    max(height - self.level.y_size * self.block_size, min(INFO_PANEL_SIZE, y)))
+
         # calculates coordinates of canvas origin because level may not always be a square
         if type(self.canvas).__name__ == "LevelGenerator":
             if int(self.canvas.controller.height / self.level.y_size) == self.block_size:
@@ -1175,7 +1680,8 @@ class Buffer:
 
     def end_game_update_on_leaderboard(self):
         """
-        Calculates score of a player and saves it in leaderboard.csv
+        Calculates score of a player and saves it in leaderboard.csv if it is one of the best scores, the run is also
+        recorded in run history if it is kept
         :return:
             returns a list of digits in score obtained by player
         """
@@ -1183,11 +1689,19 @@ class Buffer:
         score = max(0, self.player.coins_collected * 5 - TIME_LIMIT / 10 + DESTRUCTIBLE_BLOCKS)
 
         # Checking if current score is in top 9 and updating current leaderboard
-        leaderboard = pd.read_csv(f"{os.getcwd()}/../resources/leaderboard/leaderboard.csv", header=None)
-        leaderboard = leaderboard.append({0: self.player.player_name, 1: int(score)}, ignore_index=True)
-        leaderboard.sort_values(by=1, inplace=True, ascending=False)
-        leaderboard.iloc[:9, :].to_csv(f"{os.getcwd()}/../resources/leaderboard/leaderboard.csv",
-                                       header=False,
-                                       index=False)
+        leaderboard = self.canvas.controller.leaderboard
+        if leaderboard.add(self.player.player_name, int(score)):
+            leaderboard.save()
+
+        # Recording the run, it is written to the database outside of tkinter thread
+        run_history = self.canvas.controller.run_history
+        if run_history is not None:
+            run_history.record_run(player=self.player.player_name,
+                                   level=self.level_name or ("endless" if self.endless else "adventure"),
+                                   mode="solo" if self.level_name else ("endless" if self.endless else "adventure"),
+                                   coins=self.player.coins_collected,
+                                   time_played=min(elapsed_time, TIME_LIMIT),
+                                   score=int(score),
+                                   seeds=self.seeds)
 
         return list(str(int(score)))
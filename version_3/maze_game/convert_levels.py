@@ -0,0 +1,92 @@
+"""
+Command line tool converting level text files into binary level files described in gameplay.binary_level module, or
+into a single level pack described in gameplay.level_pack module.
+
+Every given .txt file, or every .txt file in a given directory, is saved next to it, or in output directory, as
+a file of the same name with .lvl extension. With --pack option all levels are saved in one pack together with their
+par instead. Run from maze_game directory, e.g.:
+
+    python convert_levels.py ../resources/levels --compression zlib
+    python convert_levels.py ../resources/levels/generated --pack ../resources/levels/packs/generated.pack
+"""
+import argparse
+import os
+
+from gameplay.binary_level import BINARY_LEVEL_EXTENSION, COMPRESSIONS, save_binary_level
+from gameplay.level_pack import write_level_pack
+from gameplay.modules import LevelMap
+from gameplay.solver import par_steps
+
+
+def level_files(paths: list):
+    """
+    Lists level text files given directly or inside given directories.
+
+    # Parameters
+    ____________
+    :param paths: list
+        paths of level text files and directories
+    :return:
+        list of paths of level text files
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith(".txt"))
+        else:
+            files.append(path)
+    return files
+
+
+def packed_levels(files: list):
+    """
+    Loads level text files one by one and computes their par, so they can be written to a level pack.
+
+    # Parameters
+    ____________
+    :param files: list
+        paths of level text files
+    :return:
+        generator of (name, LevelMap class, par) tuples
+    """
+    for path in files:
+        level = LevelMap()
+        level.load_from_file(path)
+        yield os.path.splitext(os.path.basename(path))[0], level, par_steps(level)
+
+
+def main(arguments: list = None):
+    parser = argparse.ArgumentParser(description="Converts level text files into binary level files.")
+    parser.add_argument("paths", nargs="*", default=[f"{os.getcwd()}/../resources/levels"],
+                        help="level text files or directories with them")
+    parser.add_argument("--compression", choices=list(COMPRESSIONS), default="none",
+                        help="compression of the grid, grid that isn't compressed is loaded without copying")
+    parser.add_argument("--output", default=None, help="output directory, directory of every level if not given")
+    parser.add_argument("--pack", default=None, help="path of level pack, levels are saved in it if given")
+    settings = vars(parser.parse_args(arguments))
+    if settings["output"]:
+        os.makedirs(settings["output"], exist_ok=True)
+
+    files = level_files(settings["paths"])
+    if settings["pack"]:
+        os.makedirs(os.path.dirname(os.path.abspath(settings["pack"])), exist_ok=True)
+        number_of_levels = write_level_pack(settings["pack"], packed_levels(files), settings["compression"])
+        print(f"packed {number_of_levels} levels, {sum(os.path.getsize(path) for path in files)} bytes of text "
+              f"into {os.path.getsize(settings['pack'])} bytes")
+        return
+
+    text_size = binary_size = 0
+    for path in files:
+        level = LevelMap()
+        level.load_from_file(path)
+        name = os.path.splitext(os.path.basename(path))[0] + BINARY_LEVEL_EXTENSION
+        binary_path = os.path.join(settings["output"] or os.path.dirname(path), name)
+        save_binary_level(level, binary_path, settings["compression"])
+        text_size = text_size + os.path.getsize(path)
+        binary_size = binary_size + os.path.getsize(binary_path)
+
+    print(f"converted {len(files)} levels, {text_size} bytes of text into {binary_size} bytes")
+
+
+if __name__ == "__main__":
+    main()
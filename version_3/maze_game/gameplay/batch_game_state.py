@@ -0,0 +1,182 @@
+import numpy as np
+
+from gameplay.modules import ACCESSIBLE, DESTRUCTIBLE, OPEN, BLOCK_CODES, BLOCK_FLAGS
+from gameplay.game_state import MOVES, ACTIONS, DIG, MOVE, COIN, DOOR, EXIT
+
+# bits of events in array returned by BatchGameState.step, the dig event of GameState has the same name as the action
+EVENT_BITS = {MOVE: 1,
+              COIN: 2,
+              DIG: 4,
+              DOOR: 8,
+              EXIT: 16}
+
+# x and y directions of actions by their index in ACTIONS, digging doesn't change direction
+ACTION_X = np.array([MOVES[action][0] if action in MOVES else 0 for action in ACTIONS], dtype=np.int64)
+ACTION_Y = np.array([MOVES[action][1] if action in MOVES else 0 for action in ACTIONS], dtype=np.int64)
+DIG_ACTION = ACTIONS.index(DIG)
+
+
+class BatchGameState:
+    """
+    This abstract class plays many independent games at once, following the same rules as GameState class. Grids
+    of all levels and positions, directions and coins of all players are stacked in numpy arrays, so a single call of
+    step advances every game. Levels smaller than the biggest one are padded with walls. A game is finished when its
+    player goes through the exit, afterwards its actions are ignored until a new level is loaded with load_level.
+
+    # Attributes
+    ___________
+    cells: ndarray
+        uint8 ndarray of shape (number of games, y_size, x_size) with code of block type from BLOCK_CODES
+    flags: ndarray
+        uint8 ndarray of shape (number of games, y_size, x_size) with bit flags of blocks
+    x: ndarray
+        current x coordinate of player of every game
+    y: ndarray
+        current y coordinate of player of every game
+    direction_x: ndarray
+        x direction that player of every game is facing
+    direction_y: ndarray
+        y direction that player of every game is facing
+    coins_collected: ndarray
+        number of coins collected by player of every game
+    number_of_coins: ndarray
+        number of coins left to collect in every game
+    exit_x: ndarray
+        x coordinate of exit of every game, -1 if level has no exit
+    exit_y: ndarray
+        y coordinate of exit of every game, -1 if level has no exit
+    finished: ndarray
+        bool ndarray telling which games are finished
+
+    # Methods
+    ___________
+    load_level(game: int, level)
+        starts playing a new level in given game
+    step(actions: ndarray)
+        applies one action in every game and returns events that happened
+    """
+    def __init__(self,
+                 levels: list,
+                 x_size: int = None,
+                 y_size: int = None):
+        """
+        # Parameters
+        ____________
+        :param levels: list
+            list of LevelMap classes, one for every game, the same level can be used by many games
+        :param x_size: int, default = None
+            width of the grids, width of the widest level if not given
+        :param y_size: int, default = None
+            height of the grids, height of the highest level if not given
+        """
+        number_of_games = len(levels)
+        x_size = x_size or max(level.x_size for level in levels)
+        y_size = y_size or max(level.y_size for level in levels)
+
+        self.cells = np.full((number_of_games, y_size, x_size), BLOCK_CODES["#"], dtype=np.uint8)
+        self.flags = np.full((number_of_games, y_size, x_size), BLOCK_FLAGS["#"], dtype=np.uint8)
+        self.x = np.zeros(number_of_games, dtype=np.int64)
+        self.y = np.zeros(number_of_games, dtype=np.int64)
+        self.direction_x = np.zeros(number_of_games, dtype=np.int64)
+        self.direction_y = np.ones(number_of_games, dtype=np.int64)
+        self.coins_collected = np.zeros(number_of_games, dtype=np.int64)
+        self.number_of_coins = np.zeros(number_of_games, dtype=np.int64)
+        self.exit_x = np.full(number_of_games, -1, dtype=np.int64)
+        self.exit_y = np.full(number_of_games, -1, dtype=np.int64)
+        self.finished = np.zeros(number_of_games, dtype=bool)
+
+        # flat views of the grids, blocks are indexed with game * block_count + y * x_size + x
+        self._flat_cells = self.cells.reshape(-1)
+        self._flat_flags = self.flags.reshape(-1)
+        self._offsets = np.arange(number_of_games, dtype=np.int64) * (x_size * y_size)
+
+        for game, level in enumerate(levels):
+            self.load_level(game, level)
+
+    def __len__(self):
+        return len(self.x)
+
+    def load_level(self,
+                   game: int,
+                   level):
+        """
+        Starts playing a new level in given game, player keeps collected coins and is moved to starting position of
+        the level. Level is copied, so it isn't changed by playing.
+
+        # Parameters
+        ____________
+        :param game: int
+            index of the game
+        :param level: LevelMap class
+            level to be played, can't be bigger than grids
+        """
+        _, y_size, x_size = self.cells.shape
+        if level.x_size > x_size or level.y_size > y_size:
+            raise ValueError(f"Level of size {level.x_size}x{level.y_size} doesn't fit in {x_size}x{y_size} grids")
+
+        self.cells[game] = BLOCK_CODES["#"]
+        self.flags[game] = BLOCK_FLAGS["#"]
+        self.cells[game, :level.y_size, :level.x_size] = level.cells
+        self.flags[game, :level.y_size, :level.x_size] = level.flags
+        self.x[game] = level.player_starting_coordinate_x
+        self.y[game] = level.player_starting_coordinate_y
+        self.number_of_coins[game] = level.number_of_coins
+        self.exit_x[game], self.exit_y[game] = level.exit_coordinate or (-1, -1)
+        self.finished[game] = False
+
+    def step(self,
+             actions):
+        """
+        Applies one action in every game that isn't finished, following the rules of GameState.step.
+
+        # Parameters
+        ____________
+        :param actions: ndarray
+            int ndarray with index of action from ACTIONS for every game
+        :return:
+            uint8 ndarray with sum of EVENT_BITS of events that happened in every game
+        """
+        actions = np.asarray(actions)
+        _, y_size, x_size = self.cells.shape
+        active = ~self.finished
+        moving = active & (actions != DIG_ACTION)
+        digging = active & (actions == DIG_ACTION)
+
+        # moving turns player in direction of the move, digging targets block player is facing
+        self.direction_x[moving] = ACTION_X[actions[moving]]
+        self.direction_y[moving] = ACTION_Y[actions[moving]]
+        target_x = self.x + self.direction_x
+        target_y = self.y + self.direction_y
+        inside = (target_x >= 0) & (target_x < x_size) & (target_y >= 0) & (target_y < y_size)
+        target = self._offsets + np.clip(target_y, 0, y_size - 1) * x_size + np.clip(target_x, 0, x_size - 1)
+        target_flags = self._flat_flags[target]
+
+        events = np.zeros(len(actions), dtype=np.uint8)
+
+        # destroying blocks
+        dug = digging & inside & (target_flags & DESTRUCTIBLE != 0)
+        self._flat_flags[target[dug]] = BLOCK_FLAGS[" "]
+        self._flat_cells[target[dug]] = BLOCK_CODES[" "]
+        events[dug] = EVENT_BITS[DIG]
+
+        # moving players
+        moved = moving & inside & (target_flags & ACCESSIBLE != 0)
+        self.x[moved] = target_x[moved]
+        self.y[moved] = target_y[moved]
+        events[moved] = EVENT_BITS[MOVE]
+
+        # collecting coins and opening exits after the last coin
+        coin = moved & (self._flat_cells[target] == BLOCK_CODES["C"])
+        self._flat_cells[target[coin]] = BLOCK_CODES[" "]
+        self.number_of_coins[coin] -= 1
+        self.coins_collected[coin] += 1
+        events[coin] |= EVENT_BITS[COIN]
+        door = coin & (self.number_of_coins == 0) & (self.exit_x >= 0)
+        self._flat_flags[self._offsets[door] + self.exit_y[door] * x_size + self.exit_x[door]] |= OPEN | ACCESSIBLE
+        events[door] |= EVENT_BITS[DOOR]
+
+        # going through the exit finishes the game
+        through_exit = moved & (self.x == self.exit_x) & (self.y == self.exit_y)
+        self.finished |= through_exit
+        events[through_exit] |= EVENT_BITS[EXIT]
+        return events
@@ -0,0 +1,173 @@
+"""
+Binary level files, which are opened without parsing text, so even levels with thousands of blocks per side are loaded
+at once.
+
+File starts with a header of HEADER_FORMAT: magic bytes, format version, compression, level width and height, player
+starting position, exit position (-1 if level has no exit) and number of coins, followed by size of the grid data.
+Grid data is a uint8 grid of block codes from BLOCK_CODES in rows, stored as it is, compressed with zlib or as runs
+of equal blocks. Grid data is padded to a multiple of 4 bytes and followed by uint32 (x, y) pairs of coin coordinates.
+All numbers are little endian.
+"""
+import mmap
+import struct
+import zlib
+
+import numpy as np
+
+from gameplay.modules import FLAG_LOOKUP, OPEN, ACCESSIBLE
+
+BINARY_LEVEL_EXTENSION = ".lvl"
+MAGIC = b"MZLV"
+VERSION = 1
+# magic, version, compression, reserved, width, height, start x, start y, exit x, exit y, coins, grid data size
+HEADER_FORMAT = struct.Struct("<4sBBHIIIIiiIQ")
+# compression of the grid, runs are stored as uint32 lengths of all runs followed by uint8 block codes of all runs
+COMPRESSIONS = {"none": 0,
+                "zlib": 1,
+                "rle": 2}
+
+
+def encode_level(level,
+                 compression: str = "none"):
+    """
+    Encodes level in binary level format. Level should be encoded right after it was loaded, before any changes by
+    the game.
+
+    # Parameters
+    ____________
+    :param level: LevelMap class
+        encoded level
+    :param compression: {"none", "zlib", "rle"}, str, default = "none"
+        compression of the grid, grid that isn't compressed is loaded without copying
+    :return:
+        bytes of binary level file
+    """
+    cells = np.ascontiguousarray(level.cells, dtype=np.uint8)
+    if compression == "none":
+        data = cells.tobytes()
+    elif compression == "zlib":
+        data = zlib.compress(cells.tobytes())
+    elif compression == "rle":
+        flat = cells.ravel()
+        starts = np.flatnonzero(np.diff(flat, prepend=np.int16(-1)))
+        lengths = np.diff(starts, append=flat.size).astype("<u4")
+        data = lengths.tobytes() + flat[starts].tobytes()
+    else:
+        raise ValueError(f"Unknown compression: {compression}")
+
+    exit_x, exit_y = level.exit_coordinate if level.exit_coordinate is not None else (-1, -1)
+    coins = np.array(sorted(level.coin_coordinates), dtype="<u4").reshape(-1, 2)
+    header = HEADER_FORMAT.pack(MAGIC, VERSION, COMPRESSIONS[compression], 0, level.x_size, level.y_size,
+                                level.player_starting_coordinate_x, level.player_starting_coordinate_y,
+                                exit_x, exit_y, len(coins), len(data))
+    return b"".join((header, data, bytes(-len(data) % 4), coins.tobytes()))
+
+
+def save_binary_level(level,
+                      path: str,
+                      compression: str = "none"):
+    """
+    Saves level in binary level file, encoded by encode_level function.
+
+    # Parameters
+    ____________
+    :param level: LevelMap class
+        saved level
+    :param path: str
+        path of saved file, usually with BINARY_LEVEL_EXTENSION
+    :param compression: {"none", "zlib", "rle"}, str, default = "none"
+        compression of the grid, grid that isn't compressed is loaded without copying
+    """
+    with open(path, "wb") as level_file:
+        level_file.write(encode_level(level, compression))
+
+
+def load_binary_level(path: str,
+                      level=None):
+    """
+    Loads level from binary level file. File is mapped into memory and grid that isn't compressed is used directly
+    as cell grid of the level, so only pages of the file that are read are loaded from disk. Mapping is private, so
+    changes made by the game aren't written to the file.
+
+    # Parameters
+    ____________
+    :param path: str
+        path of binary level file
+    :param level: LevelMap class, default = None
+        level that is loaded, new LevelMap class if not given
+    :return:
+        loaded LevelMap class
+    """
+    with open(path, "rb") as level_file:
+        mapped = mmap.mmap(level_file.fileno(), 0, access=mmap.ACCESS_COPY)
+    return decode_level(mapped, level=level, name=path)
+
+
+def decode_level(buffer,
+                 offset: int = 0,
+                 level=None,
+                 name: str = "level"):
+    """
+    Loads level encoded in binary level format from a buffer, e.g. a memory mapped file. Grid that isn't compressed
+    is used directly as cell grid of the level, so buffer should be writable if the level is played.
+
+    # Parameters
+    ____________
+    :param buffer:
+        buffer with encoded level
+    :param offset: int, default = 0
+        position of encoded level in the buffer
+    :param level: LevelMap class, default = None
+        level that is loaded, new LevelMap class if not given
+    :param name: str, default = "level"
+        name of the level used in error messages
+    :return:
+        loaded LevelMap class
+    """
+    if level is None:
+        from gameplay.modules import LevelMap
+        level = LevelMap()
+
+    if len(buffer) < offset + HEADER_FORMAT.size:
+        raise ValueError(f"{name} is not a binary level file")
+    (magic, version, compression, _, x_size, y_size, start_x, start_y,
+     exit_x, exit_y, number_of_coins, data_size) = HEADER_FORMAT.unpack_from(buffer, offset)
+    if magic != MAGIC:
+        raise ValueError(f"{name} is not a binary level file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported binary level version: {version}")
+
+    offset = offset + HEADER_FORMAT.size
+    if compression == COMPRESSIONS["none"]:
+        cells = np.frombuffer(buffer, dtype=np.uint8, count=x_size * y_size, offset=offset)
+    elif compression == COMPRESSIONS["zlib"]:
+        cells = np.frombuffer(bytearray(zlib.decompress(buffer[offset:offset + data_size])), dtype=np.uint8)
+    elif compression == COMPRESSIONS["rle"]:
+        runs = data_size // 5
+        lengths = np.frombuffer(buffer, dtype="<u4", count=runs, offset=offset)
+        codes = np.frombuffer(buffer, dtype=np.uint8, count=runs, offset=offset + 4 * runs)
+        cells = np.repeat(codes, lengths)
+    else:
+        raise ValueError(f"Unknown binary level compression: {compression}")
+    if cells.size != x_size * y_size:
+        raise ValueError(f"Grid of {name} doesn't match level size")
+    coins = np.frombuffer(buffer, dtype="<u4", count=2 * number_of_coins,
+                          offset=offset + data_size + -data_size % 4).reshape(-1, 2)
+
+    level.x_size = x_size
+    level.y_size = y_size
+    level.player_starting_coordinate_x = start_x
+    level.player_starting_coordinate_y = start_y
+    level.cells = cells.reshape(y_size, x_size)
+    try:
+        level.flags = FLAG_LOOKUP.take(level.cells)
+    except IndexError:
+        raise ValueError(f"Unknown block code in {name}")
+    level.coin_coordinates = set(zip(coins[:, 0].tolist(), coins[:, 1].tolist()))
+    level.number_of_coins = number_of_coins
+    level.exit_coordinate = (exit_x, exit_y) if exit_x >= 0 else None
+
+    # if map has coins to collect, changes exit block to be closed and unaccessible for player
+    if level.number_of_coins and level.exit_coordinate:
+        level.flags[exit_y, exit_x] &= ~(OPEN | ACCESSIBLE) & 0xFF
+    return level
@@ -0,0 +1,149 @@
+from gameplay.modules import ACCESSIBLE, DESTRUCTIBLE, OPEN, BLOCK_CODES, BLOCK_FLAGS
+
+# actions that can be passed to GameState.step, moves are (x, y) directions of a move
+MOVES = {"left": (-1, 0),
+         "right": (1, 0),
+         "up": (0, -1),
+         "down": (0, 1)}
+DIG = "dig"
+ACTIONS = (*MOVES, DIG)
+
+# events returned by GameState.step as (event, x, y) tuples, with coordinates of the block that the event happened on
+MOVE = "move"
+COIN = "coin"
+DOOR = "door"
+EXIT = "exit"
+EVENTS = (MOVE, COIN, DIG, DOOR, EXIT)
+
+# returned by steps in which nothing happened, so they don't create a new list
+NO_EVENTS = ()
+
+
+class GameState:
+    """
+    This abstract class is the core of gameplay, it applies actions of a player to the level and reports what happened
+    as events. It doesn't draw anything and doesn't play any sounds, so it can be run without display or audio
+    device, e.g. by bots, tests and benchmarks. GUI subscribes to events to redraw changed blocks and play sounds.
+
+    # Attributes
+    ___________
+    level: LevelMap class
+        currently played level
+    player: Player class
+        player moving around the level
+    listeners: dict
+        lists of functions called with (x, y) coordinates of every event, stored by event name
+
+    # Methods
+    ___________
+    load_level(level)
+        starts playing a new level from its starting position
+    subscribe(event: str, listener)
+        registers function called every time given event happens
+    step(action: str)
+        applies single action of a player and returns list of events that happened
+    """
+    __slots__ = ("level", "player", "listeners")
+
+    def __init__(self,
+                 level,
+                 player):
+        """
+        # Parameters
+        ____________
+        :param level: LevelMap class
+            level to be played, player is moved to its starting position
+        :param player: Player class
+            player moving around the level
+        """
+        self.player = player
+        self.listeners = {}
+        self.load_level(level)
+
+    def load_level(self,
+                   level):
+        """
+        Starts playing a new level, player keeps collected coins and is moved to starting position of the level.
+
+        # Parameters
+        ____________
+        :param level: LevelMap class
+            level to be played
+        """
+        self.level = level
+        self.player.current_coordinate_x = level.player_starting_coordinate_x
+        self.player.current_coordinate_y = level.player_starting_coordinate_y
+
+    def subscribe(self,
+                  event: str,
+                  listener):
+        """
+        Registers function called with (x, y) coordinates of the block every time given event happens. Functions are
+        called after the action is applied, in order of events and then in order of subscription.
+
+        # Parameters
+        ____________
+        :param event: str
+            one of EVENTS
+        :param listener: function
+            function taking x and y coordinates of the block
+        """
+        if event not in EVENTS:
+            raise ValueError(f"Unknown event: {event}")
+        self.listeners.setdefault(event, []).append(listener)
+
+    def step(self,
+             action: str):
+        """
+        Applies single action of a player to the level. Moving turns the player in direction of the move and, if target
+        block is accessible, moves him there and collects a coin lying on it. Collecting the last coin opens the exit.
+        Digging destroys destructible block the player is facing.
+
+        # Parameters
+        ____________
+        :param action: str
+            one of ACTIONS
+        :return:
+            list of (event, x, y) tuples, empty if nothing happened
+        """
+        level = self.level
+        player = self.player
+        if action == DIG:
+            target_x = player.current_coordinate_x + player.direction[0]
+            target_y = player.current_coordinate_y + player.direction[1]
+            if not (0 <= target_x < level.x_size and 0 <= target_y < level.y_size) or \
+               not level.flags[target_y, target_x] & DESTRUCTIBLE:
+                return NO_EVENTS
+            level.flags[target_y, target_x] = BLOCK_FLAGS[" "]
+            level.cells[target_y, target_x] = BLOCK_CODES[" "]
+            events = [(DIG, target_x, target_y)]
+        else:
+            direction = MOVES[action]
+            player.direction = direction
+            target_x = player.current_coordinate_x + direction[0]
+            target_y = player.current_coordinate_y + direction[1]
+            if not (0 <= target_x < level.x_size and 0 <= target_y < level.y_size) or \
+               not level.flags[target_y, target_x] & ACCESSIBLE:
+                return NO_EVENTS
+            player.current_coordinate_x = target_x
+            player.current_coordinate_y = target_y
+            events = [(MOVE, target_x, target_y)]
+
+            if (target_x, target_y) in level.coin_coordinates:
+                level.coin_coordinates.remove((target_x, target_y))
+                level.number_of_coins = level.number_of_coins - 1
+                level.cells[target_y, target_x] = BLOCK_CODES[" "]
+                player.coins_collected = player.coins_collected + 1
+                events.append((COIN, target_x, target_y))
+                if level.number_of_coins == 0 and level.exit_coordinate is not None:
+                    exit_x, exit_y = level.exit_coordinate
+                    level.flags[exit_y, exit_x] |= OPEN | ACCESSIBLE
+                    events.append((DOOR, exit_x, exit_y))
+            elif (target_x, target_y) == level.exit_coordinate:
+                events.append((EXIT, target_x, target_y))
+
+        if self.listeners:
+            for event, x, y in events:
+                for listener in self.listeners.get(event, ()):
+                    listener(x, y)
+        return events
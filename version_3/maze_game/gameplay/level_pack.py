@@ -0,0 +1,269 @@
+"""
+Level packs, single files holding many levels, so thousands of generated levels can be browsed without listing and
+opening a file for each of them.
+
+Pack starts with a header of PACK_HEADER_FORMAT: magic bytes, format version, number of levels and position of the
+index. Levels follow the header, each encoded in binary level format of binary_level module and aligned to 8 bytes.
+The index, at the end of the file, is an array of INDEX_DTYPE records with name, width, height, number of coins, par
+(-1 if unknown), position and size of every level. Pack is mapped into memory, so the index is searched and a level is
+loaded without reading the rest of the file.
+"""
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from gameplay.binary_level import BINARY_LEVEL_EXTENSION, decode_level, encode_level
+
+PACK_EXTENSION = ".pack"
+PACK_MAGIC = b"MZPK"
+PACK_VERSION = 1
+# magic, version, number of levels, position of the index
+PACK_HEADER_FORMAT = struct.Struct("<4sB3xIQ")
+INDEX_DTYPE = np.dtype([("name", "S64"),
+                        ("width", "<u4"),
+                        ("height", "<u4"),
+                        ("coins", "<u4"),
+                        ("par", "<i4"),
+                        ("offset", "<u8"),
+                        ("size", "<u8")])
+# maximal number of level names returned by a search
+LEVEL_LIST_SIZE = 100
+
+
+def write_level_pack(path: str,
+                     levels,
+                     compression: str = "zlib"):
+    """
+    Writes levels into a level pack. Levels are written one by one, so they don't have to be kept in memory.
+
+    # Parameters
+    ____________
+    :param path: str
+        path of the pack, usually with PACK_EXTENSION
+    :param levels:
+        iterable of (name, LevelMap class, par) tuples, par is None if unknown, names should be unique
+    :param compression: {"none", "zlib", "rle"}, str, default = "zlib"
+        compression of grids of levels
+    :return:
+        number of written levels
+    """
+    index = []
+    with open(path, "wb") as pack_file:
+        pack_file.write(bytes(PACK_HEADER_FORMAT.size))
+        offset = PACK_HEADER_FORMAT.size
+        for name, level, par_steps in levels:
+            encoded_name = name.encode("utf-8")
+            if len(encoded_name) > INDEX_DTYPE["name"].itemsize:
+                raise ValueError(f"Level name is too long: {name}")
+            data = encode_level(level, compression)
+            pack_file.write(data + bytes(-len(data) % 8))
+            index.append((encoded_name, level.x_size, level.y_size, level.number_of_coins,
+                          -1 if par_steps is None else par_steps, offset, len(data)))
+            offset = offset + len(data) + -len(data) % 8
+        pack_file.write(np.array(index, dtype=INDEX_DTYPE).tobytes())
+        pack_file.seek(0)
+        pack_file.write(PACK_HEADER_FORMAT.pack(PACK_MAGIC, PACK_VERSION, len(index), offset))
+    return len(index)
+
+
+class LevelPack:
+    """
+    This abstract class gives access to levels of a level pack file. File is mapped into memory privately, so loaded
+    levels share memory with the mapping until they are changed by the game and changes aren't written to the file.
+
+    # Attributes
+    ___________
+    path: str
+        path of the pack
+    index: ndarray
+        array of INDEX_DTYPE records describing levels of the pack, in order of the file
+
+    # Methods
+    ___________
+    names()
+        returns names of all levels
+    search(text: str, limit: int)
+        returns names of levels containing given text
+    load(name: str)
+        returns level with given name and its par
+    """
+    def __init__(self,
+                 path: str):
+        """
+        # Parameters
+        ____________
+        :param path: str
+            path of the pack
+        """
+        self.path = path
+        with open(path, "rb") as pack_file:
+            self._mapped = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, number_of_levels, index_offset = PACK_HEADER_FORMAT.unpack_from(self._mapped)
+        if magic != PACK_MAGIC:
+            raise ValueError(f"{path} is not a level pack")
+        if version != PACK_VERSION:
+            raise ValueError(f"Unsupported level pack version: {version}")
+        self.index = np.frombuffer(self._mapped, dtype=INDEX_DTYPE, count=number_of_levels, offset=index_offset)
+
+    def __len__(self):
+        return len(self.index)
+
+    def names(self):
+        """
+        Returns names of all levels of the pack in order of the file.
+
+        :return:
+            list of level names
+        """
+        return np.char.decode(self.index["name"], "utf-8").tolist()
+
+    def search(self,
+               text: str = "",
+               limit: int = LEVEL_LIST_SIZE):
+        """
+        Returns names of levels containing given text, in order of the file.
+
+        # Parameters
+        ____________
+        :param text: str, default = ""
+            searched text, all levels are returned if empty
+        :param limit: int, default = LEVEL_LIST_SIZE
+            maximal number of returned names
+        :return:
+            list of level names
+        """
+        names = self.index["name"]
+        if text:
+            names = names[np.char.find(names, text.encode("utf-8")) >= 0]
+        return np.char.decode(names[:limit], "utf-8").tolist()
+
+    def load(self,
+             name: str):
+        """
+        Loads level with given name.
+
+        # Parameters
+        ____________
+        :param name: str
+            name of the level
+        :return:
+            tuple of LevelMap class of the level and its par, None if par is unknown
+        """
+        rows = np.flatnonzero(self.index["name"] == name.encode("utf-8"))
+        if not len(rows):
+            raise KeyError(f"Level {name} isn't in {self.path}")
+        entry = self.index[rows[0]]
+        level = decode_level(self._mapped, offset=int(entry["offset"]), name=f"{self.path}/{name}")
+        return level, int(entry["par"]) if entry["par"] >= 0 else None
+
+
+class LevelCatalogue:
+    """
+    This abstract class lists levels that can be played in solo mode: level files in levels directory and levels of
+    packs in its packs subdirectory. Level of a pack is named with name of the pack and name of the level separated by
+    "/", e.g. "level_0/level_17". Packs are opened when their levels are searched or loaded for the first time.
+
+    # Attributes
+    ___________
+    directory: str
+        directory with level files
+    level_files: list
+        names of level files without extension, level saved both as text and binary file is listed once
+    pack_paths: dict
+        paths of level packs by pack name
+    packs: dict
+        opened LevelPack classes by pack name
+
+    # Methods
+    ___________
+    search(text: str, limit: int)
+        returns names of levels containing given text
+    load(level_name: str)
+        returns level with given name and its par
+    """
+    def __init__(self,
+                 directory: str = None):
+        """
+        # Parameters
+        ____________
+        :param directory: str, default = None
+            directory with level files, resources/levels if not given
+        """
+        self.directory = directory or f"{os.getcwd()}/../resources/levels"
+        self.level_files = list(dict.fromkeys(os.path.splitext(entry.name)[0]
+                                              for entry in sorted(os.scandir(self.directory), key=lambda e: e.name)
+                                              if entry.is_file() and entry.name.endswith((".txt",
+                                                                                          BINARY_LEVEL_EXTENSION))))
+        packs_directory = os.path.join(self.directory, "packs")
+        self.pack_paths = {}
+        if os.path.isdir(packs_directory):
+            self.pack_paths = {os.path.splitext(entry.name)[0]: entry.path
+                               for entry in sorted(os.scandir(packs_directory), key=lambda e: e.name)
+                               if entry.is_file() and entry.name.endswith(PACK_EXTENSION)}
+        self.packs = {}
+
+    def pack(self,
+             pack_name: str):
+        """
+        Returns opened level pack, opening it on first use.
+
+        # Parameters
+        ____________
+        :param pack_name: str
+            name of the pack
+        :return:
+            LevelPack class
+        """
+        if pack_name not in self.packs:
+            self.packs[pack_name] = LevelPack(self.pack_paths[pack_name])
+        return self.packs[pack_name]
+
+    def search(self,
+               text: str = "",
+               limit: int = LEVEL_LIST_SIZE):
+        """
+        Returns names of levels containing given text, level files first and then levels of packs. Name of a pack is
+        searched too, so all levels of a pack are found by its name.
+
+        # Parameters
+        ____________
+        :param text: str, default = ""
+            searched text, all levels are returned if empty
+        :param limit: int, default = LEVEL_LIST_SIZE
+            maximal number of returned names
+        :return:
+            list of level names
+        """
+        found = [name for name in self.level_files if text in name][:limit]
+        for pack_name in self.pack_paths:
+            if len(found) >= limit:
+                break
+            pack_text = "" if text in pack_name else text
+            found.extend(f"{pack_name}/{name}" for name in self.pack(pack_name).search(pack_text, limit - len(found)))
+        return found
+
+    def load(self,
+             level_name: str):
+        """
+        Loads level with given name, binary level file is preferred to text file of the same level.
+
+        # Parameters
+        ____________
+        :param level_name: str
+            name of level file without extension or name of pack and level separated by "/"
+        :return:
+            tuple of LevelMap class of the level and its par, None if par is unknown
+        """
+        from gameplay.modules import LevelMap
+
+        pack_name, _, name = level_name.rpartition("/")
+        if pack_name:
+            return self.pack(pack_name).load(name)
+
+        path = os.path.join(self.directory, level_name)
+        level = LevelMap()
+        level.load_from_file(f"{path}{BINARY_LEVEL_EXTENSION}" if os.path.isfile(f"{path}{BINARY_LEVEL_EXTENSION}")
+                             else f"{path}.txt")
+        return level, None
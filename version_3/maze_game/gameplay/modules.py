@@ -1,6 +1,6 @@
-from PIL import Image, ImageTk
+from collections import OrderedDict
+import numpy as np
 import os
-import pygame
 
 BLOCK_TYPES = {"#": "wall",
                " ": "black",
@@ -8,12 +8,161 @@ BLOCK_TYPES = {"#": "wall",
                "I": "obstacle",
                "C": "coin"}
 
+# codes of block types stored in LevelMap cell type grid and characters of block types by code
+BLOCK_CODES = {block_type: code for code, block_type in enumerate(BLOCK_TYPES)}
+BLOCK_CHARACTERS = list(BLOCK_TYPES)
+
+# bit flags describing state of a block stored in LevelMap flags grid
+ACCESSIBLE = 1
+DESTRUCTIBLE = 2
+EXIT = 4
+OPEN = 8
+
+# flags of each type of block right after level is loaded
+BLOCK_FLAGS = {"#": OPEN,
+               " ": ACCESSIBLE | OPEN,
+               "E": ACCESSIBLE | EXIT | OPEN,
+               "I": DESTRUCTIBLE | OPEN,
+               "C": ACCESSIBLE | OPEN}
+
+# lookup tables translating level file characters into block codes (255 for unknown characters) and codes into flags
+CODE_LOOKUP = np.full(256, 255, dtype=np.uint8)
+for _block_type, _code in BLOCK_CODES.items():
+    CODE_LOOKUP[ord(_block_type)] = _code
+FLAG_LOOKUP = np.array([BLOCK_FLAGS[block_type] for block_type in BLOCK_CHARACTERS], dtype=np.uint8)
+
+# blocks that never change after level is loaded, drawn together in one image of static layer, and lookup table telling
+# which block codes are static
+STATIC_BLOCKS = ("#", " ")
+STATIC_LOOKUP = np.array([block_type in STATIC_BLOCKS for block_type in BLOCK_CHARACTERS])
+
+
+class SpriteCache:
+    """
+    This class stores sprites used to draw a level, so that each png file from resources/graphics is decoded only
+    once and resized only once for every block size. Resized sprites are kept in least recently used order, so when
+    block size changes between levels sprites of previous size are evicted first.
+
+    # Attributes
+    ___________
+    max_sprites: int
+        maximal number of resized sprites kept in cache
+    sources: dict
+        decoded PIL images stored by sprite name
+    sprites: OrderedDict
+        resized tkinter images stored by (sprite name, block size) in least recently used order
+
+    # Methods
+    ___________
+    source(sprite: str)
+        returns decoded PIL image of sprite
+    get(sprite: str, block_size: int)
+        returns tkinter image of sprite resized to block size
+    """
+    def __init__(self,
+                 max_sprites: int = 64):
+        """
+        # Parameters
+        ____________
+        :param max_sprites: int, default = 64
+            maximal number of resized sprites kept in cache
+        """
+        self.max_sprites = max_sprites
+        self.sources = {}
+        self.sprites = OrderedDict()
+
+    def source(self,
+               sprite: str):
+        """
+        Returns decoded PIL image of a sprite in its original size, png file is read from disk only on first request.
+
+        # Parameters
+        ____________
+        :param sprite: str
+            path of the sprite inside resources/graphics directory without extension e.g. "gnome/gnome_e"
+        :return:
+            PIL Image of sprite
+        """
+        if sprite not in self.sources:
+            from PIL import Image
+
+            source = Image.open(f"{os.getcwd()}/../resources/graphics/{sprite}.png")
+            source.load()
+            self.sources[sprite] = source
+        return self.sources[sprite]
+
+    def get(self,
+            sprite: str,
+            block_size: int):
+        """
+        Returns tkinter image of a sprite resized to given block size. Png file is read from disk only on first
+        request of a sprite and resizing is done only on first request of a sprite in given block size.
+
+        # Parameters
+        ____________
+        :param sprite: str
+            path of the sprite inside resources/graphics directory without extension e.g. "gnome/gnome_e"
+        :param block_size: int
+            size of block in pixels
+        :return:
+            tkinter PhotoImage of sprite
+        """
+        key = (sprite, block_size)
+        if key in self.sprites:
+            self.sprites.move_to_end(key)
+            return self.sprites[key]
+
+        # PIL is imported only when sprites are drawn, so gameplay can be run without tkinter
+        from PIL import Image, ImageTk
+
+        image = ImageTk.PhotoImage(self.source(sprite).resize((block_size, block_size), Image.LANCZOS))
+        self.sprites[key] = image
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)
+        return image
+
+
+# cache shared by all blocks and players drawn by the game
+SPRITE_CACHE = SpriteCache()
+# tag of canvas items of drawn blocks, so all of them can be moved at once
+BLOCK_TAG = "block"
+
+
+def render_static_layer(level,
+                        block_size: int):
+    """
+    Renders static blocks of a level, i.e. walls and empty space, into one image. Empty space is rendered also under
+    blocks that can change, so it is visible when they are removed.
+
+    # Parameters
+    ____________
+    :param level: LevelMap class
+        rendered level
+    :param block_size: int
+        size of block in pixels
+    :return:
+        PIL Image of the level of size (x_size * block_size, y_size * block_size)
+    """
+    from PIL import Image
+
+    # sprites of empty space and wall are stacked, then every block picks one of them and blocks are laid out in rows
+    tiles = np.stack([np.asarray(SPRITE_CACHE.source(f"building_block/{BLOCK_TYPES[block_type]}")
+                                 .convert("RGB").resize((block_size, block_size), Image.LANCZOS))
+                      for block_type in (" ", "#")])
+    pixels = tiles[(level.cells == BLOCK_CODES["#"]).astype(np.intp)]
+    pixels = pixels.transpose(0, 2, 1, 3, 4).reshape(level.y_size * block_size, level.x_size * block_size, 3)
+    return Image.fromarray(pixels)
+
 
 class BuildingBlock:
     """
-    This abstract class is used to store information about basic building block of a maze.
+    This abstract class is a lightweight view of a basic building block of a maze. Information about the block is
+    not stored in the view, but read from and written to the grids of LevelMap that the block belongs to, so views
+    can be created whenever a single block is needed.
     # Attributes
     ___________
+    level: LevelMap class
+        level that the block belongs to
     x_coordinate: int
         x coordinate of block
     y_coordinate: int
@@ -34,40 +183,76 @@ class BuildingBlock:
     draw(buffer)
         draws building block on canvas pointed by buffer (should be called within Buffer class)
     """
+    __slots__ = ("level", "x_coordinate", "y_coordinate")
 
     def __init__(self,
+                 level,
                  x_coordinate: int,
-                 y_coordinate: int,
-                 accessible: bool,
-                 destructible: bool,
-                 is_exit_block: bool,
-                 block_type: str,
-                 is_open: bool = True):
+                 y_coordinate: int):
         """
         # Parameters
         ____________
+        :param level: LevelMap class
+            level that the block belongs to
         :param x_coordinate: int
             x coordinate of block
         :param y_coordinate: int
             y coordinate of block
-        :param accessible: bool
-            indicate if block is accessible by player
-        :param destructible: bool
-            indicate if block is destructible by player
-        :param is_exit_block: bool
-            indicate if block is an exit from a maze
-        :param block_type: str
-            type of block, can be equal to {"#", " ", "E", "I", "C"}
-        :param is_open: bool, default = True
-            indicates if doors are open, used only on door block
         """
+        self.level = level
         self.x_coordinate = x_coordinate
         self.y_coordinate = y_coordinate
-        self.accessible = accessible
-        self.is_exit_block = is_exit_block
-        self.destructible = destructible
-        self.block_type = block_type
-        self.is_open = is_open
+
+    @property
+    def accessible(self):
+        return bool(self.level.flags[self.y_coordinate, self.x_coordinate] & ACCESSIBLE)
+
+    @accessible.setter
+    def accessible(self, value):
+        self._set_flag(ACCESSIBLE, value)
+
+    @property
+    def destructible(self):
+        return bool(self.level.flags[self.y_coordinate, self.x_coordinate] & DESTRUCTIBLE)
+
+    @destructible.setter
+    def destructible(self, value):
+        self._set_flag(DESTRUCTIBLE, value)
+
+    @property
+    def is_exit_block(self):
+        return bool(self.level.flags[self.y_coordinate, self.x_coordinate] & EXIT)
+
+    @is_exit_block.setter
+    def is_exit_block(self, value):
+        self._set_flag(EXIT, value)
+
+    @property
+    def is_open(self):
+        return bool(self.level.flags[self.y_coordinate, self.x_coordinate] & OPEN)
+
+    @is_open.setter
+    def is_open(self, value):
+        self._set_flag(OPEN, value)
+
+    @property
+    def block_type(self):
+        return BLOCK_CHARACTERS[self.level.cells[self.y_coordinate, self.x_coordinate]]
+
+    @block_type.setter
+    def block_type(self, value):
+        self.level.cells[self.y_coordinate, self.x_coordinate] = BLOCK_CODES[value]
+
+    def _set_flag(self,
+                  flag: int,
+                  value: bool):
+        """
+        Sets or clears given bit flag of the block in flags grid of the level
+        """
+        if value:
+            self.level.flags[self.y_coordinate, self.x_coordinate] |= flag
+        else:
+            self.level.flags[self.y_coordinate, self.x_coordinate] &= ~flag & 0xFF
 
     def draw(self,
              buffer):
@@ -79,6 +264,15 @@ class BuildingBlock:
         """
         canvas_origin = buffer.canvas_origin
         
+        # blocks that never change are drawn in static layer, if buffer has one, so their items are removed when
+        # blocks become static, e.g. when coin is collected
+        if buffer.static_item is not None and STATIC_LOOKUP[self.level.cells[self.y_coordinate, self.x_coordinate]]:
+            item = buffer.canvas_items.pop((self.x_coordinate, self.y_coordinate), None)
+            if item is not None:
+                buffer.canvas.delete(item)
+                buffer.canvas.images.release(item)
+            return
+
         block_type = BLOCK_TYPES[self.block_type]
         # finding if exit is open or closed
         if block_type == "exit":
@@ -87,23 +281,29 @@ class BuildingBlock:
             else: 
                 block_type = "exit_closed"
 
-        image = ImageTk.PhotoImage(Image.open(f"{os.getcwd()}/../resources/graphics/building_block/{block_type}.png").
-                                   resize((int(buffer.block_size),
-                                           int(buffer.block_size)),
-                                   Image.ANTIALIAS))
+        image = SPRITE_CACHE.get(f"building_block/{block_type}", int(buffer.block_size))
         
-        # to prevent the image from being deleted by garbage collected save it in dict.
-        buffer.canvas.images[self.block_type+str(self.x_coordinate)+"_"+str(self.y_coordinate)] = image
-        buffer.canvas.create_image(self.x_coordinate*buffer.block_size + canvas_origin[0],
-                                   self.y_coordinate*buffer.block_size + canvas_origin[1],
-                                   image=buffer.canvas.images[self.block_type+str(self.x_coordinate)+"_" +
-                                                              str(self.y_coordinate)],
-                                   anchor="nw")
+        # block is drawn on canvas only once per level, afterwards only its image is swapped
+        item = buffer.canvas_items.get((self.x_coordinate, self.y_coordinate))
+        if item is None:
+            item = buffer.canvas.create_image(self.x_coordinate*buffer.block_size + canvas_origin[0],
+                                              self.y_coordinate*buffer.block_size + canvas_origin[1],
+                                              image=image,
+                                              anchor="nw",
+                                              tags=BLOCK_TAG)
+            buffer.canvas_items[(self.x_coordinate, self.y_coordinate)] = item
+        else:
+            buffer.canvas.itemconfigure(item, image=image)
+
+        # to prevent the image from being deleted by garbage collector save it in dict under canvas item id.
+        buffer.canvas.images[item] = image
 
 
 class LevelMap:
     """
     This abstract class is used to store information about level of maze and load this information from a text file.
+    Blocks of level are stored in two grids: grid of block type codes and grid of bit flags describing state of each
+    block, instead of one object per block.
 
     # Attributes
     ___________
@@ -115,23 +315,42 @@ class LevelMap:
         player starting coordinate x
     player_starting_coordinate_y: int = 0,
         player starting coordinate y
-    level_map=None,
-        level map stored as list of rows, where each row is a BuildingBlock class object
+    cells: ndarray = None,
+        uint8 ndarray of shape (y_size, x_size) with code of block type from BLOCK_CODES for each block
+    flags: ndarray = None,
+        uint8 ndarray of shape (y_size, x_size) with ACCESSIBLE, DESTRUCTIBLE, EXIT and OPEN bit flags for each block
     number_of_coins: int = 0
         number of coins left to collect to open exit in current level
+    exit_coordinate: tuple = None
+        (x, y) coordinates of exit block, None if level has no exit
+    coin_coordinates: set = None
+        set of (x, y) coordinates of coins left to collect in current level
 
     # Methods
     ___________
+    block(x: int, y: int)
+        Returns a view of a single block of level
+    from_grid(grid)
+        Creates a level from rows of characters kept in memory
+    from_generator(maze)
+        Creates a level from maze generated by MazeGenerator class
     load_from_file(path: str)
         Loads a level from text file which is in given directory
+    load_from_rows(rows: list)
+        Loads a level from list of rows of characters
+    load_from_characters(characters: ndarray)
+        Loads a level from grid of character codes
     """
     def __init__(self,
                  x_size: int = 0,
                  y_size: int = 0,
                  player_starting_coordinate_x: int = 0,
                  player_starting_coordinate_y: int = 0,
-                 level_map=None,
-                 number_of_coins: int = 0):
+                 cells=None,
+                 flags=None,
+                 number_of_coins: int = 0,
+                 exit_coordinate: tuple = None,
+                 coin_coordinates: set = None):
         """
         # Parameters
         ____________
@@ -143,24 +362,85 @@ class LevelMap:
             player starting coordinate x
         :param player_starting_coordinate_y: int = 0,
             player starting coordinate y
-        :param level_map=None,
-            level map stored as list of rows, where each row is a BuildingBlock class object
+        :param cells: ndarray = None,
+            uint8 ndarray of shape (y_size, x_size) with code of block type from BLOCK_CODES for each block
+        :param flags: ndarray = None,
+            uint8 ndarray of shape (y_size, x_size) with bit flags for each block
         :param number_of_coins: int = 0
             number of coins left to collect to open exit in current level
+        :param exit_coordinate: tuple = None
+            (x, y) coordinates of exit block
+        :param coin_coordinates: set = None
+            set of (x, y) coordinates of coins left to collect in current level
         """
         self.x_size = x_size
         self.y_size = y_size
         self.player_starting_coordinate_x = player_starting_coordinate_x
         self.player_starting_coordinate_y = player_starting_coordinate_y
-        self.level_map = level_map
+        self.cells = cells
+        self.flags = flags
         self.number_of_coins = number_of_coins
+        self.exit_coordinate = exit_coordinate
+        self.coin_coordinates = coin_coordinates if coin_coordinates is not None else set()
+
+    def block(self,
+              x: int,
+              y: int):
+        """
+        Returns a view of a single block of level, which can be used where BuildingBlock class is needed.
+
+        # Parameters
+        ____________
+        :param x: int
+            x coordinate of block
+        :param y: int
+            y coordinate of block
+        :return:
+            BuildingBlock class object
+        """
+        return BuildingBlock(self, x, y)
+
+    @classmethod
+    def from_grid(cls,
+                  grid):
+        """
+        Creates level from rows of characters kept in memory, using the same characters as level text files.
+
+        # Parameters
+        ____________
+        :param grid:
+            list of rows of level, where each row is a string or a list of characters, or ndarray of characters
+        :return:
+            LevelMap class object
+        """
+        level = cls()
+        if isinstance(grid, np.ndarray):
+            level.load_from_characters(grid.astype("S1").view(np.uint8))
+        else:
+            level.load_from_rows(["".join(row) for row in grid])
+        return level
+
+    @classmethod
+    def from_generator(cls,
+                       maze):
+        """
+        Creates level directly from maze generated by MazeGenerator class without saving it to a file.
+
+        # Parameters
+        ____________
+        :param maze: MazeGenerator class
+            generated maze with already added special objects
+        :return:
+            LevelMap class object
+        """
+        return cls.from_grid(maze.level_map)
 
     def load_from_file(self,
                        path: str):
         """
         Loads level from .txt file. First row of file has width and height of level described in number of blocks.
-        Next rows describe consecutive rows of level. "#" character describes wall, " " describes empty space,
-        accessible by player, "I" describes destructible block and "C" describes coin.
+        Next rows describe consecutive rows of level, in format described in load_from_rows method. Files with .lvl
+        extension are loaded as binary level files described in binary_level module.
 
         # Parameters
         loads text file that has specific format used by game
@@ -168,47 +448,75 @@ class LevelMap:
         :param path:
             path to textfile that will be loaded to LevelMap class
         """
-        # clear current level
-        self.level_map = []
-        level_file = open(path, 'r')
-        lines = level_file.readlines()
-        for i, line in enumerate(lines):
-            # first line always store map size
-            if i == 0:
-                self.x_size = int(line.rstrip().split(",")[0])
-                self.y_size = int(line.rstrip().split(",")[1])
-
-            # the rest of rows are describing level map
-            else:
-                row = line.rstrip()
-                if any(el == "P" for el in row):
-                    self.player_starting_coordinate_x = row.index("P")
-                    self.player_starting_coordinate_y = i-1
-                    row = row.replace("P", " ")
-                if any(el == "E" for el in row):
-                    exit_coord = (row.index("E"), i-1)
-
-                # counts total number of coins in loaded level
-                self.number_of_coins = self.number_of_coins + line.count("C")
-
-                block_list = [BuildingBlock(x_coordinate=x,
-                                            y_coordinate=i-1,
-                                            accessible=False if block in ["#", "I"] else True,
-                                            destructible=True if block == "I" else False,
-                                            is_exit_block=True if block == "E" else False,
-                                            block_type=block) for x, block in enumerate(row)]
-                self.level_map.append(block_list)
+        if path.endswith(".lvl"):
+            from gameplay.binary_level import load_binary_level
+            load_binary_level(path, self)
+            return
+
+        with open(path, 'r') as level_file:
+            lines = level_file.readlines()
+
+        # first line always store map size, the rest of rows are describing level map
+        x_size = int(lines[0].rstrip().split(",")[0])
+        self.load_from_rows([line.rstrip().ljust(x_size) for line in lines[1:]])
+
+    def load_from_rows(self,
+                       rows: list):
+        """
+        Loads level from list of rows. "#" character describes wall, " " describes empty space, accessible by player,
+        "I" describes destructible block, "C" describes coin, "P" describes player starting position and "E" describes
+        exit. Rows shorter than the longest row are filled with empty space.
+
+        # Parameters
+        ____________
+        :param rows: list
+            list of strings describing consecutive rows of level
+        """
+        x_size = max(len(row) for row in rows)
+        characters = "".join(row.ljust(x_size) for row in rows).encode("ascii")
+        self.load_from_characters(np.frombuffer(characters, dtype=np.uint8).reshape(len(rows), x_size))
+
+    def load_from_characters(self,
+                             characters):
+        """
+        Loads level from grid of ASCII codes of characters describing blocks, in format described in load_from_rows
+        method.
+
+        # Parameters
+        ____________
+        :param characters: ndarray
+            uint8 ndarray of shape (y_size, x_size) with ASCII code of character of each block
+        """
+        characters = characters.copy()
+        self.y_size, self.x_size = characters.shape
+
+        # player starting position is an empty space
+        starting_position = np.argwhere(characters == ord("P"))
+        if len(starting_position):
+            self.player_starting_coordinate_y, self.player_starting_coordinate_x = starting_position[0].tolist()
+            characters[characters == ord("P")] = ord(" ")
+
+        self.cells = CODE_LOOKUP[characters]
+        if (self.cells == 255).any():
+            raise ValueError(f"Unknown block in level: {bytes(characters[self.cells == 255][:1])}")
+        self.flags = FLAG_LOOKUP[self.cells]
+
+        # remembers positions of coins and exit, so they don't have to be searched for during the game
+        coins_y, coins_x = np.nonzero(self.cells == BLOCK_CODES["C"])
+        self.coin_coordinates = set(zip(coins_x.tolist(), coins_y.tolist()))
+        self.number_of_coins = len(self.coin_coordinates)
+        exit_position = np.argwhere(self.cells == BLOCK_CODES["E"])
+        self.exit_coordinate = tuple(exit_position[0, ::-1].tolist()) if len(exit_position) else None
 
         # if map has coins to collect, changes exit block to be closed and unaccessible for player
-        if self.number_of_coins:
-            self.level_map[exit_coord[1]][exit_coord[0]].is_open = False
-            self.level_map[exit_coord[1]][exit_coord[0]].accessible = False
+        if self.number_of_coins and self.exit_coordinate:
+            self.flags[self.exit_coordinate[1], self.exit_coordinate[0]] &= ~(OPEN | ACCESSIBLE) & 0xFF
 
 
 class Player:
     """
-    This abstract class is used to store information about player. It also has methods that if buffer is provided allows
-    to perform all the operation that player can do.
+    This abstract class is used to store information about player. Actions of a player are applied to the level by
+    GameState class, this class only draws the player if buffer is provided.
 
     # Attributes
     ___________
@@ -225,15 +533,11 @@ class Player:
         name of a player that if game is finished is passed to leaderboard
     # Methods
     ___________
-    move(buffer, move_x: int, move_y: int)
-        changes position of player on map
-    open_exit(buffer)
-        opens exit if player collected all coins
-    destroy_block(buffer)
-        destroys block player is facing if it is possible
     draw(buffer)
         draws player on canavs
     """
+    __slots__ = ("current_coordinate_x", "current_coordinate_y", "direction", "player_name", "coins_collected")
+
     def __init__(self,
                  player_name: str,
                  player_starting_coordinate_x: int,
@@ -264,99 +568,6 @@ class Player:
         self.player_name = player_name
         self.coins_collected = coins_collected
 
-    def move(self,
-             buffer,
-             move_x: int,
-             move_y: int):
-        """
-        This method moves a player around level and changes abstract classes variables
-
-        # Parameters
-        ____________
-        :param buffer
-            Buffer class that stores currently played level
-        :param move_x: int
-            Parameter specifying how many blocks should player move on the x axis, positive numbers indicate movement to
-            the east direction, negative to the west direction
-        :param move_y: int
-            Parameter specifying how many blocks should player move on the y axis, positive numbers indicate movement to
-            the north direction, negative to the south direction
-        """
-        if (move_x, move_y) != self.direction:
-            self.direction = (move_x, move_y)
-
-        # check whether movement finishes out of map that a player is currently on
-        if self.current_coordinate_y + move_y > buffer.level.y_size - 1 or \
-           self.current_coordinate_y + move_y < 0 or \
-           self.current_coordinate_x + move_x > buffer.level.x_size - 1 or \
-           self.current_coordinate_x + move_x < 0:
-            return 0
-
-        # check whether movement finishes on accessible block
-        target_block = buffer.level.level_map[self.current_coordinate_y + move_y][self.current_coordinate_x + move_x]
-        if not target_block.accessible:
-            return 0
-
-        # check whether movement finishes on a coin block
-        if target_block.block_type == "C":
-            pygame.mixer.Channel(1).play(pygame.mixer.Sound(f"{os.getcwd()}/../resources/sounds/coin_pick.wav"))
-            self.coins_collected = self.coins_collected + 1
-            buffer.level.number_of_coins = buffer.level.number_of_coins - 1
-            target_block.block_type = " "
-            if buffer.level.number_of_coins == 0:
-                self.open_exit(buffer)
-                pygame.mixer.Channel(0).play(pygame.mixer.Sound(f"{os.getcwd()}/../resources/sounds/door_unlock.wav"))
-
-        # adding current block to changes
-        current_block = buffer.level.level_map[self.current_coordinate_y][self.current_coordinate_x]
-        buffer.not_applied_changes.add(current_block)
-
-        # updating player coordinates
-        self.current_coordinate_y = self.current_coordinate_y + move_y
-        self.current_coordinate_x = self.current_coordinate_x + move_x
-
-    @staticmethod
-    def open_exit(buffer):
-        """
-        This method opens the doors when its run
-        # Parameters
-        ____________
-        :param buffer
-            Buffer class that stores currently played level
-        """
-        for y, row in enumerate(buffer.level.level_map):
-            for x, block in enumerate(row):
-                if block.is_exit_block == 1:
-                    block.is_open = True
-                    block.accessible = True
-                    changed_block = block
-        buffer.not_applied_changes.add(changed_block)
-
-    def destroy_block(self,
-                      buffer):
-        """
-        This method destroys a block if it is possible that a player is currently facing
-        # Parameters
-        ____________
-        :param buffer
-            Buffer class that stores currently played level
-        """
-
-        # check whether block is destructible
-        target_block = buffer.level.level_map[self.current_coordinate_y + self.direction[1]]\
-                                             [self.current_coordinate_x + self.direction[0]]
-        if not target_block.destructible:
-            return 0
-
-        target_block.accessible = True
-        target_block.destructible = False
-        target_block.block_type = " "
-
-        pygame.mixer.Channel(0).play(pygame.mixer.Sound(f"{os.getcwd()}/../resources/sounds/digging.wav"))
-
-        # pass changed block to buffer
-        buffer.not_applied_changes.add(target_block)
-
     def draw(self,
              buffer):
         """
@@ -373,14 +584,17 @@ class Player:
                        "(-1, 0)": "gnome_w"}
 
         canvas_origin = buffer.canvas_origin
-        image = ImageTk.PhotoImage(Image.open(f"{os.getcwd()}/../resources/graphics/gnome/"
-                                              f"{gnome_image[str(self.direction)]}.png").
-                                   resize((int(buffer.block_size), int(buffer.block_size)),
-                                   Image.ANTIALIAS))
-
-        # to prevent the image from being deleted by garbage collector we save it in dict.
-        buffer.canvas.images["gnome"] = image
-        buffer.canvas.create_image(self.current_coordinate_x * buffer.block_size + canvas_origin[0],
-                                   self.current_coordinate_y * buffer.block_size + canvas_origin[1],
-                                   image=buffer.canvas.images["gnome"],
-                                   anchor="nw")
+        image = SPRITE_CACHE.get(f"gnome/{gnome_image[str(self.direction)]}", int(buffer.block_size))
+
+        x = self.current_coordinate_x * buffer.block_size + canvas_origin[0]
+        y = self.current_coordinate_y * buffer.block_size + canvas_origin[1]
+
+        # player is drawn on canvas only once per level, afterwards it is moved and its image is swapped
+        if buffer.player_item is None:
+            buffer.player_item = buffer.canvas.create_image(x, y, image=image, anchor="nw")
+        else:
+            buffer.canvas.coords(buffer.player_item, x, y)
+            buffer.canvas.itemconfigure(buffer.player_item, image=image)
+
+        # to prevent the image from being deleted by garbage collector we save it in dict under canvas item id.
+        buffer.canvas.images[buffer.player_item] = image
@@ -0,0 +1,369 @@
+import heapq
+from itertools import permutations
+
+import numpy as np
+
+from gameplay.modules import ACCESSIBLE, DESTRUCTIBLE, EXIT
+
+# number of coins up to which coins-then-exit route is found exactly, bigger sets of coins are ordered heuristically
+EXACT_ROUTE_COINS = 10
+
+# returned as distance to blocks that can't be reached
+UNREACHABLE = -1
+
+# additional actions needed to enter a destructible block when player may have to turn towards it: turning and digging
+DIG_COST = 2
+
+
+def _costs(level,
+           dig_cost: int = None):
+    """
+    Creates flat list of costs of entering every block of level padded with one block of walls on every side, so
+    neighbours of blocks can be found without checking bounds. Exit is always enterable, even if it is closed.
+
+    # Parameters
+    ____________
+    :param level: LevelMap class
+        level to be solved
+    :param dig_cost: int, default = None
+        number of additional actions needed to enter a destructible block, destructible blocks can't be entered if not
+        given
+    :return:
+        list of costs of padded blocks, 0 for blocks that can't be entered
+    """
+    costs = np.zeros((level.y_size + 2, level.x_size + 2), dtype=np.int64)
+    costs[1:-1, 1:-1][level.flags & (ACCESSIBLE | EXIT) != 0] = 1
+    if dig_cost is not None:
+        costs[1:-1, 1:-1][level.flags & DESTRUCTIBLE != 0] = 1 + dig_cost
+    return costs.ravel().tolist()
+
+
+def _padded_index(level,
+                  coordinate: tuple):
+    """
+    Returns index of block with (x, y) coordinates in list of padded blocks
+    """
+    x, y = coordinate
+    if not (0 <= x < level.x_size and 0 <= y < level.y_size):
+        raise ValueError(f"Block {coordinate} is outside of level of size {level.x_size}x{level.y_size}")
+    return (y + 1) * (level.x_size + 2) + x + 1
+
+
+def _search(costs: list,
+            width: int,
+            start: int,
+            targets: set = None):
+    """
+    Finds distances from start block to all blocks with Dial's algorithm, buckets of blocks at equal distance are
+    processed in order of distance, which for costs equal to 1 is breadth first search.
+
+    # Parameters
+    ____________
+    :param costs: list
+        costs of entering padded blocks
+    :param width: int
+        width of padded level
+    :param start: int
+        index of start block
+    :param targets: set, default = None
+        indexes of blocks that distance is needed to, search stops as soon as distances to all of them are known, all
+        blocks are searched if not given
+    :return:
+        list of distances to padded blocks, UNREACHABLE for blocks that can't be reached or weren't searched
+    """
+    distances = [UNREACHABLE] * len(costs)
+    distances[start] = 0
+    offsets = (-1, 1, -width, width)
+    remaining = set(targets) if targets is not None else None
+    buckets = [[start]]
+    distance = 0
+    while distance < len(buckets):
+        for block in buckets[distance]:
+            # block is left in a bucket of bigger distance after shorter way to it was found
+            if distances[block] != distance:
+                continue
+            if remaining is not None:
+                remaining.discard(block)
+                if not remaining:
+                    return distances
+            for offset in offsets:
+                neighbour = block + offset
+                cost = costs[neighbour]
+                if not cost:
+                    continue
+                new_distance = distance + cost
+                if distances[neighbour] == UNREACHABLE or new_distance < distances[neighbour]:
+                    distances[neighbour] = new_distance
+                    while len(buckets) <= new_distance:
+                        buckets.append([])
+                    buckets[new_distance].append(neighbour)
+        buckets[distance] = None
+        distance = distance + 1
+    return distances
+
+
+def distance_field(level,
+                   start: tuple = None,
+                   dig_cost: int = None):
+    """
+    Computes number of actions needed to get from start block to every block of level.
+
+    # Parameters
+    ____________
+    :param level: LevelMap class
+        level to be solved
+    :param start: tuple, default = None
+        (x, y) coordinates of start block, player starting position if not given
+    :param dig_cost: int, default = None
+        number of additional actions needed to enter a destructible block (turning towards it and digging),
+        destructible blocks can't be entered if not given
+    :return:
+        int32 ndarray of shape (y_size, x_size) with distance to every block, UNREACHABLE for blocks that can't be
+        reached
+    """
+    if start is None:
+        start = (level.player_starting_coordinate_x, level.player_starting_coordinate_y)
+    distances = _search(_costs(level, dig_cost), level.x_size + 2, _padded_index(level, start))
+    return np.array(distances, dtype=np.int32).reshape(level.y_size + 2, level.x_size + 2)[1:-1, 1:-1]
+
+
+def shortest_path(level,
+                  start: tuple,
+                  goal: tuple,
+                  dig_cost: int = None):
+    """
+    Finds the shortest path between two blocks with A* search guided by Manhattan distance to the goal.
+
+    # Parameters
+    ____________
+    :param level: LevelMap class
+        level to be solved
+    :param start: tuple
+        (x, y) coordinates of start block
+    :param goal: tuple
+        (x, y) coordinates of goal block
+    :param dig_cost: int, default = None
+        number of additional actions needed to enter a destructible block, destructible blocks can't be entered if not
+        given
+    :return:
+        list of (x, y) coordinates of consecutive blocks from start to goal, None if goal can't be reached
+    """
+    costs = _costs(level, dig_cost)
+    width = level.x_size + 2
+    start_index = _padded_index(level, start)
+    goal_index = _padded_index(level, goal)
+    goal_y, goal_x = divmod(goal_index, width)
+
+    distances = {start_index: 0}
+    previous = {start_index: None}
+    queue = [(0, 0, start_index)]
+    while queue:
+        _, distance, block = heapq.heappop(queue)
+        if block == goal_index:
+            break
+        if distance != distances[block]:
+            continue
+        for offset in (-1, 1, -width, width):
+            neighbour = block + offset
+            cost = costs[neighbour]
+            if not cost:
+                continue
+            new_distance = distance + cost
+            if new_distance < distances.get(neighbour, new_distance + 1):
+                distances[neighbour] = new_distance
+                previous[neighbour] = block
+                y, x = divmod(neighbour, width)
+                heapq.heappush(queue, (new_distance + abs(x - goal_x) + abs(y - goal_y), new_distance, neighbour))
+    else:
+        return None
+
+    path = []
+    block = goal_index
+    while block is not None:
+        y, x = divmod(block, width)
+        path.append((x - 1, y - 1))
+        block = previous[block]
+    return path[::-1]
+
+
+def plan_route(level,
+               start: tuple = None,
+               dig_cost: int = None):
+    """
+    Plans the shortest route that collects all coins left in level and then goes to the exit. Distances between
+    start, coins and exit are found with one search from the exit and one from start and every coin, which stops when
+    distances to all following coins are known, as distance between two points is the same in both directions. Order
+    of coins is chosen by solving travelling salesman problem: exactly with dynamic programming for up to
+    EXACT_ROUTE_COINS coins, and with nearest neighbour order improved by 2-opt for more coins. No leg of the route
+    goes through the exit, which is closed until all coins are collected. Blocks dug on the way are counted as
+    destructible on every leg of the route, so with digging allowed the route length is an upper bound.
+
+    # Parameters
+    ____________
+    :param level: LevelMap class
+        level to be solved
+    :param start: tuple, default = None
+        (x, y) coordinates of start block, player starting position if not given
+    :param dig_cost: int, default = None
+        number of additional actions needed to enter a destructible block, destructible blocks can't be entered if not
+        given
+    :return:
+        tuple of list of (x, y) coordinates of coins in order of collecting and number of moves of the route, None if
+        level has no exit or some coin or the exit can't be reached
+    """
+    if level.exit_coordinate is None:
+        return None
+    if start is None:
+        start = (level.player_starting_coordinate_x, level.player_starting_coordinate_y)
+
+    coins = sorted(level.coin_coordinates)
+    costs = _costs(level, dig_cost)
+    width = level.x_size + 2
+    points = [_padded_index(level, point) for point in [start] + coins]
+    exit_index = _padded_index(level, level.exit_coordinate)
+    # exit is closed until the last coin is collected and ends the level when entered, so it is only the end of the
+    # last leg and no leg goes through it, searches from the exit still start on it
+    costs[exit_index] = 0
+
+    # start, coins and exit are entered at cost 1, so distances are symmetric
+    field = _search(costs, width, exit_index)
+    to_exit = [field[point] for point in points]
+    if UNREACHABLE in to_exit:
+        return None
+
+    # distances[i][j] is distance from i-th point to j-th coin or to the exit for j equal to number of coins, point 0 is
+    # start and point i > 0 is (i-1)-th coin
+    distances = [[0] * len(coins) + [to_exit[i]] for i in range(len(points))]
+    for i, point in enumerate(points[:-1]):
+        following = points[i + 1:]
+        field = _search(costs, width, point, set(following))
+        for j, coin in enumerate(following, start=i + 1):
+            distances[i][j - 1] = field[coin]
+            if i > 0:
+                distances[j][i - 1] = field[coin]
+
+    if len(coins) <= EXACT_ROUTE_COINS:
+        order, length = _exact_order(distances)
+    else:
+        order, length = _heuristic_order(distances)
+    return [coins[coin] for coin in order], length
+
+
+def par_steps(level,
+              dig_cost: int = DIG_COST):
+    """
+    Returns number of actions of the shortest found route that collects all coins and goes through the exit, which
+    is used as par of the level.
+
+    # Parameters
+    ____________
+    :param level: LevelMap class
+        level to be solved
+    :param dig_cost: int, default = DIG_COST
+        number of additional actions needed to enter a destructible block, destructible blocks can't be entered if
+        None
+    :return:
+        number of actions, None if level can't be finished
+    """
+    route = plan_route(level, dig_cost=dig_cost)
+    return route[1] if route is not None else None
+
+
+def _route_length(distances: list,
+                  order: list):
+    """
+    Returns length of route from start through coins in given order to the exit
+    """
+    length = 0
+    point = 0
+    for coin in order:
+        length = length + distances[point][coin]
+        point = coin + 1
+    return length + distances[point][-1]
+
+
+def _exact_order(distances: list):
+    """
+    Finds the best order of coins with Held-Karp dynamic programming over subsets of collected coins.
+
+    # Parameters
+    ____________
+    :param distances: list
+        distances between start, coins and exit as described in plan_route
+    :return:
+        tuple of list of indexes of coins in order of collecting and length of the route
+    """
+    number_of_coins = len(distances) - 1
+    if number_of_coins <= 3:
+        order = min(permutations(range(number_of_coins)), key=lambda order: _route_length(distances, order))
+        return list(order), _route_length(distances, order)
+
+    # best[subset][last] is length of the shortest route from start collecting coins of subset and ending on last
+    best = [[None] * number_of_coins for _ in range(1 << number_of_coins)]
+    previous = [[None] * number_of_coins for _ in range(1 << number_of_coins)]
+    for coin in range(number_of_coins):
+        best[1 << coin][coin] = distances[0][coin]
+    for subset in range(1, 1 << number_of_coins):
+        for last in range(number_of_coins):
+            length = best[subset][last]
+            if length is None:
+                continue
+            row = distances[last + 1]
+            for coin in range(number_of_coins):
+                if subset & (1 << coin):
+                    continue
+                new_subset = subset | (1 << coin)
+                new_length = length + row[coin]
+                if best[new_subset][coin] is None or new_length < best[new_subset][coin]:
+                    best[new_subset][coin] = new_length
+                    previous[new_subset][coin] = last
+
+    full = (1 << number_of_coins) - 1
+    last = min(range(number_of_coins), key=lambda coin: best[full][coin] + distances[coin + 1][-1])
+    length = best[full][last] + distances[last + 1][-1]
+    order = []
+    subset = full
+    while last is not None:
+        order.append(last)
+        subset, last = subset & ~(1 << last), previous[subset][last]
+    return order[::-1], length
+
+
+def _heuristic_order(distances: list):
+    """
+    Finds a good order of coins by visiting the nearest coin first and then reversing parts of the route as long as
+    it gets shorter.
+
+    # Parameters
+    ____________
+    :param distances: list
+        distances between start, coins and exit as described in plan_route
+    :return:
+        tuple of list of indexes of coins in order of collecting and length of the route
+    """
+    left = set(range(len(distances) - 1))
+    order = []
+    point = 0
+    while left:
+        coin = min(left, key=lambda coin: distances[point][coin])
+        left.remove(coin)
+        order.append(coin)
+        point = coin + 1
+
+    # reversing part of the route changes only its two outer edges, as distances are symmetric
+    exit_index = len(distances) - 1
+    length = _route_length(distances, order)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(len(order) - 1):
+            before = order[i - 1] + 1 if i > 0 else 0
+            for j in range(i + 1, len(order)):
+                after = order[j + 1] if j + 1 < len(order) else exit_index
+                change = distances[before][order[j]] + distances[order[i] + 1][after] - \
+                    distances[before][order[i]] - distances[order[j] + 1][after]
+                if change < 0:
+                    order[i:j + 1] = order[i:j + 1][::-1]
+                    length = length + change
+                    improved = True
+    return order, length
@@ -0,0 +1,185 @@
+"""
+Command line tool generating many levels at once in parallel processes and saving them as level text files.
+
+Every level is generated from its own seed, equal to base seed plus number of the level, so any level of a pack can be
+generated again from its seed, and the same command always gives the same pack. Size and numbers of objects of every
+level are drawn from given ranges. With --pack option levels are saved in one level pack instead of separate files.
+Run from maze_game directory, e.g.:
+
+    python generate_levels.py 10000 --width 13:51 --height 9:51 --coins 0:20 --obstacles 0:30 --seed 1 \
+        --output ../resources/levels/pack
+    python generate_levels.py 10000 --seed 1 --pack ../resources/levels/packs/generated.pack
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from gameplay.binary_level import COMPRESSIONS
+from gameplay.level_pack import write_level_pack
+from gameplay.modules import LevelMap
+from maze_generating_function.level_queue import generate_maze
+from maze_generating_function.maze_carving import ALGORITHMS
+
+# number of levels generated by a process in one task, big enough for communication between processes to be negligible
+LEVELS_PER_TASK = 64
+# minimal width and height of a level, smaller mazes have no room for corridors
+MIN_LEVEL_SIZE = 5
+
+
+def parse_range(text: str):
+    """
+    Parses range of integers given as "minimum:maximum" or a single integer.
+
+    # Parameters
+    ____________
+    :param text: str
+        range given in command line
+    :return:
+        tuple of minimal and maximal value
+    """
+    try:
+        minimum, _, maximum = text.partition(":")
+        minimum = int(minimum)
+        maximum = int(maximum) if maximum else minimum
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Range should be given as minimum:maximum, not {text}")
+    if minimum > maximum:
+        raise argparse.ArgumentTypeError(f"Range {text} is empty")
+    return minimum, maximum
+
+
+def parse_size_range(text: str):
+    """
+    Parses range of level sizes given as "minimum:maximum" or a single integer. Levels have odd sizes, so the range
+    is narrowed to odd sizes inside it.
+
+    # Parameters
+    ____________
+    :param text: str
+        range given in command line
+    :return:
+        tuple of minimal and maximal odd size
+    """
+    minimum, maximum = parse_range(text)
+    if minimum < MIN_LEVEL_SIZE:
+        raise argparse.ArgumentTypeError(f"Level size should be at least {MIN_LEVEL_SIZE}, not {minimum}")
+    minimum, maximum = minimum | 1, maximum - 1 + maximum % 2
+    if minimum > maximum:
+        raise argparse.ArgumentTypeError(f"Range {text} has no odd size")
+    return minimum, maximum
+
+
+def generate_levels(first_seed: int,
+                    number_of_levels: int,
+                    settings: dict):
+    """
+    Generates levels with consecutive seeds and saves them in output directory, run in worker processes. If levels
+    are saved in a level pack, they are returned to the main process instead.
+
+    # Parameters
+    ____________
+    :param first_seed: int
+        seed of the first level
+    :param number_of_levels: int
+        number of generated levels
+    :param settings: dict
+        parsed command line arguments
+    :return:
+        list of par of generated levels, None for levels that can't be finished, or list of (name, ndarray of level
+        characters, par) tuples if levels are saved in a level pack
+    """
+    pars = []
+    for seed in range(first_seed, first_seed + number_of_levels):
+        # size and numbers of objects are drawn from the same seed as the level itself
+        rng = np.random.default_rng(seed)
+        # sizes are odd, so they are drawn from odd numbers of their ranges
+        width, height = (minimum + 2 * int(rng.integers((maximum - minimum) // 2 + 1)) for minimum, maximum in
+                         (settings["width"], settings["height"]))
+        coins, obstacles = (int(rng.integers(minimum, maximum + 1)) for minimum, maximum in
+                            (settings["coins"], settings["obstacles"]))
+        maze, par_steps, _ = generate_maze(level_width=width,
+                                           level_height=height,
+                                           objects={"interactive_block": obstacles, "coin": coins},
+                                           algorithm=settings["algorithm"],
+                                           min_par_steps=settings["min_par"],
+                                           max_par_steps=settings["max_par"],
+                                           attempts=settings["attempts"],
+                                           seed=rng)
+        if settings["pack"]:
+            pars.append((f"{settings['prefix']}{seed}", maze.level_map, par_steps))
+        else:
+            maze.save_to_file(f"{settings['prefix']}{seed}", settings["output"])
+            pars.append(par_steps)
+    return pars
+
+
+def packed_levels(results,
+                  pars: list):
+    """
+    Creates levels from level characters returned by worker processes, so they are written to level pack as soon as
+    they are generated, keeping only their par.
+
+    # Parameters
+    ____________
+    :param results:
+        iterable of (name, ndarray of level characters, par) tuples returned by generate_levels function
+    :param pars: list
+        list to which par of every level is appended
+    :return:
+        generator of (name, LevelMap class, par) tuples
+    """
+    for name, level_map, par_steps in results:
+        pars.append(par_steps)
+        yield name, LevelMap.from_grid(level_map), par_steps
+
+
+def main(arguments: list = None):
+    parser = argparse.ArgumentParser(description="Generates levels in parallel processes.")
+    parser.add_argument("levels", type=int, help="number of generated levels")
+    parser.add_argument("--width", type=parse_size_range, default=(17, 17), help="range of level width, e.g. 13:51")
+    parser.add_argument("--height", type=parse_size_range, default=(15, 15), help="range of level height, e.g. 9:51")
+    parser.add_argument("--coins", type=parse_range, default=(9, 9), help="range of number of coins")
+    parser.add_argument("--obstacles", type=parse_range, default=(20, 20),
+                        help="range of number of destructible blocks")
+    parser.add_argument("--algorithm", choices=list(ALGORITHMS), default="recursive_backtracker")
+    parser.add_argument("--min-par", type=int, default=0, help="minimal par of a level")
+    parser.add_argument("--max-par", type=int, default=None, help="maximal par of a level")
+    parser.add_argument("--attempts", type=int, default=5,
+                        help="number of mazes generated before a level with par out of bounds is accepted")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first level")
+    parser.add_argument("--output", default=f"{os.getcwd()}/../resources/levels", help="output directory")
+    parser.add_argument("--prefix", default="level_", help="prefix of level file names, followed by level seed")
+    parser.add_argument("--pack", default=None, help="path of level pack, levels are saved in it if given")
+    parser.add_argument("--compression", choices=list(COMPRESSIONS), default="zlib",
+                        help="compression of levels saved in level pack")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="number of processes")
+    settings = vars(parser.parse_args(arguments))
+    os.makedirs(os.path.dirname(os.path.abspath(settings["pack"])) if settings["pack"] else settings["output"],
+                exist_ok=True)
+
+    tasks = [(first_seed, min(LEVELS_PER_TASK, settings["seed"] + settings["levels"] - first_seed))
+             for first_seed in range(settings["seed"], settings["seed"] + settings["levels"], LEVELS_PER_TASK)]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=settings["jobs"]) as executor:
+        results = (result for task_results in executor.map(generate_levels, *zip(*tasks), [settings] * len(tasks))
+                   for result in task_results)
+        if settings["pack"]:
+            pars = []
+            write_level_pack(settings["pack"], packed_levels(results, pars), settings["compression"])
+        else:
+            pars = list(results)
+    elapsed = time.perf_counter() - start
+
+    rejected = sum(par is None or par < settings["min_par"] or
+                   (settings["max_par"] is not None and par > settings["max_par"]) for par in pars)
+    print(f"generated {len(pars)} levels in {elapsed:.2f} s with {settings['jobs']} processes, "
+          f"{len(pars) / elapsed:.0f} levels/s")
+    if rejected:
+        print(f"{rejected} levels have par out of bounds")
+
+
+if __name__ == "__main__":
+    main()
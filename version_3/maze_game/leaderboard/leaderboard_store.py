@@ -0,0 +1,110 @@
+import csv
+import heapq
+import os
+import tempfile
+from itertools import count
+
+# Number of best scores kept in leaderboard
+LEADERBOARD_SIZE = 9
+
+
+class LeaderboardStore:
+    """
+    This abstract class stores best scores of players and saves them in a csv file with rows of player name and score.
+    Best scores are kept in memory in a min-heap of fixed size, so adding a score takes O(log N) time and the file is
+    read only once.
+
+    # Attributes
+    ___________
+    path: str
+        path to csv file where leaderboard is saved
+    size: int
+        number of best scores kept in leaderboard
+    entries: list
+        min-heap of (score, -order, name) tuples, where order is a number of score in order of adding, so the score
+        added earlier stays higher when scores are equal
+
+    # Methods
+    ___________
+    load()
+        loads leaderboard from csv file
+    add(name: str, score: int)
+        adds score of a player to leaderboard if it is one of the best scores
+    top()
+        returns list of best scores in descending order
+    save()
+        saves leaderboard to csv file
+    """
+    def __init__(self,
+                 path: str = None,
+                 size: int = LEADERBOARD_SIZE):
+        """
+        # Parameters
+        ____________
+        :param path: str, default = None
+            path to csv file where leaderboard is saved, resources/leaderboard/leaderboard.csv if not given
+        :param size: int, default = LEADERBOARD_SIZE
+            number of best scores kept in leaderboard
+        """
+        self.path = path or f"{os.getcwd()}/../resources/leaderboard/leaderboard.csv"
+        self.size = size
+        self.entries = []
+        self._order = count()
+        self.load()
+
+    def load(self):
+        """
+        Loads leaderboard from csv file, if file doesn't exist leaderboard is empty.
+        """
+        self.entries = []
+        if not os.path.isfile(self.path):
+            return
+        with open(self.path, newline="") as leaderboard_file:
+            for row in csv.reader(leaderboard_file):
+                if len(row) >= 2:
+                    self.add(row[0], int(float(row[1])))
+
+    def add(self,
+            name: str,
+            score: int):
+        """
+        Adds score of a player to leaderboard if it is one of the best scores.
+
+        # Parameters
+        ____________
+        :param name: str
+            name of a player
+        :param score: int
+            score obtained by a player
+        :return:
+            True if score was added to leaderboard, False otherwise
+        """
+        entry = (score, -next(self._order), name)
+        if len(self.entries) < self.size:
+            heapq.heappush(self.entries, entry)
+            return True
+        return heapq.heappushpop(self.entries, entry) is not entry
+
+    def top(self):
+        """
+        Returns best scores in leaderboard.
+
+        :return:
+            list of (name, score) tuples in descending order of score
+        """
+        return [(name, score) for score, _, name in sorted(self.entries, reverse=True)]
+
+    def save(self):
+        """
+        Saves leaderboard to csv file. Leaderboard is written to a temporary file first, which then replaces the
+        previous file, so the file is never left partially written.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w", newline="") as temporary_file:
+                csv.writer(temporary_file, lineterminator="\n").writerows(self.top())
+            os.replace(temporary_path, self.path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
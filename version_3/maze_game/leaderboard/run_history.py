@@ -0,0 +1,228 @@
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    level TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    coins INTEGER NOT NULL,
+    time REAL NOT NULL,
+    score INTEGER NOT NULL,
+    timestamp REAL NOT NULL,
+    seeds TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_level_score ON runs (level, score DESC);
+CREATE INDEX IF NOT EXISTS runs_level_mode_score ON runs (level, mode, score DESC);
+CREATE INDEX IF NOT EXISTS runs_mode_score ON runs (mode, score DESC);
+CREATE INDEX IF NOT EXISTS runs_score ON runs (score DESC);
+CREATE INDEX IF NOT EXISTS runs_player_score ON runs (player, score DESC);
+CREATE INDEX IF NOT EXISTS runs_player_level_score ON runs (player, level, score DESC);
+CREATE INDEX IF NOT EXISTS runs_player_mode ON runs (player, mode, id DESC);
+"""
+
+
+class RunHistory:
+    """
+    This abstract class stores every finished run in a SQLite database, so best scores can be queried for every level
+    and game mode and personal bests of every player are kept. Runs are written to the database by a separate writer
+    thread, so recording a run never blocks the thread it was called from. Queries use their own connection and,
+    thanks to write-ahead logging, don't wait for writes.
+
+    # Attributes
+    ___________
+    path: str
+        path to SQLite database file
+    connection: sqlite3.Connection
+        connection used for queries, can be used only by the thread that created the class
+
+    # Methods
+    ___________
+    record_run(player: str, level: str, mode: str, coins: int, time_played: float, score: int, seeds: list)
+        adds finished run to the database in the writer thread
+    top_runs(level: str, mode: str, limit: int)
+        returns best runs, optionally of a single level or game mode
+    personal_best(player: str, level: str)
+        returns best run of a player, optionally on a single level
+    levels()
+        returns names of levels with recorded runs
+    last_seeds(player: str, mode: str)
+        returns seeds of generated levels of the last run of a player in a game mode
+    flush()
+        waits until all recorded runs are written to the database
+    close()
+        writes all recorded runs and closes the database
+    """
+    def __init__(self,
+                 path: str = None):
+        """
+        # Parameters
+        ____________
+        :param path: str, default = None
+            path to SQLite database file, resources/leaderboard/runs.sqlite3 if not given
+        """
+        self.path = path or f"{os.getcwd()}/../resources/leaderboard/runs.sqlite3"
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # databases created before seeds were recorded get the column first, so indexes of the schema can be created
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(runs)")]
+        if columns and "seeds" not in columns:
+            self.connection.execute("ALTER TABLE runs ADD COLUMN seeds TEXT")
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+        self._runs = queue.Queue()
+        self._writer = threading.Thread(target=self._write_runs, name="run-history-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _write_runs(self):
+        """
+        Writes runs from the queue to the database until None is received. Runs waiting in the queue together are
+        written in a single transaction.
+        """
+        connection = sqlite3.connect(self.path)
+        # with write-ahead logging database stays consistent without syncing to disk on every transaction
+        connection.execute("PRAGMA synchronous=NORMAL")
+        running = True
+        while running:
+            runs = [self._runs.get()]
+            while not self._runs.empty():
+                runs.append(self._runs.get())
+            running = None not in runs
+            with connection:
+                connection.executemany("INSERT INTO runs (player, level, mode, coins, time, score, timestamp, seeds) "
+                                       "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [run for run in runs if run is not None])
+            for _ in runs:
+                self._runs.task_done()
+        connection.close()
+
+    def record_run(self,
+                   player: str,
+                   level: str,
+                   mode: str,
+                   coins: int,
+                   time_played: float,
+                   score: int,
+                   seeds: list = None):
+        """
+        Adds finished run to the database. The run is written by the writer thread, so this method returns
+        immediately.
+
+        # Parameters
+        ____________
+        :param player: str
+            name of a player
+        :param level: str
+            name of the level, or seed of generated level
+        :param mode: str
+            game mode, e.g. "solo" or "adventure"
+        :param coins: int
+            number of coins collected during the run
+        :param time_played: float
+            duration of the run in seconds
+        :param score: int
+            score obtained by a player
+        :param seeds: list, default = None
+            seeds of generated levels played during the run, so the run can be played again
+        """
+        self._runs.put((player, level, mode, coins, time_played, score, time.time(),
+                        ",".join(str(seed) for seed in seeds) if seeds else None))
+
+    def top_runs(self,
+                 level: str = None,
+                 mode: str = None,
+                 limit: int = 9):
+        """
+        Returns best runs in descending order of score, runs with equal score are ordered from the oldest.
+
+        # Parameters
+        ____________
+        :param level: str, default = None
+            name of the level, runs of all levels are returned if not given
+        :param mode: str, default = None
+            game mode, runs of all modes are returned if not given
+        :param limit: int, default = 9
+            maximal number of returned runs
+        :return:
+            list of (player, score) tuples
+        """
+        conditions = [(column, value) for column, value in (("level", level), ("mode", mode)) if value is not None]
+        where = " AND ".join(f"{column} = ?" for column, _ in conditions)
+        return self.connection.execute("SELECT player, score FROM runs " + (f"WHERE {where} " if where else "") +
+                                       "ORDER BY score DESC, id LIMIT ?",
+                                       [value for _, value in conditions] + [limit]).fetchall()
+
+    def personal_best(self,
+                      player: str,
+                      level: str = None):
+        """
+        Returns best score of a player.
+
+        # Parameters
+        ____________
+        :param player: str
+            name of a player
+        :param level: str, default = None
+            name of the level, best score of all levels is returned if not given
+        :return:
+            best score of a player, None if player has no recorded runs
+        """
+        if level is None:
+            row = self.connection.execute("SELECT MAX(score) FROM runs WHERE player = ?", (player,)).fetchone()
+        else:
+            row = self.connection.execute("SELECT MAX(score) FROM runs WHERE player = ? AND level = ?",
+                                          (player, level)).fetchone()
+        return row[0]
+
+    def levels(self):
+        """
+        Returns names of levels with recorded runs, generated levels are recorded as "adventure" or "endless".
+
+        :return:
+            list of level names in alphabetical order
+        """
+        return [row[0] for row in self.connection.execute("SELECT DISTINCT level FROM runs ORDER BY level")]
+
+    def last_seeds(self,
+                   player: str,
+                   mode: str):
+        """
+        Returns seeds of generated levels of the last recorded run of a player in a game mode. Runs recorded before
+        are written to the database first.
+
+        # Parameters
+        ____________
+        :param player: str
+            name of a player
+        :param mode: str
+            game mode, e.g. "adventure" or "endless"
+        :return:
+            list of seeds, None if player has no recorded run with seeds in the game mode
+        """
+        self.flush()
+        row = self.connection.execute("SELECT seeds FROM runs WHERE player = ? AND mode = ? AND seeds IS NOT NULL "
+                                      "ORDER BY id DESC LIMIT 1", (player, mode)).fetchone()
+        return [int(seed) for seed in row[0].split(",")] if row else None
+
+    def flush(self):
+        """
+        Waits until all recorded runs are written to the database.
+        """
+        self._runs.join()
+
+    def close(self):
+        """
+        Writes all recorded runs to the database, stops the writer thread and closes the database.
+        """
+        if not self._writer.is_alive():
+            return
+        self._runs.put(None)
+        self._writer.join()
+        self.connection.close()
+        atexit.unregister(self.close)
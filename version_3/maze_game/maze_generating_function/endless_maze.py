@@ -0,0 +1,220 @@
+"""
+Endless maze, split into square chunks generated on demand from a seed, for the endless game mode.
+
+Every chunk is a maze carved by one of the maze_carving algorithms with a random generator seeded with the seed of the
+maze and coordinates of the chunk, so the same chunk is generated again whenever it is needed. Chunk owns the wall row
+above it and the wall column on its left, and opens a door in each of them. Doors lead to corridors of the neighbouring
+chunks, as every maze cell is a corridor, so together with every chunk being a perfect maze the whole world is
+connected. Coins and destructible blocks are placed only on corridors, and every destructible block can be dug through.
+
+Only recently used chunks are kept in memory. Blocks changed by the player, i.e. collected coins and dug blocks, are
+kept separately by chunk and applied again when a chunk is generated, so memory doesn't depend on how far the player
+walks.
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+from gameplay.modules import BLOCK_CODES, FLAG_LOOKUP, LevelMap
+from maze_generating_function.maze_carving import ALGORITHMS
+
+# number of maze cells on a side of a chunk, chunk has twice as many blocks on a side
+CHUNK_CELLS = 16
+CHUNK_SIZE = 2 * CHUNK_CELLS
+# number of special objects in every chunk
+CHUNK_COINS = 4
+CHUNK_DESTRUCTIBLE_BLOCKS = 6
+# maximal number of chunks kept in memory
+MAX_CHUNKS = 64
+# number of chunks on a side of the world, player starts in the middle of it
+WORLD_CHUNKS = 2 ** 16
+
+
+class ChunkGrid:
+    """
+    This abstract class is a view of cell type grid or flags grid of all chunks of an endless maze, indexed like
+    a grid of LevelMap class with [y, x]. Changes of cell types are remembered by the maze, so they are applied again
+    to generated chunks.
+
+    # Attributes
+    ___________
+    level: ChunkedLevel class
+        maze that the grid belongs to
+    layer: int
+        0 for cell type grid, 1 for flags grid
+    """
+    __slots__ = ("level", "layer")
+
+    def __init__(self,
+                 level,
+                 layer: int):
+        """
+        # Parameters
+        ____________
+        :param level: ChunkedLevel class
+            maze that the grid belongs to
+        :param layer: int
+            0 for cell type grid, 1 for flags grid
+        """
+        self.level = level
+        self.layer = layer
+
+    def __getitem__(self,
+                    position: tuple):
+        y, x = position
+        return self.level.chunk(x // CHUNK_SIZE, y // CHUNK_SIZE)[self.layer][y % CHUNK_SIZE, x % CHUNK_SIZE]
+
+    def __setitem__(self,
+                    position: tuple,
+                    value: int):
+        y, x = position
+        chunk_position = (x // CHUNK_SIZE, y // CHUNK_SIZE)
+        self.level.chunk(*chunk_position)[self.layer][y % CHUNK_SIZE, x % CHUNK_SIZE] = value
+        if self.layer == 0:
+            self.level.changes.setdefault(chunk_position, {})[(y % CHUNK_SIZE, x % CHUNK_SIZE)] = value
+
+
+class ChunkCoins:
+    """
+    This abstract class lets endless maze be used where coin coordinates of LevelMap class are used, coins are looked
+    up in cell type grid instead of being listed.
+    """
+    __slots__ = ("level",)
+
+    def __init__(self,
+                 level):
+        """
+        # Parameters
+        ____________
+        :param level: ChunkedLevel class
+            maze that the coins belong to
+        """
+        self.level = level
+
+    def __contains__(self,
+                     position: tuple):
+        x, y = position
+        return self.level.cells[y, x] == BLOCK_CODES["C"]
+
+    def remove(self,
+               position: tuple):
+        """
+        Coin is removed from cell type grid by the game state, so nothing has to be done here
+        """
+
+
+class ChunkedLevel(LevelMap):
+    """
+    This abstract class is an endless maze that can be played like a LevelMap class. Cell type grid and flags grid
+    are views of chunks generated on demand, and the maze has no exit, so the game lasts until time runs out.
+    Number of coins is decreased by game state with every collected coin, but as the maze has no exit it isn't used.
+
+    # Attributes
+    ___________
+    seed: int
+        seed of the maze, the same seed gives the same maze
+    algorithm: str
+        algorithm used to carve chunks
+    chunks: OrderedDict
+        (cell type grid, flags grid) tuples of chunks in memory by (x, y) chunk coordinates, from the least recently
+        used
+    changes: dict
+        dictionaries of cell types of changed blocks by (y, x) coordinates inside chunk, stored by chunk coordinates
+
+    # Methods
+    ___________
+    chunk(chunk_x: int, chunk_y: int)
+        returns grids of a chunk, generating it if it isn't in memory
+    generate_chunk(chunk_x: int, chunk_y: int)
+        generates grids of a chunk with changes made by the player
+    """
+    def __init__(self,
+                 seed: int = None,
+                 algorithm: str = "recursive_backtracker"):
+        """
+        # Parameters
+        ____________
+        :param seed: int, default = None
+            seed of the maze, random if not given
+        :param algorithm: str, default = "recursive_backtracker"
+            algorithm used to carve chunks, one of ALGORITHMS from maze_carving module
+        """
+        self.seed = int(np.random.SeedSequence().entropy % 2 ** 32) if seed is None else seed
+        self.algorithm = algorithm
+        self.chunks = OrderedDict()
+        self.changes = {}
+        start = WORLD_CHUNKS // 2 * CHUNK_SIZE + 1
+        LevelMap.__init__(self,
+                          x_size=WORLD_CHUNKS * CHUNK_SIZE,
+                          y_size=WORLD_CHUNKS * CHUNK_SIZE,
+                          player_starting_coordinate_x=start,
+                          player_starting_coordinate_y=start,
+                          cells=ChunkGrid(self, 0),
+                          flags=ChunkGrid(self, 1),
+                          coin_coordinates=ChunkCoins(self))
+
+    def chunk(self,
+              chunk_x: int,
+              chunk_y: int):
+        """
+        Returns grids of a chunk, generating it if it isn't in memory. The least recently used chunk is removed from
+        memory if there are more than MAX_CHUNKS of them.
+
+        # Parameters
+        ____________
+        :param chunk_x: int
+            x coordinate of the chunk
+        :param chunk_y: int
+            y coordinate of the chunk
+        :return:
+            tuple of cell type grid and flags grid of the chunk
+        """
+        position = (chunk_x, chunk_y)
+        chunk = self.chunks.get(position)
+        if chunk is None:
+            chunk = self.chunks[position] = self.generate_chunk(chunk_x, chunk_y)
+            if len(self.chunks) > MAX_CHUNKS:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(position)
+        return chunk
+
+    def generate_chunk(self,
+                       chunk_x: int,
+                       chunk_y: int):
+        """
+        Generates grids of a chunk from the seed of the maze and applies changes made by the player to it.
+
+        # Parameters
+        ____________
+        :param chunk_x: int
+            x coordinate of the chunk
+        :param chunk_y: int
+            y coordinate of the chunk
+        :return:
+            tuple of cell type grid and flags grid of the chunk
+        """
+        rng = np.random.default_rng([self.seed, chunk_x, chunk_y])
+        # bottom wall row and right wall column belong to the neighbouring chunks
+        walls = ALGORITHMS[self.algorithm](CHUNK_CELLS, CHUNK_CELLS, rng)[:-1, :-1]
+        cells = np.where(walls, BLOCK_CODES["#"], BLOCK_CODES[" "]).astype(np.uint8)
+
+        # doors to the chunk above and the chunk on the left lead to their maze cells, no doors lead out of the world
+        if chunk_y > 0:
+            cells[0, 2 * int(rng.integers(CHUNK_CELLS)) + 1] = BLOCK_CODES[" "]
+        if chunk_x > 0:
+            cells[2 * int(rng.integers(CHUNK_CELLS)) + 1, 0] = BLOCK_CODES[" "]
+
+        # objects are placed on corridors inside the chunk, except player starting position
+        free = cells == BLOCK_CODES[" "]
+        free[0, :] = False
+        free[:, 0] = False
+        if (chunk_x, chunk_y) == (WORLD_CHUNKS // 2, WORLD_CHUNKS // 2):
+            free[1, 1] = False
+        places = rng.choice(np.flatnonzero(free), size=CHUNK_COINS + CHUNK_DESTRUCTIBLE_BLOCKS, replace=False)
+        cells.flat[places[:CHUNK_COINS]] = BLOCK_CODES["C"]
+        cells.flat[places[CHUNK_COINS:]] = BLOCK_CODES["I"]
+
+        for position, code in self.changes.get((chunk_x, chunk_y), {}).items():
+            cells[position] = code
+        return cells, FLAG_LOOKUP[cells]
@@ -0,0 +1,169 @@
+import os
+import tempfile
+from collections import OrderedDict
+
+from gameplay.modules import LevelMap
+from maze_generating_function.level_queue import generate_maze
+
+# maximal size of level cache in bytes
+LEVEL_CACHE_BYTES = 16 * 2 ** 20
+
+
+class LevelCache:
+    """
+    This abstract class stores generated levels in a directory, under names built from seed and settings of
+    generate_maze function, so a level generated again with the same seed and settings is read from disk instead of
+    being generated. Files are kept in least recently used order, when total size of files exceeds the limit the least
+    recently used files are removed. Order of use is kept in modification times of files, so it survives restarts.
+    Every generated level is written to disk, up to LEVEL_CACHE_BYTES (16 MB) by default, so in game the cache is used
+    only if CACHE_GENERATED_LEVELS is set in GUI module, otherwise levels are saved only from level generator.
+
+    # Attributes
+    ___________
+    directory: str
+        directory where levels are stored
+    max_bytes: int
+        maximal total size of stored levels in bytes
+    entries: OrderedDict
+        sizes of stored level files by file name, from the least recently used
+    size: int
+        total size of stored levels in bytes
+
+    # Methods
+    ___________
+    file_name(seed: int, settings: dict)
+        returns name of file storing level with given seed and settings
+    get(file_name: str)
+        returns stored level or None if it isn't stored
+    put(file_name: str, maze, par_steps: int)
+        stores generated level
+    level(seed: int, **settings)
+        returns stored level, generating and storing it first if it isn't stored
+    """
+    def __init__(self,
+                 directory: str = None,
+                 max_bytes: int = LEVEL_CACHE_BYTES):
+        """
+        # Parameters
+        ____________
+        :param directory: str, default = None
+            directory where levels are stored, resources/levels/cache if not given
+        :param max_bytes: int, default = LEVEL_CACHE_BYTES
+            maximal total size of stored levels in bytes
+        """
+        self.directory = directory or f"{os.getcwd()}/../resources/levels/cache"
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+        files = [entry for entry in os.scandir(self.directory) if entry.is_file() and entry.name.endswith(".txt")]
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        self.entries = OrderedDict((entry.name, entry.stat().st_size) for entry in files)
+        self.size = sum(self.entries.values())
+
+    @staticmethod
+    def file_name(seed: int,
+                  settings: dict):
+        """
+        Returns name of file storing level generated with given seed and settings. Besides algorithm, size, numbers of
+        coins and destructible blocks and seed, name includes par bounds and number of attempts, as they also change
+        the generated level.
+
+        # Parameters
+        ____________
+        :param seed: int
+            seed of the level
+        :param settings: dict
+            keyword arguments of generate_maze function
+        :return:
+            name of level file
+        """
+        objects = settings["objects"]
+        max_par_steps = settings.get("max_par_steps")
+        return (f"{settings.get('algorithm', 'recursive_backtracker')}_{settings['level_width']}x"
+                f"{settings['level_height']}_{objects.get('coin', 0)}c_{objects.get('interactive_block', 0)}i_"
+                f"par{settings.get('min_par_steps', 0)}-{'' if max_par_steps is None else max_par_steps}_"
+                f"{settings.get('attempts', 1)}a_{seed}.txt")
+
+    def get(self,
+            file_name: str):
+        """
+        Returns stored level and marks it as the most recently used.
+
+        # Parameters
+        ____________
+        :param file_name: str
+            name of level file
+        :return:
+            tuple of LevelMap class of the level and its par, None if level isn't stored
+        """
+        if file_name not in self.entries:
+            return None
+        path = os.path.join(self.directory, file_name)
+        with open(path) as level_file:
+            header = level_file.readline().rstrip().split(",")
+            rows = level_file.read().splitlines()
+        level = LevelMap()
+        level.load_from_rows([row.ljust(int(header[0])) for row in rows])
+        os.utime(path)
+        self.entries.move_to_end(file_name)
+        return level, int(header[2]) if len(header) > 2 and header[2] else None
+
+    def put(self,
+            file_name: str,
+            maze,
+            par_steps: int):
+        """
+        Stores generated level, its par is added to the first line of level file after its size. Least recently used
+        levels are removed if the cache gets too big.
+
+        # Parameters
+        ____________
+        :param file_name: str
+            name of level file
+        :param maze: MazeGenerator class
+            generated maze
+        :param par_steps: int
+            par of the level, None if it is unknown
+        """
+        height, width = maze.level_map.shape
+        text = f"{width},{height},{'' if par_steps is None else par_steps}\n" + \
+            "".join("".join(row) + "\n" for row in maze.level_map)
+
+        # level is written to a temporary file first, so a level file is never left partially written
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(descriptor, "w") as temporary_file:
+            temporary_file.write(text)
+        os.replace(temporary_path, os.path.join(self.directory, file_name))
+
+        self.size = self.size - self.entries.pop(file_name, 0) + len(text)
+        self.entries[file_name] = len(text)
+        while self.size > self.max_bytes and len(self.entries) > 1:
+            evicted, evicted_size = self.entries.popitem(last=False)
+            os.remove(os.path.join(self.directory, evicted))
+            self.size = self.size - evicted_size
+
+    def level(self,
+              seed: int,
+              **settings):
+        """
+        Returns level generated with given seed and settings, read from the cache if it was stored before, otherwise
+        generated by generate_maze function and stored.
+
+        # Parameters
+        ____________
+        :param seed: int
+            seed of the level
+        :param settings:
+            keyword arguments of generate_maze function except seed
+        :return:
+            tuple of MazeGenerator class of the maze (None if level was read from the cache), LevelMap class of the
+            level and its par
+        """
+        file_name = self.file_name(seed, settings)
+        stored = self.get(file_name)
+        if stored is not None:
+            return (None, *stored)
+
+        maze, par_steps, _ = generate_maze(seed=seed, **settings)
+        self.put(file_name, maze, par_steps)
+        return maze, LevelMap.from_generator(maze), par_steps
@@ -0,0 +1,197 @@
+import itertools
+import queue
+import secrets
+import threading
+import warnings
+
+import numpy as np
+
+from gameplay import solver
+from gameplay.modules import LevelMap
+from maze_generating_function.maze_generating_function import MazeGenerator
+
+# number of levels kept ready by LevelQueue
+LEVEL_QUEUE_SIZE = 3
+
+
+def generate_maze(level_width: int,
+                  level_height: int,
+                  objects: dict,
+                  algorithm: str = "recursive_backtracker",
+                  min_par_steps: int = 0,
+                  max_par_steps: int = None,
+                  attempts: int = 1,
+                  seed=None):
+    """
+    Generates maze with special objects and par within given bounds. Numbers of objects are limited to the number of
+    places available in the maze, preferring objects given first. Mazes with par out of bounds are rejected, unless
+    there were already given number of them, then objects are added to the last one without checking par, and its par
+    is computed afterwards.
+
+    # Parameters
+    ____________
+    :param level_width: int
+        generated level width
+    :param level_height: int
+        generated level height
+    :param objects: dict
+        number of special blocks by object type, as in MazeGenerator.add_objects_batch
+    :param algorithm: str, default = "recursive_backtracker"
+        algorithm used to carve the maze
+    :param min_par_steps: int, default = 0
+        minimal par of the level
+    :param max_par_steps: int, default = None
+        maximal par of the level, par isn't limited if not given
+    :param attempts: int, default = 1
+        number of mazes generated before a maze with par out of bounds is accepted
+    :param seed: int, default = None
+        seed of random generator shared by all attempts, so the same seed gives the same maze, random if not given
+    :return:
+        tuple of MazeGenerator class, par of the level (out of bounds if no maze was within them, None only if the
+        level can't be finished) and dictionary of numbers of objects that were added
+    """
+    rng = np.random.default_rng(seed)
+    for _ in range(attempts):
+        maze = MazeGenerator(width=level_width,
+                             height=level_height,
+                             algorithm=algorithm,
+                             seed=rng)
+        places = maze.max_additional_objects
+        fitted = {}
+        for object_type, number_of_objects in objects.items():
+            fitted[object_type] = min(number_of_objects, places)
+            places = places - fitted[object_type]
+
+        par_steps = maze.add_objects_validated(fitted, min_par_steps=min_par_steps, max_par_steps=max_par_steps)
+        if par_steps is not None:
+            return maze, par_steps, fitted
+
+    maze.add_objects_batch(fitted)
+    return maze, solver.par_steps(LevelMap.from_generator(maze)), fitted
+
+
+class LevelQueue:
+    """
+    This abstract class keeps upcoming levels generated in a worker thread, so the next level is ready as soon as
+    the player goes through the exit. Generated levels wait in a queue of limited size, the worker generates a new
+    level whenever one is taken from the queue. Every level is generated from its own seed, given seeds are used first
+    and random ones afterwards, so a run can be played again from the seeds of its levels. If the worker fails, e.g.
+    because the cache can't be written, the error is passed to get method, which afterwards generates levels on the
+    calling thread without the cache, so the game never waits for a worker that no longer runs.
+
+    # Attributes
+    ___________
+    size: int
+        maximal number of levels waiting in the queue
+    settings: dict
+        keyword arguments of generate_maze used to generate every level
+    cache: LevelCache
+        cache from which levels generated before are read, None if levels are always generated
+    error: Exception
+        error that stopped the worker, None while the worker runs
+
+    # Methods
+    ___________
+    get()
+        returns the next generated level, waiting for it if none is ready
+    close()
+        stops the worker thread
+    """
+    def __init__(self,
+                 size: int = LEVEL_QUEUE_SIZE,
+                 seeds: list = None,
+                 cache=None,
+                 **settings):
+        """
+        # Parameters
+        ____________
+        :param size: int, default = LEVEL_QUEUE_SIZE
+            maximal number of levels waiting in the queue
+        :param seeds: list, default = None
+            seeds of the first levels, e.g. seeds of levels of a run played before, random seeds are used afterwards
+        :param cache: LevelCache, default = None
+            cache from which levels generated before are read and in which generated levels are stored
+        :param settings:
+            keyword arguments of generate_maze used to generate every level
+        """
+        self.size = size
+        self.settings = settings
+        self.cache = cache
+        self.error = None
+        self._failed_seed = None
+        self._seeds = itertools.chain(seeds or (), iter(lambda: secrets.randbits(32), None))
+        self._levels = queue.Queue(maxsize=size)
+        self._closed = threading.Event()
+        self._worker = threading.Thread(target=self._generate_levels, name="level-generator", daemon=True)
+        self._worker.start()
+
+    def _generate_level(self,
+                        seed: int,
+                        cache=None):
+        """
+        Generates level with given seed, reading it from given cache if it is stored there
+
+        :return:
+            tuple of MazeGenerator class of the maze (None if level was read from the cache), LevelMap class of the
+            level, its par and its seed
+        """
+        if cache is not None:
+            maze, level_map, par_steps = cache.level(seed, **self.settings)
+        else:
+            maze, par_steps, _ = generate_maze(seed=seed, **self.settings)
+            level_map = LevelMap.from_generator(maze)
+        return maze, level_map, par_steps, seed
+
+    def _put(self,
+             item):
+        """
+        Puts item in the queue, waiting for free place is interrupted from time to time to check if the queue is closed
+        """
+        while not self._closed.is_set():
+            try:
+                self._levels.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _generate_levels(self):
+        """
+        Generates levels and puts them in the queue until the queue is closed, error stopping the worker is put in the
+        queue after generated levels
+        """
+        seed = None
+        try:
+            while not self._closed.is_set():
+                seed = next(self._seeds)
+                self._put(self._generate_level(seed, self.cache))
+        except Exception as error:
+            self._failed_seed = seed
+            self._put(error)
+
+    def get(self):
+        """
+        Returns the next generated level, waiting for it if none is ready.
+
+        :return:
+            tuple of MazeGenerator class of the maze (None if level was read from the cache), LevelMap class of the
+            level, its par and its seed
+        """
+        if self.error is None:
+            level = self._levels.get()
+            if not isinstance(level, Exception):
+                return level
+            self.error = level
+            warnings.warn(f"Generating levels in background failed, levels are generated without cache: {level!r}")
+            # level that failed in the worker is generated again, so seeds of the run stay in order
+            if self._failed_seed is not None:
+                seed, self._failed_seed = self._failed_seed, None
+                return self._generate_level(seed)
+        return self._generate_level(next(self._seeds))
+
+    def close(self):
+        """
+        Stops the worker thread, level that is being generated is finished first.
+        """
+        self._closed.set()
+        if self._worker.is_alive():
+            self._worker.join()
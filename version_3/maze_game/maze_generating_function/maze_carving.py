@@ -0,0 +1,301 @@
+import numpy as np
+
+
+def _empty_grid(rows: int,
+                cols: int):
+    """
+    Creates grid of given number of maze cells filled only with walls, together with flat writable view of it.
+
+    # Parameters
+    ____________
+    :param rows: int
+        number of maze cells in a column
+    :param cols: int
+        number of maze cells in a row
+    :return:
+        tuple of uint8 ndarray of shape (2*rows+1, 2*cols+1) and flat memoryview of the same memory
+    """
+    grid = np.ones((2 * rows + 1, 2 * cols + 1), dtype=np.uint8)
+    return grid, memoryview(grid).cast("B")
+
+
+def _carve(cells,
+           cols: int,
+           cell: int,
+           neighbour: int = None):
+    """
+    Carves a maze cell, and the wall between it and its neighbouring cell if the neighbour is given.
+
+    # Parameters
+    ____________
+    :param cells: memoryview
+        flat view of the grid
+    :param cols: int
+        number of maze cells in a row
+    :param cell: int
+        index of maze cell, equal to row * cols + column
+    :param neighbour: int, default = None
+        index of neighbouring maze cell
+    """
+    width = 2 * cols + 1
+    position = (2 * (cell // cols) + 1) * width + 2 * (cell % cols) + 1
+    cells[position] = 0
+    if neighbour is not None:
+        neighbour_position = (2 * (neighbour // cols) + 1) * width + 2 * (neighbour % cols) + 1
+        cells[(position + neighbour_position) // 2] = 0
+
+
+def recursive_backtracker(rows: int,
+                          cols: int,
+                          rng):
+    """
+    Generates maze with depth first search that keeps visited cells on an explicit stack. Mazes have long corridors
+    with few dead ends.
+
+    # Parameters
+    ____________
+    :param rows: int
+        number of maze cells in a column
+    :param cols: int
+        number of maze cells in a row
+    :param rng: numpy.random.Generator
+        random generator used to carve the maze
+    :return:
+        uint8 ndarray of shape (2*rows+1, 2*cols+1) with 1 for walls and 0 for corridors
+    """
+    grid, cells = _empty_grid(rows, cols)
+    width = 2 * cols + 1
+    number_of_cells = rows * cols
+    visited = bytearray(number_of_cells)
+    # every cell is entered exactly once, so one random number per cell is enough
+    draws = rng.random(number_of_cells).tolist()
+
+    start = int(rng.integers(number_of_cells))
+    visited[start] = 1
+    _carve(cells, cols, start)
+    stack = [start]
+    drawn = 0
+    while stack:
+        cell = stack[-1]
+        row, col = divmod(cell, cols)
+        neighbours = []
+        if row > 0 and not visited[cell - cols]:
+            neighbours.append(cell - cols)
+        if row < rows - 1 and not visited[cell + cols]:
+            neighbours.append(cell + cols)
+        if col > 0 and not visited[cell - 1]:
+            neighbours.append(cell - 1)
+        if col < cols - 1 and not visited[cell + 1]:
+            neighbours.append(cell + 1)
+        if not neighbours:
+            stack.pop()
+            continue
+
+        neighbour = neighbours[int(draws[drawn] * len(neighbours))]
+        drawn += 1
+        visited[neighbour] = 1
+        position = (2 * row + 1) * width + 2 * col + 1
+        neighbour_position = (2 * (neighbour // cols) + 1) * width + 2 * (neighbour % cols) + 1
+        cells[neighbour_position] = 0
+        cells[(position + neighbour_position) // 2] = 0
+        stack.append(neighbour)
+
+    return grid
+
+
+def kruskal(rows: int,
+            cols: int,
+            rng):
+    """
+    Generates maze by removing walls between cells in random order, if the cells aren't connected yet. Connections
+    are tracked with union-find structure. Mazes have many short dead ends.
+
+    # Parameters
+    ____________
+    :param rows: int
+        number of maze cells in a column
+    :param cols: int
+        number of maze cells in a row
+    :param rng: numpy.random.Generator
+        random generator used to carve the maze
+    :return:
+        uint8 ndarray of shape (2*rows+1, 2*cols+1) with 1 for walls and 0 for corridors
+    """
+    grid, _ = _empty_grid(rows, cols)
+    grid[1::2, 1::2] = 0
+
+    # list of walls between horizontally and vertically neighbouring cells in random order
+    index = np.arange(rows * cols).reshape(rows, cols)
+    first = np.concatenate((index[:, :-1].ravel(), index[:-1, :].ravel()))
+    second = np.concatenate((index[:, 1:].ravel(), index[1:, :].ravel()))
+    order = rng.permutation(len(first))
+    first = first[order].tolist()
+    second = second[order].tolist()
+
+    parent = list(range(rows * cols))
+    removed = []
+    for a, b in zip(first, second):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a != b:
+            parent[a] = b
+            removed.append(True)
+        else:
+            removed.append(False)
+
+    # walls are removed at once, position of a wall is between positions of the cells it separates
+    removed = np.array(removed, dtype=bool)
+    first = np.array(first, dtype=np.int64)[removed]
+    second = np.array(second, dtype=np.int64)[removed]
+    grid[first // cols + second // cols + 1, first % cols + second % cols + 1] = 0
+    return grid
+
+
+def wilson(rows: int,
+           cols: int,
+           rng):
+    """
+    Generates maze with loop-erased random walks, which gives uniformly random spanning tree of the cells. Mazes are
+    unbiased, but walks take many steps on big mazes, so generation is slower than for other algorithms.
+
+    # Parameters
+    ____________
+    :param rows: int
+        number of maze cells in a column
+    :param cols: int
+        number of maze cells in a row
+    :param rng: numpy.random.Generator
+        random generator used to carve the maze
+    :return:
+        uint8 ndarray of shape (2*rows+1, 2*cols+1) with 1 for walls and 0 for corridors
+    """
+    grid, _ = _empty_grid(rows, cols)
+    number_of_cells = rows * cols
+
+    # flat table of neighbours in 4 directions of every cell, a step out of the maze stays in the same cell
+    index = np.arange(number_of_cells).reshape(rows, cols)
+    moves = np.repeat(index[:, :, None], 4, axis=2)
+    moves[1:, :, 0] = index[:-1]
+    moves[:-1, :, 1] = index[1:]
+    moves[:, 1:, 2] = index[:, :-1]
+    moves[:, :-1, 3] = index[:, 1:]
+    moves = moves.ravel().tolist()
+
+    in_maze = bytearray(number_of_cells)
+    next_cell = list(range(number_of_cells))
+    draws = []
+    drawn = 0
+
+    first = int(rng.integers(number_of_cells))
+    in_maze[first] = 1
+    for start in rng.permutation(number_of_cells).tolist():
+        if in_maze[start]:
+            continue
+
+        # random walk until the maze is hit, remembering only last exit from every cell erases loops
+        cell = start
+        while True:
+            if drawn == len(draws):
+                draws = rng.integers(4, size=1 << 16).tolist()
+                drawn = 0
+            neighbour = moves[4 * cell + draws[drawn]]
+            drawn += 1
+            next_cell[cell] = neighbour
+            if in_maze[neighbour]:
+                break
+            cell = neighbour
+
+        # adding loop-erased walk to the maze, walls are carved at once at the end
+        cell = start
+        while not in_maze[cell]:
+            in_maze[cell] = 1
+            cell = next_cell[cell]
+
+    # every cell except the first one is connected to its next cell, position of a wall is between positions of the
+    # cells it separates
+    grid[1::2, 1::2] = 0
+    first_cells = np.delete(np.arange(number_of_cells), first)
+    second_cells = np.array(next_cell, dtype=np.int64)[first_cells]
+    grid[first_cells // cols + second_cells // cols + 1, first_cells % cols + second_cells % cols + 1] = 0
+    return grid
+
+
+def eller(rows: int,
+          cols: int,
+          rng):
+    """
+    Generates maze one row at a time, keeping in memory only sets of connected cells of the current row. Every set
+    is connected at least once to the next row, and the last row joins all remaining sets.
+
+    # Parameters
+    ____________
+    :param rows: int
+        number of maze cells in a column
+    :param cols: int
+        number of maze cells in a row
+    :param rng: numpy.random.Generator
+        random generator used to carve the maze
+    :return:
+        uint8 ndarray of shape (2*rows+1, 2*cols+1) with 1 for walls and 0 for corridors
+    """
+    grid, _ = _empty_grid(rows, cols)
+    grid[1::2, 1::2] = 0
+
+    sets = list(range(cols))
+    next_set = cols
+    for row in range(rows):
+        y = 2 * row + 1
+        last_row = row == rows - 1
+        joins = rng.random(cols).tolist()
+
+        # joining neighbouring cells of different sets, always in the last row, merged sets point to their new set
+        merged = {}
+        for col in range(cols - 1):
+            first = sets[col]
+            while first in merged:
+                first = merged[first]
+            second = sets[col + 1]
+            while second in merged:
+                second = merged[second]
+            if first != second and (last_row or joins[col] < 0.5):
+                grid[y, 2 * col + 2] = 0
+                merged[second] = first
+        if last_row:
+            break
+        for col in range(cols):
+            while sets[col] in merged:
+                sets[col] = merged[sets[col]]
+
+        # connecting every set at least once with the next row
+        members = {}
+        for col, s in enumerate(sets):
+            members.setdefault(s, []).append(col)
+        down = rng.random(cols).tolist()
+        new_sets = [None] * cols
+        for s, columns in members.items():
+            chosen = [col for col in columns if down[col] < 0.5]
+            if not chosen:
+                chosen = [columns[int(down[columns[0]] * len(columns))]]
+            for col in chosen:
+                grid[y + 1, 2 * col + 1] = 0
+                new_sets[col] = s
+
+        # cells not connected from above start new sets
+        for col in range(cols):
+            if new_sets[col] is None:
+                new_sets[col] = next_set
+                next_set += 1
+        sets = new_sets
+
+    return grid
+
+
+# algorithms that can be used to generate maze, by name
+ALGORITHMS = {"recursive_backtracker": recursive_backtracker,
+              "kruskal": kruskal,
+              "wilson": wilson,
+              "eller": eller}
@@ -1,67 +1,103 @@
-from mazelib import Maze
-from mazelib.generate.HuntAndKill import HuntAndKill
-import random
+from maze_generating_function.maze_carving import ALGORITHMS
+import numpy as np
 import os
 
+# characters describing special objects that can be added to maze
+OBJECT_BLOCKS = {"interactive_block": "I",
+                 "coin": "C"}
+
 
 class MazeGenerator:
     """
-    This abstract class allows to generate simple random level with given size using mazelib package and
-    HuntAndKill algorithm. Generated level consists only of wall blocks, starting position and ending position.
-    Implemented class methods allow to add additional special objects like coins and destructible walls and save
-    generated model into text file.
+    This abstract class allows to generate simple random level with given size using one of the maze carving
+    algorithms from maze_carving module. Generated level consists only of wall blocks, starting position and ending
+    position. Implemented class methods allow to add additional special objects like coins and destructible walls and
+    save generated model into text file.
 
     # Attributes
     ___________
     height: int
-        Height of generated maze in number of blocks
+        Height of generated maze in number of maze cells, level height in blocks is equal to 2*height+1
     width: int
-        Width of generated maze in number of blocks
+        Width of generated maze in number of maze cells, level width in blocks is equal to 2*width+1
     occupied_coordinates: ndarray
         ndarray of rows of generated level with 1 if block is a wall, exit or entrance and 0 otherwise
     max_additional_objects: int
         maximal number of additional objects that can be added to maze
-    level_map: list
-        list of rows of generated levels described in format used by game module
+    level_map: ndarray
+        ndarray of rows of generated levels described with characters used by game module
+    rng: numpy.random.Generator
+        random generator used to generate maze
 
     # Methods
     ___________
+    generate_entrances()
+        chooses starting position and exit on the outer wall of the maze
     add_object(object_type: str,number_of_objects: int)
         adds special blocks to generated maze
+    add_objects_batch(objects: dict)
+        adds special blocks of several types to generated maze at once
+    add_objects_validated(objects: dict, min_par_steps: int, max_par_steps: int, attempts: int)
+        adds special blocks so that par of the level is within given bounds and returns the par
     save_to_file(level_name: str)
         saves generated maze as text file
     """
     def __init__(self,
                  height: int = 9,
-                 width: int = 9):
+                 width: int = 9,
+                 algorithm: str = "recursive_backtracker",
+                 seed=None):
         """
         # Parameters
         ____________
         :param height: int, default = 9
-            Height of generated maze in number of blocks. The minimal and default value equals to 9 as this is a
-            limitation given by mazelib package
+            Height of generated maze in number of blocks. Even values are rounded down to odd ones and the minimal
+            value equals to 3
         :param width: int, default = 9
-            Width of generated maze in number of blocks.The minimal and default value equals to 9 as this is a
-            limitation given by mazelib package
+            Width of generated maze in number of blocks. Even values are rounded down to odd ones and the minimal
+            value equals to 3
+        :param algorithm: {"recursive_backtracker", "kruskal", "wilson", "eller"}, str
+            Name of algorithm used to carve the maze, default = "recursive_backtracker"
+        :param seed: int or numpy.random.Generator, default = None
+            Seed of random generator, the same seed gives the same maze and the same placement of special objects.
+            Given generator is used directly, random seed is used if not given
         """
         height = int((height-1)/2)
         width = int((width-1)/2)
-        m = Maze()
-        m.generator = HuntAndKill(width, height)
-        m.generate()
-        m.generate_entrances(True, True)
+        self.rng = np.random.default_rng(seed)
+        grid = ALGORITHMS[algorithm](height, width, self.rng)
 
-        self.occupied_coordinates = m.grid
-        self.max_additional_objects = (2*height+1)*(2*width+1) - m.grid.sum()
+        self.occupied_coordinates = grid
+        self.max_additional_objects = int(np.count_nonzero(grid == 0))
         self.height = height
         self.width = width
 
         # translating map into format that can be read by game module
-        level_map = [list(row) for row in m.tostring().split("\n")]
-        level_map[m.start[0]][m.start[1]] = "P"
-        level_map[m.end[0]][m.end[1]] = "E"
+        level_map = np.array([" ", "#"])[grid]
+        start, end = self.generate_entrances()
+        level_map[start] = "P"
+        level_map[end] = "E"
         self.level_map = level_map
 
+    def generate_entrances(self):
+        """
+        This method chooses two different places on the outer wall of the maze, next to a corridor, that are used as
+        player starting position and exit.
+
+        :return:
+            tuple of starting position and exit position, both given as (y, x) tuple
+        """
+        entrances = []
+        while len(entrances) < 2:
+            side = int(self.rng.integers(4))
+            if side < 2:
+                position = (0 if side == 0 else 2 * self.height, 2 * int(self.rng.integers(self.width)) + 1)
+            else:
+                position = (2 * int(self.rng.integers(self.height)) + 1, 0 if side == 2 else 2 * self.width)
+            if position not in entrances:
+                entrances.append(position)
+        return entrances[0], entrances[1]
+
     def add_objects(self,
                     object_type: str,
                     number_of_objects: int):
@@ -76,36 +112,85 @@ class MazeGenerator:
         :param number_of_objects: int
             Number of special blocks that will be added to the maze.
         """
+        self.add_objects_batch({object_type: number_of_objects})
+
+    def add_objects_batch(self,
+                          objects: dict):
+        """
+        This method allows to add special objects of several types to initially generated maze at once. Places for
+        all objects are drawn together out of places which aren't wall blocks, starting position, ending position or
+        already added objects, so two objects never share a place.
 
-        possible_places = []
-        # find places which aren't wall blocks, starting position or ending position
+        # Parameters
+        :param objects: dict
+            Dictionary of number of special blocks that will be added to the maze by object type, where object type is
+            one of keys of OBJECT_BLOCKS e.g. {"interactive_block": 20, "coin": 9}
+        :return:
+            ndarray of flat indexes of places where objects were added
+        """
+        possible_places = np.flatnonzero(self.occupied_coordinates == 0)
+        drawn_places = self.rng.choice(possible_places, size=sum(objects.values()), replace=False)
+        self.occupied_coordinates.flat[drawn_places] = 1
 
-        for y, row in enumerate(self.occupied_coordinates):
-            for x, occupied in enumerate(row):
-                if occupied == 0:
-                    possible_places.append((x, y))
+        # consecutive parts of drawn places are assigned to consecutive object types
+        first = 0
+        for object_type, number_of_objects in objects.items():
+            self.level_map.flat[drawn_places[first:first + number_of_objects]] = OBJECT_BLOCKS[object_type]
+            first = first + number_of_objects
+        return drawn_places
+
+    def add_objects_validated(self,
+                              objects: dict,
+                              min_par_steps: int = 0,
+                              max_par_steps: int = None,
+                              attempts: int = 10):
+        """
+        This method adds special objects like add_objects_batch method and checks that level can be finished with
+        number of actions within given bounds. Par is the number of actions of the shortest route found by solver from
+        starting position through all coins to the exit, digging through destructible blocks if needed. If par is out
+        of bounds, objects are removed and drawn again, up to given number of attempts.
+
+        # Parameters
+        :param objects: dict
+            Dictionary of number of special blocks that will be added to the maze by object type, as in
+            add_objects_batch method
+        :param min_par_steps: int, default = 0
+            Minimal par of the level
+        :param max_par_steps: int, default = None
+            Maximal par of the level, par isn't limited if not given
+        :param attempts: int, default = 10
+            Number of times objects are drawn before the maze is rejected
+        :return:
+            par of the level, None if no attempt was within bounds, then objects aren't added and the maze should be
+            generated again
+        """
+        from gameplay.modules import LevelMap
+        from gameplay.solver import par_steps
 
-        # out of possible places choose random places to add special block
-        drawn_places = random.sample(possible_places, number_of_objects)
-        for cord in drawn_places:
-            self.occupied_coordinates[cord[1]][cord[0]] = 1
-            if object_type == "interactive_block":
-                self.level_map[cord[1]][cord[0]] = "I"
-            elif object_type == "coin":
-                self.level_map[cord[1]][cord[0]] = "C"
+        for _ in range(attempts):
+            drawn_places = self.add_objects_batch(objects)
+            par = par_steps(LevelMap.from_generator(self))
+            if par is not None and min_par_steps <= par and (max_par_steps is None or par <= max_par_steps):
+                return par
+            self.occupied_coordinates.flat[drawn_places] = 0
+            self.level_map.flat[drawn_places] = " "
+        return None
 
     def save_to_file(self,
-                     level_name: str):
+                     level_name: str,
+                     directory: str = None):
         """
         This method allows to save generated maze into a .txt file that can be read by a game module.
 
         # Parameters
         :param level_name: str
-            Name of the text file in which a maze will be saved. Maze is saved in /levels/ folder which is located in
-            the same directory as maze_generating_function.py file.
+            Name of the text file in which a maze will be saved.
+        :param directory: str, default = None
+            Directory in which a maze will be saved, resources/levels directory if not given.
         """
-        text_file = open(f"{os.getcwd()}/../resources/levels/{level_name}.txt", "w")
-        text_file.write(f"{self.height*2+1},{self.width*2+1}\n")
+        directory = directory or f"{os.getcwd()}/../resources/levels"
+        text_file = open(f"{directory}/{level_name}.txt", "w")
+        text_file.write(f"{self.width*2+1},{self.height*2+1}\n")
         for element in self.level_map:
             text_file.write("".join(element) + "\n")
         text_file.close()
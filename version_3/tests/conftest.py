@@ -0,0 +1,5 @@
+import os
+import sys
+
+# modules of the game are imported the way the game imports them, from maze_game directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "maze_game"))
@@ -0,0 +1,57 @@
+"""
+Checks that BatchGameState follows the same rules as GameState, by playing the same random actions with both on small
+levels of different sizes, small enough that random actions finish some of them.
+"""
+import copy
+
+import numpy as np
+
+from gameplay.batch_game_state import BatchGameState, EVENT_BITS
+from gameplay.game_state import GameState, ACTIONS
+from gameplay.modules import LevelMap, Player
+from maze_generating_function.maze_generating_function import MazeGenerator
+
+# (width, height, destructible blocks, coins) of played levels
+LEVELS = ((7, 7, 4, 2),
+          (9, 7, 6, 3),
+          (11, 9, 8, 4),
+          (17, 15, 20, 9))
+GAMES = 400
+STEPS = 2_000
+
+
+def test_batch_follows_game_state():
+    levels = []
+    for game in range(GAMES):
+        width, height, destructible_blocks, coins = LEVELS[game % len(LEVELS)]
+        maze = MazeGenerator(height=height, width=width, seed=game)
+        maze.add_objects_batch({"interactive_block": destructible_blocks, "coin": coins})
+        levels.append(LevelMap.from_generator(maze))
+    batch = BatchGameState(levels)
+    states = [GameState(copy.deepcopy(level), Player("bot", 0, 0)) for level in levels]
+
+    counts = dict.fromkeys(EVENT_BITS, 0)
+    actions = np.random.default_rng(0).integers(len(ACTIONS), size=(STEPS, GAMES))
+    for step, step_actions in enumerate(actions):
+        active = ~batch.finished
+        batch_events = batch.step(step_actions)
+        for game in np.flatnonzero(active).tolist():
+            state = states[game]
+            events = state.step(ACTIONS[step_actions[game]])
+            event_bits = 0
+            for event, _, _ in events:
+                event_bits |= EVENT_BITS[event]
+                counts[event] = counts[event] + 1
+            level = state.level
+            assert batch_events[game] == event_bits, f"events differ in game {game} at step {step}: {events}"
+            assert (batch.x[game], batch.y[game]) == (state.player.current_coordinate_x,
+                                                      state.player.current_coordinate_y), \
+                f"positions differ in game {game} at step {step}"
+            if events:
+                assert (batch.cells[game, :level.y_size, :level.x_size] == level.cells).all(), \
+                    f"cells differ in game {game} at step {step}"
+                assert (batch.flags[game, :level.y_size, :level.x_size] == level.flags).all(), \
+                    f"flags differ in game {game} at step {step}"
+    assert (batch.coins_collected == [state.player.coins_collected for state in states]).all()
+    # every event happened, so every rule was compared
+    assert all(counts.values()), f"some events never happened: {counts}"
@@ -0,0 +1,115 @@
+"""
+Checks routes of the solver against breadth first search over positions and sets of collected coins on tiny levels,
+some with loops made by removing walls, and orders of coins found exactly and heuristically against all orders for
+random distances.
+"""
+from collections import deque
+from itertools import permutations
+
+import numpy as np
+import pytest
+
+from gameplay.modules import ACCESSIBLE, BLOCK_CODES, BLOCK_FLAGS, LevelMap
+from gameplay.solver import plan_route, _exact_order, _heuristic_order, _route_length
+from maze_generating_function.maze_generating_function import MazeGenerator
+
+# (width, height, destructible blocks) of levels whose routes are checked, with every number of coins up to COINS,
+# destructible blocks in a corridor of a maze usually cut off the exit, so only one size has them
+LEVELS = ((7, 7, 0),
+          (9, 7, 0),
+          (11, 9, 0),
+          (9, 9, 2))
+COINS = 7
+SEEDS = 20
+# number of walls removed from levels with odd seeds, so that their mazes have loops
+REMOVED_WALLS = 6
+# numbers of coins of random distances on which orders of coins are checked
+ORDER_COINS = (2, 4, 6, 8)
+
+
+def brute_force_moves(level):
+    """
+    Returns the smallest number of moves collecting all coins and going to the exit without digging, found with
+    breadth first search over positions and sets of collected coins, None if level can't be finished
+    """
+    coins = {coin: 1 << index for index, coin in enumerate(sorted(level.coin_coordinates))}
+    all_coins = (1 << len(coins)) - 1
+    start = (level.player_starting_coordinate_x, level.player_starting_coordinate_y, 0)
+    moves = {start: 0}
+    states = deque([start])
+    while states:
+        x, y, collected = states.popleft()
+        for next_x, next_y in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if not (0 <= next_x < level.x_size and 0 <= next_y < level.y_size):
+                continue
+            # exit is closed until every coin is collected
+            if (next_x, next_y) == level.exit_coordinate:
+                if collected == all_coins:
+                    return moves[x, y, collected] + 1
+                continue
+            if not level.flags[next_y, next_x] & ACCESSIBLE:
+                continue
+            state = (next_x, next_y, collected | coins.get((next_x, next_y), 0))
+            if state not in moves:
+                moves[state] = moves[x, y, collected] + 1
+                states.append(state)
+    return None
+
+
+def remove_walls(level, rng):
+    """
+    Removes REMOVED_WALLS walls between two empty blocks inside the level, making loops in its maze
+    """
+    cells = level.cells
+    inner = cells[1:-1, 1:-1]
+    empty = cells == BLOCK_CODES[" "]
+    between = (inner == BLOCK_CODES["#"]) & ((empty[1:-1, :-2] & empty[1:-1, 2:]) |
+                                             (empty[:-2, 1:-1] & empty[2:, 1:-1]))
+    walls = np.argwhere(between) + 1
+    for y, x in walls[rng.permutation(len(walls))[:REMOVED_WALLS]].tolist():
+        cells[y, x] = BLOCK_CODES[" "]
+        level.flags[y, x] = BLOCK_FLAGS[" "]
+
+
+@pytest.mark.parametrize("width, height, destructible_blocks", LEVELS)
+@pytest.mark.parametrize("coins", range(COINS + 1))
+def test_route_equals_brute_force(width, height, destructible_blocks, coins):
+    for seed in range(SEEDS):
+        maze = MazeGenerator(height=height, width=width, seed=seed)
+        maze.add_objects_batch({"interactive_block": destructible_blocks, "coin": coins})
+        level = LevelMap.from_generator(maze)
+        if seed % 2:
+            remove_walls(level, np.random.default_rng(seed))
+        route = plan_route(level)
+        expected = brute_force_moves(level)
+        assert (route and route[1]) == expected, f"route with seed {seed}: {route}, expected {expected}"
+
+
+@pytest.mark.parametrize("coins", ORDER_COINS)
+def test_orders_of_coins(coins):
+    rng = np.random.default_rng(coins)
+    for _ in range(SEEDS):
+        # start, coins and exit at random points, distances are symmetric like in a maze
+        points = rng.integers(20, size=(coins + 2, 2))
+        table = np.abs(points[:, None] - points[None]).sum(axis=2).tolist()
+        distances = [row[1:] for row in table[:-1]]
+        best = min(_route_length(distances, order) for order in permutations(range(coins)))
+        for order, length in (_exact_order(distances), _heuristic_order(distances)):
+            assert sorted(order) == list(range(coins)) and length == _route_length(distances, order), \
+                f"order {order} of length {length} is invalid for {points.tolist()}"
+        assert _exact_order(distances)[1] == best, f"exact order isn't the best for {points.tolist()}"
+        # heuristic order can't be shortened by reversing any part of it
+        order, length = _heuristic_order(distances)
+        assert all(_route_length(distances, order[:i] + order[i:j + 1][::-1] + order[j + 1:]) >= length
+                   for i in range(coins) for j in range(i + 1, coins)), \
+            f"heuristic order {order} can be shortened for {points.tolist()}"
+
+
+def test_route_does_not_go_through_closed_exit():
+    # going through the exit to the coin takes 9 moves, the route has to go around the exit instead
+    level = LevelMap.from_grid(["#########",
+                                "#P  E  C#",
+                                "# ##### #",
+                                "#       #",
+                                "#########"])
+    assert plan_route(level) == ([(7, 1)], 13) == ([(7, 1)], brute_force_moves(level))